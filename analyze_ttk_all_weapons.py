@@ -1,218 +1,113 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
-import os
-
-# Read data
-falloff_df = pd.read_csv('data/Battlefield 6 Damage Fall Off - V2.csv', skiprows=1)
-weapon_df = pd.read_csv('data/BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - All Guns by Weapon Type.csv')
-ammo_df = pd.read_csv('analysis_results/Weapon_Ammo_Types.csv')
-
-# Clean up falloff data
-falloff_df = falloff_df.rename(columns={
-    'Gun (!!! -> Missing)': 'Gun',
-    'Dmg': 'DMG_Close',
-    '10m': 'DMG_10M',
-    '75m': 'DMG_75M',
-    'ROF': 'ROF'
-})
+from render_cache import cached_render
+from ttk_engine import RANGES, MAX_HS, TARGET_HP, falloff_columns, falloff_table, table_lookup, calculate_stk_ttk_cube
+from weapon_registry import AMMO_LABELS, ttk_weapons
 
-# Name mapping for consistency
-name_mapping = {
-    'TR7': 'TR-7',
-    'M/60': 'M60',
-    'M240L': 'M240L',
-    'QBZ': 'QBZ-192',
-    'AK205': 'AK-205'
-}
-falloff_df['Gun'] = falloff_df['Gun'].replace(name_mapping)
+DEFAULT_TARGET_HPS = [100, 80]
+# Each render worker peaks at ~350 MB (a 300 dpi 20x16in canvas plus matplotlib), so the default stays small
+MAX_DEFAULT_WORKERS = 4
 
-# Merge dataframes - Use 'Type' from falloff_df which is already there
-df = falloff_df[['Gun', 'Type', 'DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF']].copy()
-df = df.merge(ammo_df[['Gun', 'Ammo Type']], on='Gun', how='left')
 
-# Filter out weapons without complete data
-df = df.dropna(subset=['DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF', 'Ammo Type', 'Type'])
+def hp_style(target_hp):
+    """Output folder and figure styling for one target HP (100 HP keeps the original look)"""
+    if target_hp == TARGET_HP:
+        return {'output_dir': 'visualizations/TTK_ANALYSIS', 'tag': '',
+                'imp_titles': ('{gun} - TTK Improvement: HP vs Base',
+                               '{gun} - TTK Improvement: Synthetic vs Base'),
+                'imp_label': 'TTK Reduction (ms)', 'hp_only_figsize': (20, 16),
+                'savefig': {'dpi': 300}}
+    tag = f' [{target_hp} HP]'
+    return {'output_dir': f'visualizations/TTK_ANALYSIS_{target_hp}HP', 'tag': tag,
+            'imp_titles': ('Hollow Point vs Base - TTK Improvement' + tag,
+                           'Synthetic vs Base - TTK Improvement' + tag),
+            'imp_label': 'TTK Improvement (ms)', 'hp_only_figsize': (16, 16),
+            'savefig': {'dpi': 150, 'facecolor': 'white'}}
 
-# Extrapolate damage to more ranges
-def extrapolate_damage(dmg_close, dmg_10m, dmg_75m, target_range):
-    """Linear interpolation/extrapolation"""
-    if target_range <= 0:
-        return dmg_close
-    elif target_range <= 10:
-        return np.interp(target_range, [0, 10], [dmg_close, dmg_10m])
-    elif target_range <= 75:
-        return np.interp(target_range, [10, 75], [dmg_10m, dmg_75m])
-    else:  # Extrapolate beyond 75m
-        slope = (dmg_75m - dmg_10m) / (75 - 10)
-        dmg_100m = dmg_75m + slope * (100 - 75)
-        dmg_100m = max(dmg_100m, 10)  # Floor at 10 damage
-        return np.interp(target_range, [75, 100], [dmg_75m, dmg_100m])
 
-# Constants
-BASE_HS_MULT = 1.34
-HP_MULT = 1.5
-SYNTH_MULT = 1.75
-TARGET_HP = 100
-RANGES = [0, 10, 20, 30, 40, 50, 60, 75, 100]
-MAX_HS = 5
+def build_jobs(target_hps=DEFAULT_TARGET_HPS):
+    """Compute TTK data once and return one render job per (target HP, weapon)
 
-def calculate_stk_ttk(base_dmg, rof, hs_mult, num_hs, target_hp=100):
-    """Calculate STK and TTK for given parameters"""
-    if base_dmg <= 0 or rof <= 0:
-        return np.inf, np.inf
+    The STK/TTK cube is computed for every target HP in a single call, and
+    each weapon's color scales are shared across all of them so the HP
+    variants can be compared side by side.
+    """
+    # Falloff data merged with ammo types (complete, unflagged weapons only)
+    df = ttk_weapons()
     
-    # Find minimum shots needed
-    best_stk = np.inf
-    best_ttk = np.inf
+    # Compute TTK for every weapon at every target HP in one call (HP axis follows target_hps)
+    damage_table = falloff_table(*falloff_columns(df))
+    damage = table_lookup(damage_table, RANGES)
+    stk_cube, ttk_cube = calculate_stk_ttk_cube(damage, df['ROF'].astype(float).values,
+                                                target_hps=target_hps)
     
-    # Try different numbers of body shots
-    for body_shots in range(20):  # Max 20 body shots to consider
-        total_shots = num_hs + body_shots
-        total_damage = (base_dmg * hs_mult * num_hs) + (base_dmg * body_shots)
+    jobs = {hp: [] for hp in target_hps}
+    for w, (gun_name, weapon_class, ammo_type) in enumerate(zip(df['Gun'], df['Type'], df['Ammo Type'])):
+        print(f"Processing: {gun_name} ({weapon_class})")
         
-        if total_damage >= target_hp:
-            stk = total_shots
-            ttk = (stk - 1) * (60 / rof) * 1000  # in ms
-            if stk < best_stk:
-                best_stk = stk
-                best_ttk = ttk
-            break
-    
-    return int(best_stk) if best_stk != np.inf else np.inf, best_ttk
-
-# Create output directories
-os.makedirs('visualizations/TTK_ANALYSIS', exist_ok=True)
-# Get all unique weapon classes and create folders
-unique_classes = df['Type'].unique()
-for weapon_class in unique_classes:
-    os.makedirs(f'visualizations/TTK_ANALYSIS/{weapon_class}', exist_ok=True)
-
-print(f"\n{'='*80}")
-print(f"GENERATING TTK ANALYSIS FOR ALL WEAPONS (100 HP with shared 80 HP color scale)")
-print(f"{'='*80}\n")
-
-# Process each weapon
-for idx, weapon_row in df.iterrows():
-    gun_name = weapon_row['Gun']
-    weapon_class = weapon_row['Type']
-    dmg_close = float(weapon_row['DMG_Close'])
-    dmg_10m = float(weapon_row['DMG_10M'])
-    dmg_75m = float(weapon_row['DMG_75M'])
-    rof = float(weapon_row['ROF'])
-    ammo_type = weapon_row['Ammo Type']
-    
-    print(f"Processing: {gun_name} ({weapon_class})")
-    
-    # Calculate TTK for BOTH 100HP and 80HP to find shared color scale
-    all_ttk_values = []
-    
-    for target_hp in [100, 80]:
-        for r in RANGES:
-            current_dmg = extrapolate_damage(dmg_close, dmg_10m, dmg_75m, r)
-            
-            for num_hs in range(MAX_HS + 1):
-                # Base ammo
-                _, base_ttk = calculate_stk_ttk(current_dmg, rof, BASE_HS_MULT, num_hs, target_hp)
-                if base_ttk != np.inf:
-                    all_ttk_values.append(base_ttk)
-                
-                # HP ammo
-                _, hp_ttk = calculate_stk_ttk(current_dmg, rof, HP_MULT, num_hs, target_hp)
-                if hp_ttk != np.inf:
-                    all_ttk_values.append(hp_ttk)
-                
-                # Synthetic ammo (if available)
-                if ammo_type == 'Synthetic':
-                    _, synth_ttk = calculate_stk_ttk(current_dmg, rof, SYNTH_MULT, num_hs, target_hp)
-                    if synth_ttk != np.inf:
-                        all_ttk_values.append(synth_ttk)
-    
-    # Calculate shared color scale for TTK
-    global_ttk_min = min(all_ttk_values)
-    global_ttk_max = max(all_ttk_values)
-    
-    # Calculate improvements for BOTH 100HP and 80HP to find shared improvement scale
-    all_improvements = []
-    
-    for target_hp in [100, 80]:
-        # Store TTK values for this HP level
-        base_ttks = {}
-        hp_ttks = {}
-        synth_ttks = {}
+        # Synthetic only counts for weapons that have access to it
+        num_ammo = 3 if ammo_type == 'Synthetic' else 2
+        weapon_ttk = ttk_cube[w, :, :, :num_ammo, :]
         
-        for r in RANGES:
-            current_dmg = extrapolate_damage(dmg_close, dmg_10m, dmg_75m, r)
-            
-            for num_hs in range(MAX_HS + 1):
-                _, base_ttk = calculate_stk_ttk(current_dmg, rof, BASE_HS_MULT, num_hs, target_hp)
-                _, hp_ttk = calculate_stk_ttk(current_dmg, rof, HP_MULT, num_hs, target_hp)
-                
-                base_ttks[(r, num_hs)] = base_ttk
-                hp_ttks[(r, num_hs)] = hp_ttk
-                
-                # Calculate HP improvement
-                if base_ttk != np.inf and hp_ttk != np.inf:
-                    improvement = base_ttk - hp_ttk
-                    all_improvements.append(improvement)
-                
-                # Synthetic if available
-                if ammo_type == 'Synthetic':
-                    _, synth_ttk = calculate_stk_ttk(current_dmg, rof, SYNTH_MULT, num_hs, target_hp)
-                    synth_ttks[(r, num_hs)] = synth_ttk
-                    
-                    if base_ttk != np.inf and synth_ttk != np.inf:
-                        improvement = base_ttk - synth_ttk
-                        all_improvements.append(improvement)
-    
-    # Calculate shared improvement scale (symmetric around 0 for proper centering)
-    if all_improvements:
-        max_abs_improvement = max(abs(min(all_improvements)), abs(max(all_improvements)))
-        global_imp_min = -max_abs_improvement
-        global_imp_max = max_abs_improvement
-    else:
-        global_imp_min = -100
-        global_imp_max = 100
-    
-    # Now calculate 100HP results for plotting
-    results = []
-    for r in RANGES:
-        current_dmg = extrapolate_damage(dmg_close, dmg_10m, dmg_75m, r)
+        # Calculate shared color scale for TTK (all target HPs)
+        finite_ttk = weapon_ttk[np.isfinite(weapon_ttk)]
         
-        for num_hs in range(MAX_HS + 1):
-            # Base ammo
-            base_stk, base_ttk = calculate_stk_ttk(current_dmg, rof, BASE_HS_MULT, num_hs)
-            results.append({
-                'Range': r,
-                'Headshots': num_hs,
-                'Ammo': 'Base',
-                'STK': base_stk,
-                'TTK_ms': base_ttk
-            })
-            
-            # HP ammo
-            hp_stk, hp_ttk = calculate_stk_ttk(current_dmg, rof, HP_MULT, num_hs)
-            results.append({
-                'Range': r,
-                'Headshots': num_hs,
-                'Ammo': 'HP',
-                'STK': hp_stk,
-                'TTK_ms': hp_ttk
+        # Calculate improvements for all target HPs to find shared improvement scale
+        base_ttk = weapon_ttk[:, :, :1, :]
+        special_ttk = weapon_ttk[:, :, 1:, :]
+        with np.errstate(invalid='ignore'):
+            improvements = base_ttk - special_ttk
+        all_improvements = improvements[np.isfinite(base_ttk) & np.isfinite(special_ttk)]
+        
+        # Calculate shared improvement scale (symmetric around 0 for proper centering)
+        if all_improvements.size:
+            max_abs_improvement = np.abs(all_improvements).max()
+        else:
+            max_abs_improvement = 100
+        
+        for h, target_hp in enumerate(target_hps):
+            style = hp_style(target_hp)
+            jobs[target_hp].append({
+                'gun_name': gun_name,
+                'weapon_class': weapon_class,
+                'ammo_type': ammo_type,
+                'stk': stk_cube[w, :, :, :num_ammo, h],
+                'ttk': ttk_cube[w, :, :, :num_ammo, h],
+                'ttk_scale': (finite_ttk.min(), finite_ttk.max()),
+                'imp_scale': (-max_abs_improvement, max_abs_improvement),
+                'style': style,
+                'output_path': f"{style['output_dir']}/{weapon_class}/{gun_name}.png",
             })
-            
-            # Synthetic ammo (if available)
-            if ammo_type == 'Synthetic':
-                synth_stk, synth_ttk = calculate_stk_ttk(current_dmg, rof, SYNTH_MULT, num_hs)
-                results.append({
-                    'Range': r,
-                    'Headshots': num_hs,
-                    'Ammo': 'Synth',
-                    'STK': synth_stk,
-                    'TTK_ms': synth_ttk
-                })
+    # Grouped by target HP, in the order requested
+    return [job for hp in target_hps for job in jobs[hp]]
+
+
+def render_weapon(job):
+    """Render one weapon's TTK heatmap grid to job['output_path'] (safe to run in a worker)"""
+    gun_name = job['gun_name']
+    ammo_type = job['ammo_type']
+    style = job['style']
+    tag = style['tag']
+    imp_title_hp, imp_title_synth = (t.format(gun=gun_name) for t in style['imp_titles'])
+    global_ttk_min, global_ttk_max = job['ttk_scale']
+    global_imp_min, global_imp_max = job['imp_scale']
     
-    df_results = pd.DataFrame(results)
+    range_grid, hs_grid = np.meshgrid(RANGES, range(MAX_HS + 1), indexing='ij')
+    df_results = pd.concat([
+        pd.DataFrame({
+            'Range': range_grid.ravel(),
+            'Headshots': hs_grid.ravel(),
+            'Ammo': AMMO_LABELS[a],
+            'STK': job['stk'][:, :, a].ravel(),
+            'TTK_ms': job['ttk'][:, :, a].ravel()
+        })
+        for a in range(job['ttk'].shape[-1])
+    ], ignore_index=True)
     
     # Create visualizations
     if ammo_type == 'Synthetic':
@@ -227,7 +122,7 @@ for idx, weapon_row in df.iterrows():
         pivot_synth = df_results[df_results['Ammo'] == 'Synth'].pivot(index='Headshots', columns='Range', values='TTK_ms')
         pivot_synth = pivot_synth.iloc[::-1]
         
-        # USE GLOBAL COLOR SCALE (shared with 80HP version)
+        # USE GLOBAL COLOR SCALE (shared across target HPs)
         ttk_min = global_ttk_min
         ttk_max = global_ttk_max
         
@@ -237,7 +132,7 @@ for idx, weapon_row in df.iterrows():
         sns.heatmap(pivot_base, annot=True, fmt='.0f', cmap='RdYlGn_r', ax=ax1, 
                     vmin=ttk_min, vmax=ttk_max,
                     cbar_kws={'label': 'TTK (ms)'})
-        ax1.set_title(f'{gun_name} - TTK with Base Ammo (1.34x HS)', fontsize=14, fontweight='bold')
+        ax1.set_title(f'{gun_name} - TTK with Base Ammo (1.34x HS){tag}', fontsize=14, fontweight='bold')
         ax1.set_xlabel('Range (m)', fontsize=12)
         ax1.set_ylabel('Number of Headshots', fontsize=12)
         
@@ -246,7 +141,7 @@ for idx, weapon_row in df.iterrows():
         sns.heatmap(pivot_hp, annot=True, fmt='.0f', cmap='RdYlGn_r', ax=ax2, 
                     vmin=ttk_min, vmax=ttk_max,
                     cbar_kws={'label': 'TTK (ms)'})
-        ax2.set_title(f'{gun_name} - TTK with Hollow Point (1.5x HS)', fontsize=14, fontweight='bold')
+        ax2.set_title(f'{gun_name} - TTK with Hollow Point (1.5x HS){tag}', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Range (m)', fontsize=12)
         ax2.set_ylabel('Number of Headshots', fontsize=12)
         
@@ -255,7 +150,7 @@ for idx, weapon_row in df.iterrows():
         sns.heatmap(pivot_synth, annot=True, fmt='.0f', cmap='RdYlGn_r', ax=ax3, 
                     vmin=ttk_min, vmax=ttk_max,
                     cbar_kws={'label': 'TTK (ms)'})
-        ax3.set_title(f'{gun_name} - TTK with Synthetic (1.75x HS)', fontsize=14, fontweight='bold')
+        ax3.set_title(f'{gun_name} - TTK with Synthetic (1.75x HS){tag}', fontsize=14, fontweight='bold')
         ax3.set_xlabel('Range (m)', fontsize=12)
         ax3.set_ylabel('Number of Headshots', fontsize=12)
         
@@ -269,14 +164,14 @@ for idx, weapon_row in df.iterrows():
         ttk_improvement_synth = pivot_base.iloc[::-1] - pivot_synth.iloc[::-1]
         ttk_improvement_synth = ttk_improvement_synth.iloc[::-1]
         
-        # USE GLOBAL IMPROVEMENT SCALE (shared with 80HP, symmetric around 0)
+        # USE GLOBAL IMPROVEMENT SCALE (shared across target HPs, symmetric around 0)
         
         # 5. HP improvement
         ax5 = axes[1, 1]
         sns.heatmap(ttk_improvement_hp, annot=True, fmt='.0f', cmap='RdYlGn', center=0, ax=ax5, 
                     vmin=global_imp_min, vmax=global_imp_max,
-                    cbar_kws={'label': 'TTK Reduction (ms)'})
-        ax5.set_title(f'{gun_name} - TTK Improvement: HP vs Base', fontsize=14, fontweight='bold')
+                    cbar_kws={'label': style['imp_label']})
+        ax5.set_title(imp_title_hp, fontsize=14, fontweight='bold')
         ax5.set_xlabel('Range (m)', fontsize=12)
         ax5.set_ylabel('Number of Headshots', fontsize=12)
         
@@ -284,14 +179,14 @@ for idx, weapon_row in df.iterrows():
         ax6 = axes[1, 2]
         sns.heatmap(ttk_improvement_synth, annot=True, fmt='.0f', cmap='RdYlGn', center=0, ax=ax6, 
                     vmin=global_imp_min, vmax=global_imp_max,
-                    cbar_kws={'label': 'TTK Reduction (ms)'})
-        ax6.set_title(f'{gun_name} - TTK Improvement: Synthetic vs Base', fontsize=14, fontweight='bold')
+                    cbar_kws={'label': style['imp_label']})
+        ax6.set_title(imp_title_synth, fontsize=14, fontweight='bold')
         ax6.set_xlabel('Range (m)', fontsize=12)
         ax6.set_ylabel('Number of Headshots', fontsize=12)
         
     else:
         # 2x2 grid for weapons with only HP
-        fig, axes = plt.subplots(2, 2, figsize=(20, 16))
+        fig, axes = plt.subplots(2, 2, figsize=style['hp_only_figsize'])
         
         # Prepare TTK pivots
         pivot_base = df_results[df_results['Ammo'] == 'Base'].pivot(index='Headshots', columns='Range', values='TTK_ms')
@@ -299,7 +194,7 @@ for idx, weapon_row in df.iterrows():
         pivot_hp = df_results[df_results['Ammo'] == 'HP'].pivot(index='Headshots', columns='Range', values='TTK_ms')
         pivot_hp = pivot_hp.iloc[::-1]
         
-        # USE GLOBAL COLOR SCALE (shared with 80HP version)
+        # USE GLOBAL COLOR SCALE (shared across target HPs)
         ttk_min = global_ttk_min
         ttk_max = global_ttk_max
         
@@ -308,7 +203,7 @@ for idx, weapon_row in df.iterrows():
         sns.heatmap(pivot_base, annot=True, fmt='.0f', cmap='RdYlGn_r', ax=ax1, 
                     vmin=ttk_min, vmax=ttk_max,
                     cbar_kws={'label': 'TTK (ms)'})
-        ax1.set_title(f'{gun_name} - TTK with Base Ammo (1.34x HS)', fontsize=14, fontweight='bold')
+        ax1.set_title(f'{gun_name} - TTK with Base Ammo (1.34x HS){tag}', fontsize=14, fontweight='bold')
         ax1.set_xlabel('Range (m)', fontsize=12)
         ax1.set_ylabel('Number of Headshots', fontsize=12)
         
@@ -317,7 +212,7 @@ for idx, weapon_row in df.iterrows():
         sns.heatmap(pivot_hp, annot=True, fmt='.0f', cmap='RdYlGn_r', ax=ax2, 
                     vmin=ttk_min, vmax=ttk_max,
                     cbar_kws={'label': 'TTK (ms)'})
-        ax2.set_title(f'{gun_name} - TTK with Hollow Point (1.5x HS)', fontsize=14, fontweight='bold')
+        ax2.set_title(f'{gun_name} - TTK with Hollow Point (1.5x HS){tag}', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Range (m)', fontsize=12)
         ax2.set_ylabel('Number of Headshots', fontsize=12)
         
@@ -330,21 +225,66 @@ for idx, weapon_row in df.iterrows():
         ttk_improvement = ttk_improvement.iloc[::-1]
         sns.heatmap(ttk_improvement, annot=True, fmt='.0f', cmap='RdYlGn', center=0, ax=ax4, 
                     vmin=global_imp_min, vmax=global_imp_max,
-                    cbar_kws={'label': 'TTK Reduction (ms)'})
-        ax4.set_title(f'{gun_name} - TTK Improvement: HP vs Base', fontsize=14, fontweight='bold')
+                    cbar_kws={'label': style['imp_label']})
+        ax4.set_title(imp_title_hp, fontsize=14, fontweight='bold')
         ax4.set_xlabel('Range (m)', fontsize=12)
         ax4.set_ylabel('Number of Headshots', fontsize=12)
     
     plt.tight_layout()
     
     # Save to appropriate class folder
-    output_path = f'visualizations/TTK_ANALYSIS/{weapon_class}/{gun_name}.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    output_path = job['output_path']
+    plt.savefig(output_path, bbox_inches='tight', **style['savefig'])
     plt.close()
     
-    print(f"  Saved: {output_path} (color scale: {ttk_min:.0f}-{ttk_max:.0f}ms)")
+    return output_path, ttk_min, ttk_max
+
+
+def render_job(job, use_cache=True):
+    """Render one job unless the render cache holds the same figure; returns log info"""
+    rendered = cached_render(render_weapon, job['output_path'], job, use_cache=use_cache)
+    ttk_min, ttk_max = job['ttk_scale']
+    return job['output_path'], ttk_min, ttk_max, rendered
 
-print(f"\n{'='*80}")
-print(f"COMPLETED: All TTK analyses saved to visualizations/TTK_ANALYSIS/")
-print(f"{'='*80}\n")
 
+def render_all(jobs, workers, use_cache=True):
+    """Render every job, fanning out to a process pool when workers > 1
+
+    Results come back in job order, so the log and output paths are the
+    same whatever the worker count.
+    """
+    if workers <= 1:
+        return [render_job(job, use_cache) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render_job, jobs, [use_cache] * len(jobs)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Render per-weapon TTK heatmaps for one or more target HPs')
+    parser.add_argument('--hp', type=int, nargs='+', default=DEFAULT_TARGET_HPS,
+                        help='Target HP values to render (default: 100 80; color scales are shared across them)')
+    parser.add_argument('--workers', type=int, default=min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS),
+                        help=f'Render processes, ~350 MB each (1 = render in this process; '
+                             f'default: CPU count, at most {MAX_DEFAULT_WORKERS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-render every figure instead of reusing unchanged ones from .cache/renders/')
+    args = parser.parse_args()
+    
+    print(f"\n{'='*80}")
+    print(f"GENERATING TTK ANALYSIS FOR ALL WEAPONS ({' / '.join(f'{hp} HP' for hp in args.hp)} with shared color scale)")
+    print(f"{'='*80}\n")
+    
+    jobs = build_jobs(args.hp)
+    
+    # Create output directories (one folder per target HP and weapon class)
+    for output_dir in sorted({os.path.dirname(job['output_path']) for job in jobs}):
+        os.makedirs(output_dir, exist_ok=True)
+    
+    print(f"\nRendering {len(jobs)} figures with {max(args.workers, 1)} worker(s)")
+    for output_path, ttk_min, ttk_max, rendered in render_all(jobs, args.workers, not args.no_cache):
+        status = 'Saved' if rendered else 'Unchanged'
+        print(f"  {status}: {output_path} (color scale: {ttk_min:.0f}-{ttk_max:.0f}ms)")
+    
+    print(f"\n{'='*80}")
+    print(f"COMPLETED: All TTK analyses saved to {', '.join(hp_style(hp)['output_dir'] + '/' for hp in args.hp)}")
+    print(f"{'='*80}\n")
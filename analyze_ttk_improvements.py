@@ -2,20 +2,13 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
+from ttk_engine import extrapolate_damage
+from weapon_data import AMMO_TYPES_PATH, load_falloff, load_weapon_types
 
 # Read data
-falloff_df = pd.read_csv('data/Battlefield 6 Damage Fall Off - V2.csv', skiprows=1)
-weapon_df = pd.read_csv('data/BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - All Guns by Weapon Type.csv')
-ammo_df = pd.read_csv('analysis_results/Weapon_Ammo_Types.csv')
-
-# Clean up falloff data
-falloff_df = falloff_df.rename(columns={
-    'Gun (!!! -> Missing)': 'Gun',
-    'Dmg': 'DMG_Close',
-    '10m': 'DMG_10M',
-    '75m': 'DMG_75M',
-    'ROF': 'ROF'
-})
+falloff_df = load_falloff()
+weapon_df = load_weapon_types()
+ammo_df = pd.read_csv(AMMO_TYPES_PATH)
 
 # Focus on DRS-IAR
 gun_name = 'DRS-IAR'
@@ -43,34 +36,11 @@ print(f"  Rate of Fire: {rof} RPM")
 print(f"  Ammo Type: {ammo_type}")
 print(f"  Time between shots: {60/rof*1000:.1f}ms\n")
 
-# Extrapolate damage to more ranges
-def extrapolate_damage(dmg_10m, dmg_75m, target_range):
-    """Linear extrapolation"""
-    if target_range <= 10:
-        return dmg_10m
-    damage_loss_per_meter = (dmg_10m - dmg_75m) / (75 - 10)
-    return max(dmg_75m - (damage_loss_per_meter * (target_range - 75)), 10)
-
 # Define ranges to analyze
 ranges = [0, 10, 20, 30, 40, 50, 60, 75, 100]
 
-# Get damage at each range
-damage_at_range = {}
-for r in ranges:
-    if r == 0:
-        damage_at_range[r] = dmg_close
-    elif r == 10:
-        damage_at_range[r] = dmg_10m
-    elif r == 75:
-        damage_at_range[r] = dmg_75m
-    elif r < 10:
-        damage_at_range[r] = dmg_close
-    elif r < 75:
-        # Interpolate between 10m and 75m
-        frac = (r - 10) / (75 - 10)
-        damage_at_range[r] = dmg_10m - (frac * (dmg_10m - dmg_75m))
-    else:
-        damage_at_range[r] = extrapolate_damage(dmg_10m, dmg_75m, r)
+# Get damage at each range (the engine's falloff model, evaluated over the whole grid)
+damage_at_range = dict(zip(ranges, extrapolate_damage(dmg_close, dmg_10m, dmg_75m, ranges)[0]))
 
 # Multipliers
 BASE_MULT = 1.34
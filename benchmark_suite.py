@@ -0,0 +1,325 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from ttk_engine import (RANGES, calculate_stk_ttk_cube, extrapolate_damage, falloff_breakpoints, falloff_columns,
+                        falloff_table, shot_combos, solve_kill_ranges, table_lookup, travel_time_ms)
+from synthetic_weapons import generate_weapons
+from weapon_data import load_falloff
+from weapon_registry import SUMMARY_ROWS, is_flagged, ttk_weapons
+
+BASELINE_PATH = 'data/benchmark_baseline.json'
+SCALES = [1000, 10000, 100000]  # Synthetic weapon counts (synthetic_weapons.py) timed after the real sheet
+REGRESSION_THRESHOLD = 0.25  # Flag cases more than 25% slower than the baseline
+NOISE_FLOOR_MS = 0.05  # Differences below this are timer noise, never flagged
+REPEATS = 5
+SEED = 0
+GROUPS = ['core', 'load', 'render', 'scripts']
+DEFAULT_GROUPS = ['core', 'load', 'render']  # 'scripts' runs every pipeline stage, so it is opt-in
+
+
+# Core math, timed on the real weapons and every synthetic scale up to max_scale
+# (the dense 0.1 m grid and kill-range tables grow too large to time at 100k).
+# Each setup does the untimed preparation and returns the call to time.
+
+def setup_extrapolate(df):
+    close, d10, d75 = falloff_columns(df)
+    return lambda: extrapolate_damage(close, d10, d75, RANGES)
+
+
+def setup_falloff_table(df):
+    close, d10, d75 = falloff_columns(df)
+    return lambda: falloff_table(close, d10, d75)
+
+
+def _cube_inputs(df):
+    damage = table_lookup(falloff_table(*falloff_columns(df), max_range=100), RANGES)
+    return damage, df['ROF'].astype(float).values
+
+
+def setup_cube(df):
+    damage, rof = _cube_inputs(df)
+    return lambda: calculate_stk_ttk_cube(damage, rof)
+
+
+def setup_cube_80hp(df):
+    damage, rof = _cube_inputs(df)
+    return lambda: calculate_stk_ttk_cube(damage, rof, target_hps=[100, 80])
+
+
+def setup_cube_travel(df):
+    damage, rof = _cube_inputs(df)
+    velocity = df['Velocity'].astype(float).values
+    return lambda: calculate_stk_ttk_cube(damage, rof, travel_ms=travel_time_ms(RANGES, velocity))
+
+
+def setup_cube_dense(df):
+    damage = falloff_table(*falloff_columns(df))
+    rof = df['ROF'].astype(float).values
+    return lambda: calculate_stk_ttk_cube(damage, rof, target_hps=[100, 80])
+
+
+def setup_kill_ranges(max_range):
+    def setup(df):
+        close, d10, d75 = falloff_columns(df)
+        num_hs, num_body = shot_combos(10)
+        return lambda: solve_kill_ranges(*falloff_breakpoints(close, d10, d75, max_range=max_range), num_hs, num_body)
+    return setup
+
+
+CORE_CASES = [
+    {'name': 'extrapolate_damage', 'setup': setup_extrapolate, 'max_scale': 100000},
+    {'name': 'falloff_table', 'setup': setup_falloff_table, 'max_scale': 10000},
+    {'name': 'ttk_cube', 'setup': setup_cube, 'max_scale': 100000},
+    {'name': 'ttk_cube_80hp', 'setup': setup_cube_80hp, 'max_scale': 100000},
+    {'name': 'ttk_cube_travel', 'setup': setup_cube_travel, 'max_scale': 100000},
+    {'name': 'ttk_cube_dense', 'setup': setup_cube_dense, 'max_scale': 1000},
+    {'name': 'kill_ranges_75m', 'setup': setup_kill_ranges(75), 'max_scale': 10000},
+    {'name': 'kill_ranges_100m', 'setup': setup_kill_ranges(100), 'max_scale': 10000},
+]
+
+
+# Data load and figure rendering, timed once on the real data
+
+def setup_parse_csvs():
+    from weapon_data import load_tables
+    return lambda: load_tables(use_cache=False)
+
+
+def setup_read_snapshot():
+    import weapon_data
+    weapon_data.load_tables()  # Make sure the snapshot exists
+    snapshot_dir = os.path.join(weapon_data.CACHE_DIR, weapon_data.source_hash())
+    return lambda: weapon_data._read_snapshot(snapshot_dir)
+
+
+def setup_ttk_weapons():
+    return ttk_weapons
+
+
+def setup_heatmap_render(out_dir):
+    import matplotlib
+    matplotlib.use('Agg')
+    from analyze_ttk_all_weapons import build_jobs, render_weapon
+    with contextlib.redirect_stdout(io.StringIO()):
+        job = dict(build_jobs([100])[0])
+    job['output_path'] = os.path.join(out_dir, 'heatmap.png')
+    return lambda: render_weapon(job)
+
+
+def setup_circles_render(out_dir):
+    import matplotlib
+    matplotlib.use('Agg')
+    from visualize_shot_combos import combo_title, draw_range_circles
+    df = ttk_weapons().reset_index(drop=True)
+    num_hs, num_body = shot_combos(5)
+    kill_ranges = solve_kill_ranges(*falloff_breakpoints(*falloff_columns(df), max_range=100), num_hs, num_body)
+    c = next(i for i, (h, b) in enumerate(zip(num_hs, num_body)) if (h, b) == (1, 3))
+    base_range, hp_range, synth_range = kill_ranges[:, c, 0], kill_ranges[:, c, 1], kill_ranges[:, c, 2]
+    df_results = pd.DataFrame({
+        'Gun': df['Gun'], 'Type': df['Type'], 'Ammo Type': df['Ammo Type'],
+        'Base Range (1.34x)': base_range, 'HP Range (1.5x)': hp_range, 'Synthetic Range (1.75x)': synth_range,
+        'HP Extension': hp_range - base_range, 'Synth Extension': synth_range - base_range,
+    })
+    output_path = os.path.join(out_dir, 'circles.png')
+    return lambda: draw_range_circles(df_results, 4, 1, combo_title(4, 1), 100, output_path)
+
+
+LOAD_CASES = [
+    {'name': 'parse_csvs', 'setup': setup_parse_csvs},
+    {'name': 'read_snapshot', 'setup': setup_read_snapshot},
+    {'name': 'ttk_weapons', 'setup': setup_ttk_weapons},
+]
+
+RENDER_CASES = [
+    {'name': 'render_ttk_heatmap', 'setup': setup_heatmap_render},
+    {'name': 'render_range_circles', 'setup': setup_circles_render},
+]
+
+
+def measure(func, repeats=REPEATS):
+    """Best time (ms) of `repeats` samples, each looping func enough to last ~0.2 s
+
+    The minimum is the least noisy estimate of the cost itself; slow
+    calls (more than 0.2 s) are timed one call per sample.
+    """
+    func()  # Warm up
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    samples = [elapsed] + timer.repeat(repeat=repeats - 1, number=number)
+    return min(samples) / number * 1000
+
+
+def time_scripts():
+    """Wall time (ms) of every pipeline stage run as its own process, in pipeline order
+
+    Figure stages reuse the render cache, so this measures the warm-cache
+    cost; clear .cache/renders/ first to time a full render.
+    """
+    from run_pipeline import STAGES, stage_order
+    env = dict(os.environ)
+    env.setdefault('MPLBACKEND', 'Agg')
+    results = {}
+    for stage in stage_order(STAGES):
+        key = f"script:{stage['name']}"
+        start = time.perf_counter()
+        returncode = subprocess.run([sys.executable, stage['script']], env=env, stdout=subprocess.DEVNULL).returncode
+        if returncode != 0:
+            raise SystemExit(f"Stage '{stage['name']}' failed with exit code {returncode}")
+        results[key] = (time.perf_counter() - start) * 1000
+        print(f"  {key:40} {results[key]:12.2f} ms")
+    return results
+
+
+def check_travel_times():
+    """Largest gap (ms) between travel_time_ms and the falloff sheet's 'TTK + MVel' columns at 10m/75m"""
+    df = load_falloff().dropna(subset=['DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF', 'Velocity'])
+    df = df[~is_flagged(df['Gun']) & ~df['Gun'].isin(SUMMARY_ROWS)]
+    velocity = df['Velocity'].astype(float).values
+    gaps = []
+    for r, ttk_column, mvel_column in [(10, 'TTK 10m (ms)', 'TTK + MVel 10m'), (75, 'TTK 75m (ms)', 'TTK + MVel 75m')]:
+        sheet_flight = df[mvel_column].astype(float).values - df[ttk_column].astype(float).values
+        gaps.append(np.nanmax(np.abs(sheet_flight - travel_time_ms([r], velocity)[:, 0])))
+    return max(gaps)
+
+
+def run_suite(groups, scales, repeats=REPEATS, only=None):
+    """Time every selected case; returns {case key: ms}, e.g. 'ttk_cube[10000]'"""
+    selected = lambda key: not only or any(pattern in key for pattern in only)
+    results = {}
+
+    def record(key, setup):
+        if not selected(key):
+            return
+        results[key] = measure(setup(), repeats)
+        print(f"  {key:40} {results[key]:12.2f} ms")
+
+    if 'core' in groups:
+        real = ttk_weapons().reset_index(drop=True)
+        for case in CORE_CASES:
+            record(f"{case['name']}[real]", lambda: case['setup'](real))
+            for scale in scales:
+                if scale <= case['max_scale']:
+                    record(f"{case['name']}[{scale}]", lambda: case['setup'](generate_weapons(scale, seed=SEED)))
+    if 'load' in groups:
+        for case in LOAD_CASES:
+            record(case['name'], case['setup'])
+    if 'render' in groups:
+        with tempfile.TemporaryDirectory() as out_dir:
+            for case in RENDER_CASES:
+                record(case['name'], lambda: case['setup'](out_dir))
+    if 'scripts' in groups:
+        results.update({key: ms for key, ms in time_scripts().items() if selected(key)})
+    return results
+
+
+def environment():
+    """What the timings depend on besides the code: compared against the baseline's"""
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Rows of (key, baseline ms, current ms, ratio, status) for the cases in both runs"""
+    rows = []
+    for key, ms in results.items():
+        if key not in baseline:
+            rows.append((key, None, ms, None, 'new'))
+            continue
+        ratio = ms / baseline[key]
+        if ratio > 1 + threshold and ms - baseline[key] > NOISE_FLOOR_MS:
+            status = 'REGRESSION'
+        elif ratio < 1 / (1 + threshold) and baseline[key] - ms > NOISE_FLOOR_MS:
+            status = 'faster'
+        else:
+            status = 'ok'
+        rows.append((key, baseline[key], ms, ratio, status))
+    return rows
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    """Merge results into the stored baseline (cases not run keep their old numbers)"""
+    old_results = (load_baseline(path) or {'results': {}})['results']
+    old_results.update({key: round(ms, 4) for key, ms in results.items()})
+    baseline = {'environment': environment(), 'results': old_results}
+    with open(path + '.tmp', 'w') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+    os.replace(path + '.tmp', path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time the TTK/kill-range math, data load and rendering against stored baselines')
+    parser.add_argument('--group', nargs='+', choices=GROUPS, default=DEFAULT_GROUPS,
+                        help=f"Case groups to run (default: {' '.join(DEFAULT_GROUPS)})")
+    parser.add_argument('--scales', type=int, nargs='*', default=SCALES,
+                        help=f"Synthetic weapon counts for the core math (default: {' '.join(map(str, SCALES))})")
+    parser.add_argument('--only', nargs='+', help='Run only cases whose key contains one of these strings')
+    parser.add_argument('--repeats', type=int, default=REPEATS, help='Timing samples per case (best one counts)')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='Slowdown ratio over the baseline that counts as a regression (default: 0.25 = 25%%)')
+    parser.add_argument('--save-baseline', action='store_true', help=f'Store these timings in {BASELINE_PATH}')
+    args = parser.parse_args()
+
+    print(f"\n{'='*80}")
+    scales_text = f" (real weapons + {', '.join(map(str, args.scales)) or 'no'} synthetic)" if 'core' in args.group else ''
+    print(f"BENCHMARK SUITE: {', '.join(args.group)}{scales_text}")
+    print(f"{'='*80}\n")
+    results = run_suite(args.group, args.scales, args.repeats, args.only)
+    if 'core' in args.group:
+        # Sheet flight times are whole ms, so up to ~1 ms is rounding
+        print(f"\nFlight time vs falloff sheet 'TTK + MVel' columns: max difference {check_travel_times():.1f} ms")
+
+    if args.save_baseline:
+        save_baseline(results)
+        print(f"\nSaved: {BASELINE_PATH} ({len(results)} case(s))")
+        sys.exit(0)
+
+    baseline = load_baseline()
+    if baseline is None:
+        print(f"\nNo baseline at {BASELINE_PATH}; run with --save-baseline to store one")
+        sys.exit(0)
+    if baseline['environment'] != environment():
+        print(f"\nNote: baseline recorded on {baseline['environment']}; compare with care")
+
+    rows = compare(results, baseline['results'], args.threshold)
+    print(f"\n{'Case':40} {'Baseline':>12} {'Current':>12} {'Ratio':>7}  Status")
+    for key, base_ms, ms, ratio, status in rows:
+        base_text = f'{base_ms:.2f}' if base_ms is not None else '-'
+        ratio_text = f'{ratio:.2f}x' if ratio is not None else '-'
+        print(f"{key:40} {base_text:>12} {f'{ms:.2f}':>12} {ratio_text:>7}  {status}")
+
+    regressions = [row[0] for row in rows if row[4] == 'REGRESSION']
+    if 'read_snapshot' in results and 'parse_csvs' in results:
+        # The snapshot only exists to be faster than parsing the CSVs
+        print(f"\nSnapshot read vs CSV parse: {results['read_snapshot']:.2f} ms vs {results['parse_csvs']:.2f} ms")
+        if results['read_snapshot'] >= results['parse_csvs']:
+            regressions.append('read_snapshot (not faster than parse_csvs)')
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
@@ -0,0 +1,98 @@
+import argparse
+import difflib
+import os
+import runpy
+import sys
+
+# Subcommands that run an existing script as-is, with the remaining arguments passed through.
+# Plotting libraries are only imported by the scripts that render, so the
+# number-only commands never pay for matplotlib/seaborn.
+SCRIPT_COMMANDS = {
+    'extract': ('extract_ammo_types.py', 'Ammo type per gun from the Stat Card sheet -> Weapon_Ammo_Types.csv', False),
+    'categorize': ('categorize_stk_with_one_headshot.py', 'Shots to kill with one headshot at 10/20/35m', False),
+    'verify': ('verify_ammo_types.py', 'Cross-check ammo types against the Stat Card sheet', False),
+    'tierlist': ('create_ttk_tierlist.py', 'HP/Synth tierlists and map-profile rankings', False),
+    'circles': ('visualize_shot_combos.py', 'Range circle grids per shot combination (e.g. circles 4:2)', True),
+    'falloff': ('visualize_damage_falloff.py', 'Damage falloff charts by weapon type and damage group', True),
+}
+
+
+def run_script(script, script_args, renders):
+    """Run a repo script as __main__ with its own arguments"""
+    if renders:
+        os.environ.setdefault('MPLBACKEND', 'Agg')  # Figures are only saved, never shown
+    script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), script)
+    sys.argv = [script_path] + script_args
+    runpy.run_path(script_path, run_name='__main__')
+
+
+def ttk_table(gun, range_m, target_hp, travel=False):
+    """STK and TTK of one gun at range_m for every headshot count and usable ammo type"""
+    import numpy as np
+    from ttk_engine import MAX_HS, calculate_stk_ttk_cube, extrapolate_damage, travel_time_ms
+    from weapon_registry import AMMO_LABELS, ttk_weapons, weapon_ids
+
+    df = ttk_weapons().reset_index(drop=True)
+    matches = np.flatnonzero(weapon_ids(df['Gun']) == weapon_ids([gun])[0])
+    if not len(matches):
+        suggestions = difflib.get_close_matches(gun.upper(), [name.upper() for name in df['Gun']], n=3, cutoff=0.4)
+        hint = f" (did you mean {', '.join(suggestions)}?)" if suggestions else ''
+        raise SystemExit(f"Unknown weapon '{gun}'{hint}")
+    row = df.iloc[matches[0]]
+
+    damage = extrapolate_damage([row['DMG_Close']], [row['DMG_10M']], [row['DMG_75M']], [range_m])
+    travel_ms = travel_time_ms([range_m], [row['Velocity']]) if travel else None
+    stk, ttk = calculate_stk_ttk_cube(damage, [row['ROF']], target_hps=[target_hp], travel_ms=travel_ms)
+    num_ammo = 3 if row['Ammo Type'] == 'Synthetic' else 2
+    return row, float(damage[0, 0]), AMMO_LABELS[:num_ammo], stk[0, 0, :, :num_ammo, 0], ttk[0, 0, :, :num_ammo, 0], MAX_HS
+
+
+def ttk_command(args):
+    import numpy as np
+
+    row, damage, ammo_labels, stk, ttk, max_hs = ttk_table(args.gun, args.range, args.hp, args.travel)
+    print(f"{row['Gun']} ({row['Type']}, {row['Ammo Type']}) at {args.range:g}m vs {args.hp} HP: "
+          f"{damage:.1f} body damage, {row['ROF']:.0f} RPM{', incl. bullet flight time' if args.travel else ''}")
+    headshots = range(max_hs + 1) if args.headshots is None else [args.headshots]
+    print(f"\n{'Headshots':>9}" + ''.join(f"{label:>16}" for label in ammo_labels))
+    for h in headshots:
+        cells = [f"{stk[h, a]:.0f} / {ttk[h, a]:.0f}ms" if np.isfinite(ttk[h, a]) else '-'
+                 for a in range(len(ammo_labels))]
+        print(f"{h:>9}" + ''.join(f"{cell:>16}" for cell in cells))
+    print("\n(shots to kill / time to kill)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='BF6 ammo type analysis: one entry point for the analysis scripts')
+    commands = parser.add_subparsers(dest='command', required=True, metavar='COMMAND')
+
+    ttk_parser = commands.add_parser('ttk', help='STK/TTK of one gun at a range, per headshot count and ammo type')
+    ttk_parser.add_argument('gun', help="Gun name, any spelling the sheets use (e.g. M4A1, 'sor-556 mk2')")
+    ttk_parser.add_argument('--range', type=float, default=0, help='Distance in m (default: 0)')
+    ttk_parser.add_argument('--hp', type=int, default=100, help='Target HP (default: 100)')
+    ttk_parser.add_argument('--headshots', type=int, help='Only this many headshots (0 to ttk_engine.MAX_HS)')
+    ttk_parser.add_argument('--travel', action='store_true', help='Add bullet flight time (TTK from the first trigger pull)')
+
+    for name, (script, help_text, _) in SCRIPT_COMMANDS.items():
+        # No -h here: `bf6.py circles --help` shows the script's own options
+        commands.add_parser(name, help=f'{help_text} ({script})', add_help=False)
+
+    # Everything after a script command is left over and passed through to the script
+    args, script_args = parser.parse_known_args(argv)
+    if args.command == 'ttk':
+        if script_args:
+            parser.error(f"unrecognized arguments: {' '.join(script_args)}")
+        if args.range < 0:
+            parser.error('--range must be >= 0')
+        if args.headshots is not None:
+            from ttk_engine import MAX_HS
+            if not 0 <= args.headshots <= MAX_HS:
+                parser.error(f'--headshots must be within 0..{MAX_HS}')
+        ttk_command(args)
+    else:
+        script, _, renders = SCRIPT_COMMANDS[args.command]
+        run_script(script, script_args, renders)
+
+
+if __name__ == '__main__':
+    main()
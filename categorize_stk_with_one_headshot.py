@@ -1,65 +1,31 @@
 import pandas as pd
-import numpy as np
-
-# Read data
-df = pd.read_csv('data/BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - All Guns by Weapon Type.csv')
-
-# Parse damage values at different ranges
-df['DMG_10M'] = pd.to_numeric(df['DMG at 10M'], errors='coerce')
-df['DMG_20M'] = pd.to_numeric(df['DMG at 20M'], errors='coerce')
-df['DMG_35M'] = pd.to_numeric(df['DMG at 35M'], errors='coerce')
-df['Base_DMG'] = pd.to_numeric(df['DMG'], errors='coerce')
-
-BASE_HS_MULT = 1.34
-
-def calculate_stk_with_one_hs(body_damage):
-    """Calculate shots to kill with 1 headshot + body shots"""
-    if pd.isna(body_damage) or body_damage <= 0:
-        return None
-    
-    hs_damage = body_damage * BASE_HS_MULT
-    remaining_damage = 100 - hs_damage
-    
-    if remaining_damage <= 0:
-        return 1  # 1 headshot kills
-    
-    body_shots_needed = np.ceil(remaining_damage / body_damage)
-    total_shots = 1 + body_shots_needed
-    
-    return int(total_shots)
-
-# Calculate STK at each range
-results = []
-
-for idx, row in df.iterrows():
-    gun = row['Gun']
-    weapon_type = row['Type']
-    base_dmg = row['Base_DMG']
-    
-    # Calculate STK at each range
-    stk_10m = calculate_stk_with_one_hs(row['DMG_10M'])
-    stk_20m = calculate_stk_with_one_hs(row['DMG_20M'])
-    stk_35m = calculate_stk_with_one_hs(row['DMG_35M'])
-    
-    results.append({
-        'Gun': gun,
-        'Type': weapon_type,
-        'Base Damage': base_dmg,
-        'STK at 10M': stk_10m,
-        'STK at 20M': stk_20m,
-        'STK at 35M': stk_35m,
-        'Damage at 10M': row['DMG_10M'],
-        'Damage at 20M': row['DMG_20M'],
-        'Damage at 35M': row['DMG_35M']
-    })
-
-df_results = pd.DataFrame(results)
+from ttk_engine import stk_with_one_headshot, weapon_columns
+from weapon_data import STK_CATEGORIES_PATH, load_weapon_types
+
+# Read data (damage columns are already numeric, see weapon_data.NUMERIC_COLUMNS)
+df = load_weapon_types()
+
+# Calculate STK at each range (one vectorized call per column)
+stk_10m, stk_20m, stk_35m = (stk_with_one_headshot(damage)
+                             for damage in weapon_columns(df, ['DMG at 10M', 'DMG at 20M', 'DMG at 35M']))
+
+df_results = pd.DataFrame({
+    'Gun': df['Gun'],
+    'Type': df['Type'],
+    'Base Damage': df['DMG'],
+    'STK at 10M': pd.array(stk_10m, dtype='Int64'),
+    'STK at 20M': pd.array(stk_20m, dtype='Int64'),
+    'STK at 35M': pd.array(stk_35m, dtype='Int64'),
+    'Damage at 10M': df['DMG at 10M'],
+    'Damage at 20M': df['DMG at 20M'],
+    'Damage at 35M': df['DMG at 35M']
+})
 
 # Sort by STK at 20M (most relevant engagement range)
 df_results = df_results.sort_values(['STK at 20M', 'Type', 'Gun'])
 
 # Save to CSV
-df_results.to_csv('STK_Categorization_One_Headshot.csv', index=False)
+df_results.to_csv(STK_CATEGORIES_PATH, index=False)
 
 print("="*80)
 print("WEAPON CATEGORIZATION BY SHOTS TO KILL")
@@ -136,6 +102,6 @@ else:
     print("\nNo weapons have range-dependent STK changes.")
 
 print("\n" + "="*80)
-print("Analysis complete! Data saved to: STK_Categorization_One_Headshot.csv")
+print(f"Analysis complete! Data saved to: {STK_CATEGORIES_PATH}")
 print("="*80)
 
@@ -1,120 +1,79 @@
+import json
+
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-
-# Read data
-falloff_df = pd.read_csv('data/Battlefield 6 Damage Fall Off - V2.csv', skiprows=1)
-ammo_df = pd.read_csv('analysis_results/Weapon_Ammo_Types.csv')
-
-# Clean up falloff data
-falloff_df = falloff_df.rename(columns={
-    'Gun (!!! -> Missing)': 'Gun',
-    'Dmg': 'DMG_Close',
-    '10m': 'DMG_10M',
-    '75m': 'DMG_75M',
-    'ROF': 'ROF'
-})
-
-# Name mapping for consistency
-name_mapping = {
-    'TR7': 'TR-7',
-    'M/60': 'M60',
-    'M240L': 'M240L',
-    'QBZ': 'QBZ-192',
-    'AK205': 'AK-205'
-}
-falloff_df['Gun'] = falloff_df['Gun'].replace(name_mapping)
-
-# Merge dataframes
-df = falloff_df[['Gun', 'Type', 'DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF']].copy()
-df = df.merge(ammo_df[['Gun', 'Ammo Type']], on='Gun', how='left')
-
-# Filter out weapons without complete data
-df = df.dropna(subset=['DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF', 'Ammo Type', 'Type'])
-
-# Extrapolate damage
-def extrapolate_damage(dmg_close, dmg_10m, dmg_75m, target_range):
-    """Linear interpolation/extrapolation"""
-    if target_range <= 0:
-        return dmg_close
-    elif target_range <= 10:
-        return np.interp(target_range, [0, 10], [dmg_close, dmg_10m])
-    elif target_range <= 75:
-        return np.interp(target_range, [10, 75], [dmg_10m, dmg_75m])
-    else:  # Extrapolate beyond 75m
-        slope = (dmg_75m - dmg_10m) / (75 - 10)
-        dmg_100m = dmg_75m + slope * (100 - 75)
-        dmg_100m = max(dmg_100m, 10)
-        return np.interp(target_range, [75, 100], [dmg_75m, dmg_100m])
-
-# Constants
-BASE_HS_MULT = 1.34
-HP_MULT = 1.5
-SYNTH_MULT = 1.75
-TARGET_HP = 100
-RANGES = [0, 10, 20, 30, 40, 50, 60, 75, 100]
-MAX_HS = 5
-
-def calculate_stk_ttk(base_dmg, rof, hs_mult, num_hs):
-    """Calculate STK and TTK for given parameters"""
-    if base_dmg <= 0 or rof <= 0:
-        return np.inf, np.inf
-    
-    best_stk = np.inf
-    best_ttk = np.inf
-    
-    for body_shots in range(20):
-        total_shots = num_hs + body_shots
-        total_damage = (base_dmg * hs_mult * num_hs) + (base_dmg * body_shots)
-        
-        if total_damage >= TARGET_HP:
-            stk = total_shots
-            ttk = (stk - 1) * (60 / rof) * 1000
-            if stk < best_stk:
-                best_stk = stk
-                best_ttk = ttk
-            break
-    
-    return int(best_stk) if best_stk != np.inf else np.inf, best_ttk
+from ttk_engine import (RANGES, MAX_HS, falloff_columns, falloff_table, table_lookup, calculate_stk_ttk_cube,
+                        kill_shot_distribution, expected_ttk, weighted_scores)
+from weapon_registry import ttk_weapons
+
+# Per-shot headshot probability the tierlist is ranked at
+HEADSHOT_RATE = 0.25
+
+# Engagement-distance and headshot-count distributions to rank weapons under (e.g. one per map)
+MAP_PROFILES_PATH = 'data/map_profiles.json'
+
+
+def load_map_profiles(path=MAP_PROFILES_PATH):
+    """Profiles as (names, ranges, range_weights, hs_weights) for weighted_scores
+
+    Each profile maps engagement distances (m) and headshot counts (0..MAX_HS)
+    to relative weights; ranges is the sorted union of every profile's
+    distances and the weight matrices have a column per range / headshot count.
+    """
+    with open(path) as f:
+        profiles = json.load(f)
+    names = list(profiles)
+    ranges = sorted({float(r) for profile in profiles.values() for r in profile['ranges']})
+    range_weights = np.zeros((len(names), len(ranges)))
+    hs_weights = np.zeros((len(names), MAX_HS + 1))
+    for p, name in enumerate(names):
+        for r, weight in profiles[name]['ranges'].items():
+            range_weights[p, ranges.index(float(r))] = weight
+        for h, weight in profiles[name]['headshots'].items():
+            if not 0 <= int(h) <= MAX_HS:
+                raise ValueError(f"Map profile '{name}': headshot count {h} outside 0..{MAX_HS}")
+            hs_weights[p, int(h)] = weight
+    return names, ranges, range_weights, hs_weights
+
+# Falloff data merged with ammo types (complete, unflagged weapons only)
+df = ttk_weapons()
 
 print(f"\n{'='*80}")
 print(f"ANALYZING TTK IMPROVEMENTS FOR ALL WEAPONS")
 print(f"{'='*80}\n")
 
+# Compute the full weapons x ranges x headshots x ammo TTK cube in one call
+damage_table = falloff_table(*falloff_columns(df))
+damage = table_lookup(damage_table, RANGES)
+_, ttk_cube = calculate_stk_ttk_cube(damage, df['ROF'].astype(float).values)
+base_ttk_all = ttk_cube[..., 0, 0]
+hp_ttk_all = ttk_cube[..., 1, 0]
+synth_ttk_all = ttk_cube[..., 2, 0]
+
+# Expected TTK when each shot is a headshot with probability HEADSHOT_RATE (weapons x ranges x ammo)
+expected_ttk_all = expected_ttk(kill_shot_distribution(damage, HEADSHOT_RATE), df['ROF'].astype(float).values)[0]
+expected_hp_gain = np.nanmean(expected_ttk_all[..., 0] - expected_ttk_all[..., 1], axis=1)
+expected_synth_gain = np.nanmean(expected_ttk_all[..., 0] - expected_ttk_all[..., 2], axis=1)
+
 # Analyze each weapon
 weapon_analysis = []
 
-for idx, weapon_row in df.iterrows():
-    gun_name = weapon_row['Gun']
-    weapon_class = weapon_row['Type']
-    dmg_close = float(weapon_row['DMG_Close'])
-    dmg_10m = float(weapon_row['DMG_10M'])
-    dmg_75m = float(weapon_row['DMG_75M'])
-    rof = float(weapon_row['ROF'])
-    ammo_type = weapon_row['Ammo Type']
-    
+for w, (gun_name, weapon_class, ammo_type) in enumerate(zip(df['Gun'], df['Type'], df['Ammo Type'])):
     # Calculate average TTK improvement across all ranges and headshot counts
-    hp_improvements = []
-    synth_improvements = []
+    base_ttk = base_ttk_all[w].ravel()
+    hp_ttk = hp_ttk_all[w].ravel()
+    synth_ttk = synth_ttk_all[w].ravel()
     
-    for r in RANGES:
-        current_dmg = extrapolate_damage(dmg_close, dmg_10m, dmg_75m, r)
-        
-        for num_hs in range(MAX_HS + 1):
-            base_stk, base_ttk = calculate_stk_ttk(current_dmg, rof, BASE_HS_MULT, num_hs)
-            hp_stk, hp_ttk = calculate_stk_ttk(current_dmg, rof, HP_MULT, num_hs)
-            
-            if base_ttk != np.inf and hp_ttk != np.inf:
-                improvement = base_ttk - hp_ttk
-                if improvement > 0:
-                    hp_improvements.append(improvement)
-            
-            if ammo_type == 'Synthetic':
-                synth_stk, synth_ttk = calculate_stk_ttk(current_dmg, rof, SYNTH_MULT, num_hs)
-                if base_ttk != np.inf and synth_ttk != np.inf:
-                    improvement = base_ttk - synth_ttk
-                    if improvement > 0:
-                        synth_improvements.append(improvement)
+    with np.errstate(invalid='ignore'):
+        hp_gain = base_ttk - hp_ttk
+        synth_gain = base_ttk - synth_ttk
+    hp_ok = np.isfinite(base_ttk) & np.isfinite(hp_ttk)
+    hp_improvements = hp_gain[hp_ok & (hp_gain > 0)].tolist()
+    
+    synth_improvements = []
+    if ammo_type == 'Synthetic':
+        synth_ok = np.isfinite(base_ttk) & np.isfinite(synth_ttk)
+        synth_improvements = synth_gain[synth_ok & (synth_gain > 0)].tolist()
     
     # Calculate statistics
     avg_hp_improvement = np.mean(hp_improvements) if hp_improvements else 0
@@ -129,9 +88,11 @@ for idx, weapon_row in df.iterrows():
         'Gun': gun_name,
         'Type': weapon_class,
         'Ammo Type': ammo_type,
+        'Expected HP Improvement (ms)': expected_hp_gain[w],
         'Avg HP Improvement (ms)': avg_hp_improvement,
         'Max HP Improvement (ms)': max_hp_improvement,
         'HP Scenarios': scenarios_with_hp_improvement,
+        'Expected Synth Improvement (ms)': expected_synth_gain[w] if ammo_type == 'Synthetic' else 0,
         'Avg Synth Improvement (ms)': avg_synth_improvement,
         'Max Synth Improvement (ms)': max_synth_improvement,
         'Synth Scenarios': scenarios_with_synth_improvement
@@ -140,28 +101,63 @@ for idx, weapon_row in df.iterrows():
 # Create DataFrame
 analysis_df = pd.DataFrame(weapon_analysis)
 
-# Sort by HP improvement
-hp_tierlist = analysis_df.sort_values('Avg HP Improvement (ms)', ascending=False)
+# Sort by expected HP improvement (headshot counts weighted by how likely they are)
+hp_tierlist = analysis_df.sort_values('Expected HP Improvement (ms)', ascending=False)
 print("\n" + "="*80)
-print("HOLLOW POINT TIERLIST (by Average TTK Improvement)")
+print(f"HOLLOW POINT TIERLIST (by Expected TTK Improvement at {HEADSHOT_RATE:.0%} headshots)")
 print("="*80)
-print(hp_tierlist[['Gun', 'Type', 'Avg HP Improvement (ms)', 'Max HP Improvement (ms)', 'HP Scenarios']].to_string(index=False))
+print(hp_tierlist[['Gun', 'Type', 'Expected HP Improvement (ms)', 'Avg HP Improvement (ms)', 'Max HP Improvement (ms)', 'HP Scenarios']].to_string(index=False))
 
 # Sort by Synth improvement (only weapons with Synth access)
 synth_df = analysis_df[analysis_df['Ammo Type'] == 'Synthetic']
-synth_tierlist = synth_df.sort_values('Avg Synth Improvement (ms)', ascending=False)
+synth_tierlist = synth_df.sort_values('Expected Synth Improvement (ms)', ascending=False)
 print("\n" + "="*80)
-print("SYNTHETIC TIERLIST (by Average TTK Improvement)")
+print(f"SYNTHETIC TIERLIST (by Expected TTK Improvement at {HEADSHOT_RATE:.0%} headshots)")
 print("="*80)
-print(synth_tierlist[['Gun', 'Type', 'Avg Synth Improvement (ms)', 'Max Synth Improvement (ms)', 'Synth Scenarios']].to_string(index=False))
+print(synth_tierlist[['Gun', 'Type', 'Expected Synth Improvement (ms)', 'Avg Synth Improvement (ms)', 'Max Synth Improvement (ms)', 'Synth Scenarios']].to_string(index=False))
 
 # Save to CSV
 hp_tierlist.to_csv('analysis_results/HP_Tierlist.csv', index=False)
 synth_tierlist.to_csv('analysis_results/Synth_Tierlist.csv', index=False)
 
+# Map profile tierlists: weighted fixed-headshot TTK gains, every profile in one contraction
+profile_names, profile_ranges, range_weights, hs_weights = load_map_profiles()
+_, profile_cube = calculate_stk_ttk_cube(table_lookup(damage_table, profile_ranges), df['ROF'].astype(float).values)
+with np.errstate(invalid='ignore'):
+    profile_gains = profile_cube[..., :1, 0] - profile_cube[..., 1:, 0]  # (weapons, ranges, headshots, HP/Synth)
+# Only scenarios both ammo types kill in are scored, as in the scenario stats above: NaN (neither kills)
+# and +inf (only HP/Synth kills within the shot cap) both score 0, so an ammo type that alone
+# brings a kill in range earns nothing for it in the map profile scores
+profile_gains = np.where(np.isfinite(profile_gains), profile_gains, 0)
+profile_scores = weighted_scores(profile_gains, range_weights, hs_weights)  # (profiles, weapons, HP/Synth)
+
+is_synth = (df['Ammo Type'] == 'Synthetic').values
+map_tierlists = []
+for p, name in enumerate(profile_names):
+    profile_df = df[['Gun', 'Type', 'Ammo Type']].assign(**{
+        'Profile': name,
+        'Weighted HP Improvement (ms)': profile_scores[p, :, 0],
+        'Weighted Synth Improvement (ms)': np.where(is_synth, profile_scores[p, :, 1], 0),
+    }).sort_values('Weighted HP Improvement (ms)', ascending=False)
+    profile_df.insert(0, 'HP Rank', np.arange(1, len(profile_df) + 1))
+    map_tierlists.append(profile_df)
+map_tierlist = pd.concat(map_tierlists)[['Profile', 'HP Rank', 'Gun', 'Type', 'Ammo Type',
+                                         'Weighted HP Improvement (ms)', 'Weighted Synth Improvement (ms)']]
+
+print("\n" + "="*80)
+print(f"MAP PROFILE TIERLISTS ({len(profile_names)} profiles from {MAP_PROFILES_PATH}, top 5 HP users)")
+print("="*80)
+for name, profile_df in map_tierlist.groupby('Profile', sort=False):
+    print(f"\n{name}:")
+    print(profile_df.head(5)[['HP Rank', 'Gun', 'Type', 'Weighted HP Improvement (ms)',
+                              'Weighted Synth Improvement (ms)']].to_string(index=False))
+
+map_tierlist.to_csv('analysis_results/Map_Tierlists.csv', index=False)
+
 print(f"\n{'='*80}")
 print(f"Saved: analysis_results/HP_Tierlist.csv")
 print(f"Saved: analysis_results/Synth_Tierlist.csv")
+print(f"Saved: analysis_results/Map_Tierlists.csv")
 print(f"{'='*80}\n")
 
 # Create markdown summary for README
@@ -169,19 +165,19 @@ with open('analysis_results/TIERLIST_SUMMARY.md', 'w') as f:
     f.write("# Ammo Type Tierlist\n\n")
     
     f.write("## Hollow Point (HP) Tierlist\n\n")
-    f.write("Ranked by average TTK improvement across all ranges and headshot combinations.\n\n")
-    f.write("| Rank | Weapon | Class | Avg TTK Improvement | Max TTK Improvement |\n")
-    f.write("|------|--------|-------|---------------------|---------------------|\n")
-    for i, row in hp_tierlist.head(10).iterrows():
-        f.write(f"| {i+1} | {row['Gun']} | {row['Type']} | {row['Avg HP Improvement (ms)']:.1f}ms | {row['Max HP Improvement (ms)']:.1f}ms |\n")
+    f.write(f"Ranked by expected TTK improvement averaged across all ranges, with each shot landing as a headshot {HEADSHOT_RATE:.0%} of the time.\n\n")
+    f.write("| Rank | Weapon | Class | Expected TTK Improvement | Avg TTK Improvement | Max TTK Improvement |\n")
+    f.write("|------|--------|-------|--------------------------|---------------------|---------------------|\n")
+    for rank, (i, row) in enumerate(hp_tierlist.head(10).iterrows(), start=1):
+        f.write(f"| {rank} | {row['Gun']} | {row['Type']} | {row['Expected HP Improvement (ms)']:.1f}ms | {row['Avg HP Improvement (ms)']:.1f}ms | {row['Max HP Improvement (ms)']:.1f}ms |\n")
     
     f.write("\n## Synthetic Tierlist\n\n")
-    f.write("Ranked by average TTK improvement across all ranges and headshot combinations.\n\n")
-    f.write("| Rank | Weapon | Class | Avg TTK Improvement | Max TTK Improvement |\n")
-    f.write("|------|--------|-------|---------------------|---------------------|\n")
+    f.write(f"Ranked by expected TTK improvement averaged across all ranges, with each shot landing as a headshot {HEADSHOT_RATE:.0%} of the time.\n\n")
+    f.write("| Rank | Weapon | Class | Expected TTK Improvement | Avg TTK Improvement | Max TTK Improvement |\n")
+    f.write("|------|--------|-------|--------------------------|---------------------|---------------------|\n")
     rank = 1
     for i, row in synth_tierlist.iterrows():
-        f.write(f"| {rank} | {row['Gun']} | {row['Type']} | {row['Avg Synth Improvement (ms)']:.1f}ms | {row['Max Synth Improvement (ms)']:.1f}ms |\n")
+        f.write(f"| {rank} | {row['Gun']} | {row['Type']} | {row['Expected Synth Improvement (ms)']:.1f}ms | {row['Avg Synth Improvement (ms)']:.1f}ms | {row['Max Synth Improvement (ms)']:.1f}ms |\n")
         rank += 1
 
 print(f"Saved: analysis_results/TIERLIST_SUMMARY.md")
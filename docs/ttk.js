@@ -0,0 +1,50 @@
+// Browser port of the ttk_engine.py formulas used by the weapon pages.
+// Data comes from weapon-bundle.json (written by export_web_data.py); keep
+// these in step with extrapolate_damage, calculate_stk_ttk_cube and
+// solve_kill_ranges so the page shows the same numbers as the Python figures.
+
+// Body damage at range r (m): linear between the sheet's close/10m/75m
+// points, extrapolated past 75m on the 10m-75m slope (floored at 10 at 100m)
+function damageAt(falloff, r) {
+    const [close, d10, d75] = falloff;
+    const slope = (d75 - d10) / (75 - 10);
+    const d100 = Math.max(d75 + slope * (100 - 75), 10);
+    const clip = x => Math.min(Math.max(x, 0), 1);
+    if (r <= 10) return close + (d10 - close) * clip(r / 10);
+    if (r <= 75) return d10 + (d75 - d10) * clip((r - 10) / 65);
+    return d75 + (d100 - d75) * clip((r - 75) / 25);
+}
+
+// Shots to kill and TTK (ms) with numHs headshots at multiplier mult;
+// Infinity when more than maxBodyShots body shots would be needed
+function stkTtk(weapon, r, numHs, mult, targetHp, maxBodyShots) {
+    const d = damageAt(weapon.falloff, r);
+    if (!(d > 0) || !(weapon.rof > 0)) return { stk: Infinity, ttk: Infinity };
+    const hsDmg = d * mult * numHs;
+    let body = Math.max(Math.ceil((targetHp - hsDmg) / d), 0);
+    // Same float nudges as calculate_stk_ttk_cube
+    if (body > 0 && hsDmg + d * (body - 1) >= targetHp) body -= 1;
+    if (hsDmg + d * body < targetHp) body += 1;
+    if (body >= maxBodyShots) return { stk: Infinity, ttk: Infinity };
+    const stk = numHs + body;
+    return { stk, ttk: (stk - 1) * (60 / weapon.rof) * 1000 };
+}
+
+// Furthest range (m, up to 100) where numHs headshots + numBody body shots kill
+function killRange(weapon, numHs, numBody, mult, targetHp) {
+    const [close, d10, d75] = weapon.falloff;
+    const lossPerMeter = (d10 - d75) / (75 - 10);
+    const breakpoints = [0, 10, 75, 100];
+    const damage = [close, d10, d75, Math.max(d75 - lossPerMeter * (100 - 75), 10)];
+    if (damage.some(Number.isNaN)) return 0;
+    const total = damage.map(d => (d * mult) * numHs + d * numBody);
+    const firstMiss = total.findIndex(t => t < targetHp);
+    if (firstMiss === -1) return breakpoints[breakpoints.length - 1];
+    if (firstMiss === 0) return 0;
+    const fraction = (total[firstMiss - 1] - targetHp) / (total[firstMiss - 1] - total[firstMiss]);
+    return breakpoints[firstMiss - 1] + (breakpoints[firstMiss] - breakpoints[firstMiss - 1]) * fraction;
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { damageAt, stkTtk, killRange };
+}
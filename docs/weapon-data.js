@@ -1,169 +1,259 @@
+const weaponClasses = {
+    'Assault Rifle': 'Assault Rifles',
+    'Carbine': 'Carbines',
+    'LMG': 'Light Machine Guns',
+    'SMG': 'Submachine Guns'
+};
+
 const weaponData = {
     // Assault Rifles
     'AK4D': {
+        weaponClass: 'Assault Rifle',
+        picture: 'pics/ak4d.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/Assault Rifle/AK4D.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Assault Rifle/AK4D.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/AK4D_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/AK4D_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is EXCELLENT</strong> <span class="ammo-badge badge-hp">BEST IN CLASS</span> - Ranks #1 overall with 117ms average TTK improvement',
-            '<strong>Verdict:</strong> Always use Hollow Point. Despite the extra cost, the massive TTK reduction makes this the best HP user in the game. Dominates in 3-shot kill scenarios with exceptional range extension.'
+            '<strong>Hollow Point is WEAK</strong> <span class="ammo-badge badge-base">BASE VIABLE</span> - Ranks #18 of 21 for Hollow Point with 9ms expected TTK improvement (117ms average, 117ms max)',
+            '<strong>Verdict:</strong> HP only pays off in the few multi-headshot 3-shot-kill scenarios (117ms when it does), so at a typical headshot rate the expected gain is small. Base ammo is viable; use Hollow Point if you reliably land headshots.'
         ]
     },
     'B36A4': {
+        weaponClass: 'Assault Rifle',
+        picture: 'pics/b36a4.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/Assault Rifle/B36A4.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Assault Rifle/B36A4.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/B36A4_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/B36A4_2HS.png',
         recommendations: [
-            '<strong>Synthetic is STRONG</strong> <span class="ammo-badge badge-synthetic">SYNTHETIC ACCESS</span> - 83ms average improvement, consistent across ranges',
+            '<strong>Synthetic is GOOD</strong> <span class="ammo-badge badge-synthetic">SYNTHETIC ACCESS</span> - Ranks #7 of 8 for Synthetic with 27ms expected TTK improvement (83ms average, 83ms max)',
             '<strong>Verdict:</strong> Use Synthetic for long-range engagements and HP for mid-range. Both provide identical TTK improvements, but Synthetic offers better range extension for 2+ headshot scenarios.'
         ]
     },
     'M433': {
+        weaponClass: 'Assault Rifle',
+        picture: 'pics/m433.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/Assault Rifle/M433.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Assault Rifle/M433.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/M433_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/M433_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is GOOD</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - 72ms average TTK improvement',
+            '<strong>Hollow Point is WEAK</strong> <span class="ammo-badge badge-base">BASE VIABLE</span> - Ranks #17 of 21 for Hollow Point with 9ms expected TTK improvement (72ms average, 72ms max)',
             '<strong>Verdict:</strong> Use HP for consistent TTK benefits. While not top-tier, it provides reliable improvements across most engagement ranges. Base ammo viable if conserving credits.'
         ]
     },
     'SOR-556 MK2': {
+        weaponClass: 'Assault Rifle',
+        picture: 'pics/sor-556 mk2.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/Assault Rifle/SOR-556 MK2.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Assault Rifle/SOR-556 MK2.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/SOR-556 MK2_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/SOR-556 MK2_2HS.png',
         recommendations: [
-            '<strong>Synthetic is EXCELLENT</strong> <span class="ammo-badge badge-synthetic">TOP 3</span> - Ranks #3 overall with 106ms average improvement',
+            '<strong>Synthetic is EXCELLENT</strong> <span class="ammo-badge badge-synthetic">TOP 3</span> - Ranks #3 of 8 for Synthetic with 34ms expected TTK improvement (106ms average, 106ms max)',
             '<strong>Verdict:</strong> Always use Synthetic/HP. Ties for consistent performance across all ranges. One of the best special ammo users in the AR class.'
         ]
     },
+    'TR-7': {
+        weaponClass: 'Assault Rifle',
+        ttkImage: 'visualizations/TTK_ANALYSIS/Assault Rifle/TR-7.png',
+        ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Assault Rifle/TR-7.png',
+        rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/TR-7_1HS.png',
+        rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/TR-7_2HS.png',
+        recommendations: [
+            '<strong>Hollow Point is WEAK</strong> <span class="ammo-badge badge-base">BASE VIABLE</span> - Ranks #21 of 21 for Hollow Point with 7ms expected TTK improvement (83ms average, 83ms max)'
+        ]
+    },
 
     // Carbines
+    'AK-205': {
+        weaponClass: 'Carbine',
+        ttkImage: 'visualizations/TTK_ANALYSIS/Carbine/AK-205.png',
+        ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Carbine/AK-205.png',
+        rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/AK-205_1HS.png',
+        rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/AK-205_2HS.png',
+        rangeImage3HS: 'visualizations/INDIVIDUAL_WEAPONS/AK-205_3HS.png',
+        recommendations: [
+            '<strong>Synthetic is EXCEPTIONAL</strong> <span class="ammo-badge badge-synthetic">TOP 1</span> - Ranks #1 of 8 for Synthetic with 41ms expected TTK improvement (99ms average, 167ms max)'
+        ]
+    },
     'GRT-BC': {
+        weaponClass: 'Carbine',
+        picture: 'pics/grt-bc.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/Carbine/GRT-BC.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Carbine/GRT-BC.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/GRT-BC_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/GRT-BC_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is GOOD</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - 72ms average TTK improvement',
+            '<strong>Hollow Point is STRONG</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - Ranks #5 of 21 for Hollow Point with 15ms expected TTK improvement (72ms average, 72ms max)',
             '<strong>Verdict:</strong> Use HP for better performance in 5-shot kill scenarios. Provides solid range extension and TTK improvements. Best value in medium-range engagements.'
         ]
     },
     'M277': {
+        weaponClass: 'Carbine',
+        picture: 'pics/m277.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/Carbine/M277.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Carbine/M277.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/M277_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/M277_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is STRONG</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - 83ms average improvement, zero damage falloff to 100m!',
+            '<strong>Hollow Point is GOOD</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - Ranks #11 of 21 for Hollow Point with 12ms expected TTK improvement (83ms average, 83ms max)',
             '<strong>Verdict:</strong> Use HP. Already dominates with zero falloff, and HP makes it even deadlier. Maintains 100m effective range with all ammo types - unmatched consistency.'
         ]
     },
+    'M417A2': {
+        weaponClass: 'Carbine',
+        ttkImage: 'visualizations/TTK_ANALYSIS/Carbine/M417A2.png',
+        ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Carbine/M417A2.png',
+        rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/M417A2_1HS.png',
+        rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/M417A2_2HS.png',
+        recommendations: [
+            '<strong>Hollow Point is GOOD</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - Ranks #9 of 21 for Hollow Point with 13ms expected TTK improvement (92ms average, 92ms max)'
+        ]
+    },
     'M4A1': {
+        weaponClass: 'Carbine',
+        picture: 'pics/m4a1.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/Carbine/M4A1.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Carbine/M4A1.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/M4A1_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/M4A1_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is DECENT</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - 67ms average TTK improvement',
+            '<strong>Hollow Point is STRONG</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - Ranks #8 of 21 for Hollow Point with 14ms expected TTK improvement (67ms average, 67ms max)',
             '<strong>Verdict:</strong> Use HP for competitive advantage. Most beneficial at 50m+ ranges and in 2-headshot scenarios. Base ammo acceptable for close quarters to save credits.'
         ]
     },
+    'QBZ-192': {
+        weaponClass: 'Carbine',
+        ttkImage: 'visualizations/TTK_ANALYSIS/Carbine/QBZ-192.png',
+        ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/Carbine/QBZ-192.png',
+        rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/QBZ-192_1HS.png',
+        rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/QBZ-192_2HS.png',
+        recommendations: [
+            '<strong>Synthetic is STRONG</strong> <span class="ammo-badge badge-synthetic">SYNTHETIC ACCESS</span> - Ranks #5 of 8 for Synthetic with 30ms expected TTK improvement (94ms average, 167ms max)'
+        ]
+    },
 
     // Light Machine Guns
     'DRS-IAR': {
+        weaponClass: 'LMG',
+        picture: 'pics/drs-iar.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/LMG/DRS-IAR.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/LMG/DRS-IAR.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/DRS-IAR_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/DRS-IAR_2HS.png',
         recommendations: [
-            '<strong>Synthetic is GOOD</strong> <span class="ammo-badge badge-synthetic">SYNTHETIC ACCESS</span> - 78ms average improvement',
+            '<strong>Synthetic is GOOD</strong> <span class="ammo-badge badge-synthetic">SYNTHETIC ACCESS</span> - Ranks #8 of 8 for Synthetic with 25ms expected TTK improvement (78ms average, 78ms max)',
             '<strong>Verdict:</strong> Use Synthetic for long-range suppression. Provides consistent 78ms TTK reduction across many scenarios. HP and Synth perform identically in most cases.'
         ]
     },
     'L110': {
+        weaponClass: 'LMG',
+        picture: 'pics/l110.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/LMG/L110.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/LMG/L110.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/L110_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/L110_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is STRONG</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - 83ms average TTK improvement',
+            '<strong>Hollow Point is DECENT</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - Ranks #13 of 21 for Hollow Point with 11ms expected TTK improvement (83ms average, 83ms max)',
             '<strong>Verdict:</strong> Use HP. Solid all-around improvement for sustained fire. Particularly effective in defensive positions where range matters.'
         ]
     },
     'M123K': {
+        weaponClass: 'LMG',
+        picture: 'pics/m123k.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/LMG/M123K.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/LMG/M123K.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/M123K_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/M123K_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is GOOD</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - 72ms average TTK improvement',
-            '<strong>Verdict:</strong> Use HP for better suppression effectiveness. Benefits most in 4-shot kill ranges with incidental headshots. Good value for defensive LMG play.'
+            '<strong>Hollow Point is WEAK</strong> <span class="ammo-badge badge-base">BASE VIABLE</span> - Ranks #16 of 21 for Hollow Point with 9ms expected TTK improvement (72ms average, 72ms max)',
+            '<strong>Verdict:</strong> HP gains are modest for this LMG: they mostly show up in 4-shot kill ranges with incidental headshots. Base ammo is viable for defensive play.'
+        ]
+    },
+    'M60': {
+        weaponClass: 'LMG',
+        ttkImage: 'visualizations/TTK_ANALYSIS/LMG/M60.png',
+        ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/LMG/M60.png',
+        rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/M60_1HS.png',
+        rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/M60_2HS.png',
+        recommendations: [
+            '<strong>Hollow Point is WEAK</strong> <span class="ammo-badge badge-base">BASE VIABLE</span> - Ranks #19 of 21 for Hollow Point with 9ms expected TTK improvement (117ms average, 117ms max)'
         ]
     },
     'RPKM': {
+        weaponClass: 'LMG',
+        picture: 'pics/rpkm.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/LMG/RPKM.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/LMG/RPKM.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/RPKM_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/RPKM_2HS.png',
         recommendations: [
-            '<strong>Synthetic is EXCEPTIONAL</strong> <span class="ammo-badge badge-synthetic">BEST IN CLASS</span> - Ranks #1 for Synthetic with 109ms average improvement',
-            '<strong>Verdict:</strong> ALWAYS use special ammo. Dominates both HP and Synthetic tierlists - the ultimate special ammo weapon. Synthetic provides unmatched long-range TTK reduction.'
+            '<strong>Synthetic is STRONG</strong> <span class="ammo-badge badge-synthetic">BEST IN CLASS</span> - Ranks #4 of 8 for Synthetic with 32ms expected TTK improvement (108ms average, 108ms max)',
+            '<strong>Verdict:</strong> Use special ammo. Ranks #4 for HP and #4 for Synthetic, and Synthetic provides the best long-range TTK reduction of the LMGs.'
         ]
     },
 
     // Submachine Guns
     'KV9': {
+        weaponClass: 'SMG',
+        picture: 'pics/kv9.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/SMG/KV9.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/SMG/KV9.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/KV9_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/KV9_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is WEAK</strong> <span class="ammo-badge badge-base">BASE VIABLE</span> - Only 56ms average improvement (lowest in class)',
+            '<strong>Hollow Point is WEAK</strong> <span class="ammo-badge badge-base">BASE VIABLE</span> - Ranks #20 of 21 for Hollow Point with 9ms expected TTK improvement (56ms average, 56ms max)',
             '<strong>Verdict:</strong> Base ammo recommended. HP provides minimal benefit due to low damage and steep falloff. Save credits and play close range where this SMG excels.'
         ]
     },
     'PW5A3': {
+        weaponClass: 'SMG',
+        picture: 'pics/PW5A3.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/SMG/PW5A3.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/SMG/PW5A3.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/PW5A3_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/PW5A3_2HS.png',
         recommendations: [
-            '<strong>Synthetic is STRONG</strong> <span class="ammo-badge badge-synthetic">SYNTHETIC ACCESS</span> - 96ms average, 156ms max improvement',
+            '<strong>Synthetic is STRONG</strong> <span class="ammo-badge badge-synthetic">SYNTHETIC ACCESS</span> - Ranks #6 of 8 for Synthetic with 29ms expected TTK improvement (96ms average, 156ms max)',
             '<strong>Verdict:</strong> Use Synthetic for maximum TTK reduction. Particularly deadly with 2+ headshots. One of the better SMGs for special ammo utilization.'
         ]
     },
     'SGX': {
+        weaponClass: 'SMG',
+        picture: 'pics/SGX.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/SMG/SGX.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/SMG/SGX.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/SGX_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/SGX_2HS.png',
         recommendations: [
-            '<strong>Hollow Point is GOOD</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - 72ms average TTK improvement',
+            '<strong>Hollow Point is DECENT</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - Ranks #12 of 21 for Hollow Point with 11ms expected TTK improvement (72ms average, 72ms max)',
             '<strong>Verdict:</strong> Use HP for consistent close-range performance. Provides solid improvements within SMG effective range. Best utilized under 40m.'
         ]
     },
     'UMG-40': {
+        weaponClass: 'SMG',
+        picture: 'pics/UMG-40.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/SMG/UMG-40.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/SMG/UMG-40.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/UMG-40_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/UMG-40_2HS.png',
         recommendations: [
-            '<strong>Synthetic is EXCEPTIONAL</strong> <span class="ammo-badge badge-synthetic">TOP 2</span> - 107ms average, 189ms max improvement!',
+            '<strong>Synthetic is EXCELLENT</strong> <span class="ammo-badge badge-synthetic">TOP 2</span> - Ranks #2 of 8 for Synthetic with 34ms expected TTK improvement (107ms average, 189ms max)',
             '<strong>Verdict:</strong> ALWAYS use Synthetic. Exceptional scaling with peak 189ms improvements. Best SMG for long-range viability - can compete with carbines at 100m with 2 headshots.'
         ]
     },
     'USG-90': {
+        weaponClass: 'SMG',
+        picture: 'pics/usg-90.png',
         ttkImage: 'visualizations/TTK_ANALYSIS/SMG/USG-90.png',
         ttkImage80HP: 'visualizations/TTK_ANALYSIS_80HP/SMG/USG-90.png',
         rangeImage1HS: 'visualizations/INDIVIDUAL_WEAPONS/USG-90_1HS.png',
         rangeImage2HS: 'visualizations/INDIVIDUAL_WEAPONS/USG-90_2HS.png',
         rangeImage3HS: 'visualizations/INDIVIDUAL_WEAPONS/USG-90_3HS.png',
         recommendations: [
-            '<strong>Hollow Point is DECENT</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - 67ms average TTK improvement',
+            '<strong>Hollow Point is STRONG</strong> <span class="ammo-badge badge-hp">HP ONLY</span> - Ranks #6 of 21 for Hollow Point with 14ms expected TTK improvement (67ms average, 67ms max)',
             '<strong>Verdict:</strong> Use HP for mid-range engagements. Solid all-around SMG that benefits from HP in 50-60m ranges. Base ammo viable for close quarters.'
         ]
     }
@@ -0,0 +1,130 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from ttk_engine import (TARGET_HP, TRAVEL_MODES, falloff_columns, falloff_table, range_grid, kill_shot_distribution,
+                        expected_ttk, travel_time_ms)
+from weapon_registry import loadouts, ttk_weapons
+
+HEADSHOT_RATE = 0.25  # Per-shot headshot probability (same as the tier list)
+DUEL_STEP = 0.1  # m; resolution of the crossover search
+MATRIX_STEP = 1  # m between the ranges stored in the matrix file
+MAX_RANGE = 100
+ROW_CHUNK = 64  # Loadouts compared against all others per block (bounds memory use)
+
+
+def loadout_ttk(df, loadout_df, p_head=HEADSHOT_RATE, travel='hitscan', target_hp=TARGET_HP,
+                step=DUEL_STEP, max_range=MAX_RANGE):
+    """Expected TTK (ms) of every loadout on range_grid(step, max_range): (loadouts, ranges)
+
+    np.inf where the loadout can't kill at that range.
+    """
+    ranges = range_grid(step, max_range)
+    damage = falloff_table(*falloff_columns(df), step=step, max_range=max_range)
+    travel_ms = travel_time_ms(ranges, df['Velocity'].astype(float).values, travel)
+    ttk = expected_ttk(kill_shot_distribution(damage, p_head, target_hp=target_hp),
+                       df['ROF'].astype(float).values, travel_ms)[0]  # (weapons, ranges, mults)
+    ttk = ttk[loadout_df['Weapon'].to_numpy(), :, loadout_df['Mult'].to_numpy()]
+    return ranges, np.where(np.isnan(ttk), np.inf, ttk)
+
+
+def duel_advantage(ttk_rows, ttk_cols):
+    """TTK advantage (ms) of each row loadout over each column loadout: (rows, cols, ranges)
+
+    Positive where the row loadout kills first. Pairs where neither can
+    kill are a tie (0); a loadout that can't kill loses by an infinite margin.
+    """
+    with np.errstate(invalid='ignore'):
+        advantage = ttk_cols[None, :, :] - ttk_rows[:, None, :]
+    return np.where(np.isnan(advantage), 0.0, advantage)
+
+
+def winner_flips(advantage):
+    """(row, col, range index) where the pair's winner flips, at the first range the new winner leads
+
+    Ties carry the previous winner forward, so "A wins, tie, B wins" is
+    one flip located where B starts winning.
+    """
+    sign = np.sign(advantage).astype(np.int8)
+    last_decided = np.where(sign != 0, np.arange(sign.shape[-1]), 0)
+    np.maximum.accumulate(last_decided, axis=-1, out=last_decided)
+    winner = np.take_along_axis(sign, last_decided, axis=-1)
+    rows, cols, r = np.nonzero(winner[..., 1:] * winner[..., :-1] < 0)
+    return rows, cols, r + 1
+
+
+def duel_matrix(ttk, ranges, matrix_step=MATRIX_STEP):
+    """Advantage matrix at matrix_step spacing, share of ranges each loadout wins, and crossovers
+
+    All comparisons are broadcast over (loadouts x loadouts x ranges) in
+    blocks of ROW_CHUNK rows. Returns (matrix_ranges, advantage, win_share,
+    crossovers) with advantage (N, N, matrix ranges) float32, win_share
+    (N, N) over the full range grid and crossovers as (row, col, range)
+    arrays for row < col (the matrix is antisymmetric).
+    """
+    stride = int(round(matrix_step / (ranges[1] - ranges[0])))
+    n = len(ttk)
+    advantage = np.empty((n, n, len(ranges[::stride])), dtype=np.float32)
+    win_share = np.empty((n, n))
+    flips = []
+    for start in range(0, n, ROW_CHUNK):
+        block = duel_advantage(ttk[start:start + ROW_CHUNK], ttk)
+        advantage[start:start + ROW_CHUNK] = block[..., ::stride]
+        win_share[start:start + ROW_CHUNK] = (block > 0).mean(axis=-1)
+        rows, cols, r = winner_flips(block)
+        rows += start
+        keep = rows < cols
+        flips.append((rows[keep], cols[keep], r[keep]))
+    crossovers = tuple(np.concatenate(parts) for parts in zip(*flips))
+    return ranges[::stride], advantage, win_share, crossovers
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='TTK duel matrix for every pair of weapon/ammo loadouts across ranges')
+    parser.add_argument('--p-head', type=float, default=HEADSHOT_RATE, help='Per-shot headshot probability')
+    parser.add_argument('--travel', choices=TRAVEL_MODES, default='hitscan',
+                        help='Include the first shot\'s flight time (first_shot) or not (hitscan)')
+    parser.add_argument('--hp', type=int, default=TARGET_HP, help='Target HP')
+    args = parser.parse_args()
+
+    # Falloff data merged with ammo types (complete, unflagged weapons only)
+    df = ttk_weapons().reset_index(drop=True)
+    loadout_df = loadouts(df)
+
+    start = time.perf_counter()
+    ranges, ttk = loadout_ttk(df, loadout_df, args.p_head, args.travel, args.hp)
+    matrix_ranges, advantage, win_share, (rows, cols, r) = duel_matrix(ttk, ranges)
+    elapsed = time.perf_counter() - start
+
+    n = len(loadout_df)
+    print(f"\n{'='*80}")
+    print(f"DUEL MATRIX: {n} loadouts, {n * (n - 1):,} ordered pairs, {len(ranges)} ranges "
+          f"(p(headshot)={args.p_head:g}, {args.travel})")
+    print(f"{'='*80}\n")
+
+    # Loadouts ranked by how often they win, averaged over every opponent and range
+    others = ~np.eye(n, dtype=bool)
+    ranking = loadout_df[['Loadout', 'Type']].assign(
+        **{'Win Share': (win_share * others).sum(axis=1) / (n - 1)}).sort_values('Win Share', ascending=False)
+    print(ranking.head(15).to_string(index=False, float_format=lambda v: f'{v:.1%}'))
+
+    labels = loadout_df['Loadout'].to_numpy()
+    a_wins_after = ttk[cols, r] > ttk[rows, r]  # The flip range is the first one the new winner leads
+    crossovers_df = pd.DataFrame({
+        'Loadout A': labels[rows],
+        'Loadout B': labels[cols],
+        'Crossover (m)': ranges[r],
+        'Winner Before': np.where(a_wins_after, labels[cols], labels[rows]),
+        'Winner After': np.where(a_wins_after, labels[rows], labels[cols]),
+    }).sort_values(['Loadout A', 'Loadout B', 'Crossover (m)'])
+
+    print(f"\n{len(crossovers_df):,} winner flips across {crossovers_df.groupby(['Loadout A', 'Loadout B']).ngroups:,} pairs")
+    print(f"Computed in {elapsed:.2f}s")
+
+    np.savez_compressed('analysis_results/Duel_Matrix.npz', loadouts=labels.astype(str), ranges=matrix_ranges,
+                        advantage_ms=advantage, win_share=win_share)
+    crossovers_df.to_csv('analysis_results/Duel_Crossovers.csv', index=False)
+    print(f"\nSaved: analysis_results/Duel_Matrix.npz")
+    print(f"Saved: analysis_results/Duel_Crossovers.csv")
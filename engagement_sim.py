@@ -0,0 +1,165 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from ttk_engine import (MAX_SHOTS, TARGET_HP, body_shots_needed, expected_ttk, falloff_columns, falloff_table,
+                        table_lookup)
+from weapon_registry import AMMO_LABELS, ttk_weapons
+
+CHUNK_SIZE = 200_000  # Engagements drawn per batch (bounds memory use)
+PERCENTILES = [10, 50, 90]
+
+
+def event_shots(is_event, max_shots):
+    """Shot index of the k-th event for k = 0..max_shots + 1, shaped (engagements, max_shots + 2)
+
+    Column 0 is -1 (zero events are needed before the first shot) and any
+    event that never happens is max_shots, so "needs k events" and "never
+    gets them" compare naturally with the max() in kill_shots().
+    """
+    shots = np.arange(max_shots, dtype=np.int16)
+    positions = np.sort(np.where(is_event, shots, max_shots).astype(np.int16), axis=1)
+    n = len(is_event)
+    return np.concatenate([np.full((n, 1), -1, np.int16), positions,
+                           np.full((n, 1), max_shots, np.int16)], axis=1)
+
+
+def kill_shots(head_shots, body_shots, body_needed):
+    """Index of the killing shot per engagement (max_shots if none)
+
+    An engagement is over once it has landed h headshots and body_needed[h]
+    body shots for some h, so the kill shot is min over h of the later of
+    the h-th headshot and the body_needed[h]-th body shot.
+    """
+    # Headshots past the first h that kills without body shots can't kill sooner
+    enough = np.flatnonzero(body_needed == 0)
+    last_hs = enough[0] if len(enough) else len(body_needed) - 1
+    hs = np.arange(last_hs + 1)
+    hs = hs[body_needed[hs] < head_shots.shape[1] - 1]
+    if len(hs) == 0:
+        return np.full(len(head_shots), head_shots.shape[1] - 2, dtype=np.int16)
+    return np.maximum(head_shots[:, hs], body_shots[:, body_needed[hs]]).min(axis=1)
+
+
+def simulate_engagements(damage, p_head, p_miss=0.0, hs_mults=None, target_hp=TARGET_HP,
+                         num_engagements=1_000_000, max_shots=MAX_SHOTS, seed=0):
+    """Monte Carlo kill-shot distribution for every weapon and ammo multiplier
+
+    Each shot is a headshot with probability p_head, a miss with
+    probability p_miss and a body shot otherwise. damage is (weapons,) body
+    damage at the engagement range. Every weapon and multiplier sees the
+    same random shot sequences (common random numbers), so differences
+    between them are not sampling noise, and weapons with identical
+    breakpoints are only evaluated once. kill_shot_distribution in
+    ttk_engine gives the same distribution exactly.
+
+    Returns histograms shaped (weapons, mults, max_shots + 1): counts of
+    engagements whose killing shot was shot k (0-based); the last bin
+    counts engagements with no kill within max_shots.
+    """
+    if not 0 <= p_head <= 1 or not 0 <= p_miss <= 1 - p_head:
+        raise ValueError('Need 0 <= p_head, p_miss and p_head + p_miss <= 1')
+
+    body_needed = body_shots_needed(np.asarray(damage, dtype=float)[:, None], max_shots, hs_mults, target_hp)[:, 0]
+    unique_needed, inverse = np.unique(body_needed.reshape(-1, max_shots + 1), axis=0, return_inverse=True)
+    counts = np.zeros((len(unique_needed), max_shots + 1), dtype=np.int64)
+
+    rng = np.random.default_rng(seed)
+    for start in range(0, num_engagements, CHUNK_SIZE):
+        n = min(CHUNK_SIZE, num_engagements - start)
+        u = rng.random((n, max_shots), dtype=np.float32)
+        is_head = u < p_head
+        is_body = u >= p_head + p_miss
+        head_shots = event_shots(is_head, max_shots)
+        body_shots = event_shots(is_body, max_shots)
+        for i, needed in enumerate(unique_needed):
+            counts[i] += np.bincount(kill_shots(head_shots, body_shots, needed), minlength=max_shots + 1)
+
+    return counts[inverse.ravel()].reshape(body_needed.shape[:2] + (max_shots + 1,))
+
+
+def shot_interval_ms(rof):
+    """Time between shots in ms for each weapon"""
+    return 60000 / np.asarray(rof, dtype=float)
+
+
+def kill_probability(histograms, rof=None, budget_ms=None):
+    """Share of engagements that end in a kill (within budget_ms of the first shot, if given)"""
+    total = histograms.sum(axis=-1)
+    if budget_ms is None:
+        return histograms[..., :-1].sum(axis=-1) / total
+    shots = np.arange(histograms.shape[-1] - 1)
+    in_time = shots * shot_interval_ms(rof)[:, None, None] <= budget_ms  # (weapons, 1, shots)
+    return (histograms[..., :-1] * in_time).sum(axis=-1) / total
+
+
+def ttk_percentiles(histograms, rof, percentiles=PERCENTILES):
+    """TTK (ms) percentiles over all engagements (np.inf where the kill never happened)"""
+    cdf = np.cumsum(histograms, axis=-1) / histograms.sum(axis=-1, keepdims=True)
+    q = np.asarray(percentiles, dtype=float)[:, None, None, None] / 100
+    shot = (cdf[None] < q).sum(axis=-1)  # first kill shot whose CDF reaches q
+    interval = shot_interval_ms(rof)[None, :, None]
+    ttk = shot * interval
+    return np.where(shot >= histograms.shape[-1] - 1, np.inf, ttk)  # (percentiles, weapons, mults)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Monte Carlo TTK for every weapon when each shot is a headshot '
+                                                 'with probability p and a miss with probability q')
+    parser.add_argument('--p-head', type=float, default=0.25, help='Probability a shot is a headshot')
+    parser.add_argument('--p-miss', type=float, default=0.2, help='Probability a shot misses')
+    parser.add_argument('--range', type=float, default=20, help='Engagement distance (m)')
+    parser.add_argument('--budget-ms', type=float, default=500, help='Report the chance to kill within this time')
+    parser.add_argument('--hp', type=int, default=TARGET_HP, help='Target HP')
+    parser.add_argument('--engagements', type=int, default=1_000_000, help='Engagements per weapon and ammo type')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Falloff data merged with ammo types (complete, unflagged weapons only)
+    df = ttk_weapons().reset_index(drop=True)
+
+    rof = df['ROF'].astype(float).values
+    damage_table = falloff_table(*falloff_columns(df))
+    damage = table_lookup(damage_table, args.range)[:, 0]
+
+    start = time.perf_counter()
+    histograms = simulate_engagements(damage, args.p_head, args.p_miss, target_hp=args.hp,
+                                      num_engagements=args.engagements, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    kill_prob = kill_probability(histograms)
+    budget_prob = kill_probability(histograms, rof, args.budget_ms)
+    percentiles = ttk_percentiles(histograms, rof)
+    # Kill-shot histograms have the layout of one kill_shot_distribution probability at one range
+    mean = expected_ttk(histograms[None, :, None], rof)[0, :, 0]
+
+    results = []
+    for w, (gun, weapon_type, ammo_type) in enumerate(zip(df['Gun'], df['Type'], df['Ammo Type'])):
+        for a, ammo in enumerate(AMMO_LABELS):
+            if ammo == 'Synth' and ammo_type != 'Synthetic':
+                continue
+            result = {'Gun': gun, 'Type': weapon_type, 'Ammo': ammo,
+                      'Kill Prob': kill_prob[w, a],
+                      f'Kill Prob <= {args.budget_ms:g}ms': budget_prob[w, a],
+                      'Mean TTK (ms)': mean[w, a]}
+            for p, values in zip(PERCENTILES, percentiles):
+                result[f'P{p} TTK (ms)'] = values[w, a]
+            results.append(result)
+    df_results = pd.DataFrame(results).sort_values('Mean TTK (ms)').reset_index(drop=True)
+
+    print(f"\n{'='*80}")
+    print(f"ENGAGEMENT SIMULATION: {args.range:g}m, {args.hp} HP, "
+          f"p(headshot)={args.p_head:g}, p(miss)={args.p_miss:g}")
+    print(f"{'='*80}\n")
+    formatters = {col: (lambda v: f'{v:.3f}') if 'Prob' in col else (lambda v: f'{v:.0f}')
+                  for col in df_results.columns[3:]}
+    print(df_results.to_string(index=False, formatters=formatters))
+
+    total = args.engagements * histograms.shape[0] * histograms.shape[1]
+    print(f"\nSimulated {total:,} engagements in {elapsed:.2f}s ({total / elapsed / 1e6:.1f}M/s)")
+
+    output_path = 'analysis_results/Engagement_Simulation.csv'
+    df_results.to_csv(output_path, index=False)
+    print(f"Saved: {output_path}")
@@ -0,0 +1,50 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from ttk_engine import AMMO_MULTS, MAX_BODY_SHOTS, MAX_HS, RANGES, TARGET_HP, falloff_columns
+from weapon_data import STK_CATEGORIES_PATH, source_hash
+from weapon_registry import AMMO_LABELS, lookup, ttk_weapons
+
+BUNDLE_PATH = 'docs/weapon-bundle.json'
+
+
+def weapon_bundle(df, stk_df):
+    """Everything docs/ttk.js needs to compute TTK heatmaps and range circles in the browser
+
+    Per weapon: class, falloff points (close/10m/75m body damage), ROF,
+    usable ammo types and the 20m STK that picks its range-circle combos.
+    The ammo multipliers, ranges and caps are the ttk_engine constants, so
+    the page matches the Python figures.
+    """
+    stk_20m = lookup(stk_df, df['Gun'], 'STK at 20M')
+    falloff = np.column_stack(falloff_columns(df))
+    rof = df['ROF'].astype(float).values
+    weapons = {}
+    for w, (gun, weapon_type, ammo_type) in enumerate(zip(df['Gun'], df['Type'], df['Ammo Type'])):
+        weapons[gun] = {
+            'type': weapon_type,
+            'falloff': falloff[w].tolist(),
+            'rof': float(rof[w]),
+            'ammo': AMMO_LABELS if ammo_type == 'Synthetic' else AMMO_LABELS[:2],
+            'stk20': int(stk_20m[w]) if pd.notna(stk_20m[w]) else None,
+        }
+    return {
+        'version': source_hash(),
+        'targetHp': TARGET_HP,
+        'maxBodyShots': MAX_BODY_SHOTS,
+        'maxHs': MAX_HS,
+        'ranges': RANGES,
+        'ammoMults': dict(zip(AMMO_LABELS, AMMO_MULTS)),
+        'weapons': weapons,
+    }
+
+
+if __name__ == '__main__':
+    bundle = weapon_bundle(ttk_weapons(), pd.read_csv(STK_CATEGORIES_PATH))
+    with open(BUNDLE_PATH, 'w') as f:
+        json.dump(bundle, f, separators=(',', ':'))
+    print(f"{len(bundle['weapons'])} weapons, {os.path.getsize(BUNDLE_PATH) / 1024:.1f} KB")
+    print(f"Saved: {BUNDLE_PATH}")
@@ -1,7 +1,8 @@
 import pandas as pd
+from weapon_data import AMMO_TYPES_PATH, load_stat_cards
 
 # Read the Stat Card Values which has the actual ammo multiplier data
-df = pd.read_csv('data/BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - Stat Card Values.csv')
+df = load_stat_cards()
 
 # Calculate actual multiplier
 df['Base DMG'] = pd.to_numeric(df['DMG'], errors='coerce')
@@ -28,7 +29,7 @@ ammo_info = df[['Gun', 'Type', 'Base DMG', 'Ammo Type', 'Actual Multiplier']].co
 ammo_info = ammo_info.sort_values(['Type', 'Gun'])
 
 # Save to CSV
-ammo_info.to_csv('Weapon_Ammo_Types.csv', index=False)
+ammo_info.to_csv(AMMO_TYPES_PATH, index=False)
 
 print("="*80)
 print("WEAPON AMMO TYPE AVAILABILITY")
@@ -75,6 +76,6 @@ for _, weapon in ammo_info.iterrows():
           f"{weapon['Ammo Type']:15} ({mult_display})")
 
 print("\n" + "="*80)
-print("Data saved to: Weapon_Ammo_Types.csv")
+print(f"Data saved to: {AMMO_TYPES_PATH}")
 print("="*80)
 
@@ -0,0 +1,184 @@
+import filecmp
+import json
+import os
+import re
+import shutil
+
+import pandas as pd
+
+WEAPON_DATA_JS = 'docs/weapon-data.js'
+NOTES_PATH = 'data/weapon_notes.json'
+PICS_DIR = 'docs/pics'
+HP_TIERLIST = 'analysis_results/HP_Tierlist.csv'
+SYNTH_TIERLIST = 'analysis_results/Synth_Tierlist.csv'
+
+# Section comment and order of each weapon class on the page
+CLASS_SECTIONS = {
+    'Assault Rifle': 'Assault Rifles',
+    'Carbine': 'Carbines',
+    'LMG': 'Light Machine Guns',
+    'SMG': 'Submachine Guns',
+}
+
+# Rating by expected TTK improvement as a share of the tierlist leader's (the
+# tierlists are sorted by it), so the rating never disagrees with the rank
+RATINGS = [(0.9, 'EXCEPTIONAL'), (0.8, 'EXCELLENT'), (0.7, 'STRONG'), (0.6, 'GOOD'), (0.5, 'DECENT'), (0, 'WEAK')]
+
+ENTRY_PATTERN = re.compile(r"^    '(?P<name>(?:[^'\\]|\\.)+)': \{\n.*?^    \}", re.M | re.S)
+
+
+def js_string(text):
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def rating(expected, best_expected):
+    return next(label for minimum, label in RATINGS if expected >= minimum * best_expected)
+
+
+def tierlist_stats(hp_df, synth_df):
+    """Per gun: its tierlist ranks and improvement figures, keyed for the notes' format fields"""
+    stats = {}
+    for rank, (_, row) in enumerate(hp_df.iterrows(), start=1):
+        stats[row['Gun']] = {
+            'type': row['Type'], 'ammo_type': row['Ammo Type'], 'hp_rank': rank, 'hp_total': len(hp_df),
+            'hp_expected': row['Expected HP Improvement (ms)'], 'hp_avg': row['Avg HP Improvement (ms)'],
+            'hp_max': row['Max HP Improvement (ms)'], 'hp_best': hp_df['Expected HP Improvement (ms)'].max(),
+        }
+    for rank, (_, row) in enumerate(synth_df.iterrows(), start=1):
+        stats[row['Gun']].update({
+            'synth_rank': rank, 'synth_total': len(synth_df),
+            'synth_best': synth_df['Expected Synth Improvement (ms)'].max(),
+            'synth_expected': row['Expected Synth Improvement (ms)'], 'synth_avg': row['Avg Synth Improvement (ms)'],
+            'synth_max': row['Max Synth Improvement (ms)'],
+        })
+    for gun, s in stats.items():
+        prefix = 'synth' if 'synth_rank' in s else 'hp'
+        s['class_best'] = all(other[f'{prefix}_rank'] >= s[f'{prefix}_rank'] for other in stats.values()
+                              if other['type'] == s['type'] and f'{prefix}_rank' in other)
+    return stats
+
+
+def summary_line(s):
+    """Rating, badge and tierlist figures: the line that used to be copied by hand from the CSVs"""
+    synth = 'synth_rank' in s
+    prefix, ammo_name = ('synth', 'Synthetic') if synth else ('hp', 'Hollow Point')
+    rank, total = s[f'{prefix}_rank'], s[f'{prefix}_total']
+    label = rating(s[f'{prefix}_expected'], s[f'{prefix}_best'])
+    if rank <= 3:
+        badge_class, badge = f'badge-{"synthetic" if synth else "hp"}', f'TOP {rank}'
+    elif s['class_best']:
+        badge_class, badge = f'badge-{"synthetic" if synth else "hp"}', 'BEST IN CLASS'
+    elif synth:
+        badge_class, badge = 'badge-synthetic', 'SYNTHETIC ACCESS'
+    elif label == 'WEAK':
+        badge_class, badge = 'badge-base', 'BASE VIABLE'
+    else:
+        badge_class, badge = 'badge-hp', 'HP ONLY'
+    return (f'<strong>{ammo_name} is {label}</strong> <span class="ammo-badge {badge_class}">{badge}</span> - '
+            f'Ranks #{rank} of {total} for {ammo_name} with {s[f"{prefix}_expected"]:.0f}ms expected TTK improvement '
+            f'({s[f"{prefix}_avg"]:.0f}ms average, {s[f"{prefix}_max"]:.0f}ms max)')
+
+
+def weapon_images(gun, weapon_class):
+    """Page image paths (relative to docs/) that the pipeline rendered for this gun"""
+    images = {
+        'ttkImage': f'visualizations/TTK_ANALYSIS/{weapon_class}/{gun}.png',
+        'ttkImage80HP': f'visualizations/TTK_ANALYSIS_80HP/{weapon_class}/{gun}.png',
+    }
+    for hs in (1, 2, 3):
+        images[f'rangeImage{hs}HS'] = f'visualizations/INDIVIDUAL_WEAPONS/{gun}_{hs}HS.png'
+    return {key: path for key, path in images.items() if os.path.exists(path)}
+
+
+def weapon_pictures():
+    """Picker picture (relative to docs/) by lower-case gun name; the file names' case varies"""
+    return {os.path.splitext(name)[0].lower(): f'pics/{name}' for name in os.listdir(PICS_DIR) if name.endswith('.png')}
+
+
+def weapon_entry(gun, weapon_class, picture, images, recommendations):
+    lines = [f'    {js_string(gun)}: {{', f'        weaponClass: {js_string(weapon_class)},']
+    if picture:
+        lines.append(f'        picture: {js_string(picture)},')
+    lines += [f'        {key}: {js_string(path)},' for key, path in images.items()]
+    lines.append('        recommendations: [')
+    lines.append(',\n'.join(f'            {js_string(text)}' for text in recommendations))
+    lines.append('        ]')
+    lines.append('    }')
+    return '\n'.join(lines)
+
+
+def weapon_entries(stats, notes):
+    """Entry text per published gun (those with a rendered TTK heatmap), grouped by class"""
+    pictures = weapon_pictures()
+    sections = {}
+    for gun in sorted(stats):
+        s = stats[gun]
+        if s['type'] not in CLASS_SECTIONS:
+            continue
+        images = weapon_images(gun, s['type'])
+        if 'ttkImage' not in images:
+            continue
+        recommendations = [summary_line(s)]
+        if gun in notes:
+            recommendations.append('<strong>Verdict:</strong> ' + notes[gun].format(**s))
+        sections.setdefault(s['type'], {})[gun] = weapon_entry(gun, s['type'], pictures.get(gun.lower()),
+                                                               images, recommendations)
+    return {weapon_class: sections[weapon_class] for weapon_class in CLASS_SECTIONS if weapon_class in sections}
+
+
+def render_file(sections):
+    """weapon-data.js: the picker's class headings, then every weapon entry in picker order"""
+    headings = ',\n'.join(f'    {js_string(weapon_class)}: {js_string(CLASS_SECTIONS[weapon_class])}'
+                           for weapon_class in sections)
+    blocks = []
+    for weapon_class, entries in sections.items():
+        blocks.append(f'    // {CLASS_SECTIONS[weapon_class]}\n' + ',\n'.join(entries.values()))
+    return ('const weaponClasses = {\n' + headings + '\n};\n\n'
+            'const weaponData = {\n' + ',\n\n'.join(blocks) + '\n};\n')
+
+
+def sync_images(sections):
+    """Copy rendered images the page references into docs/ when they changed; returns the count copied"""
+    copied = 0
+    for entries in sections.values():
+        for entry in entries.values():
+            for path in re.findall(r"^        \w+Image\w*: '(.*)',$", entry, re.M):
+                path = path.replace("\\'", "'").replace('\\\\', '\\')
+                target = os.path.join('docs', path)
+                if os.path.exists(target) and filecmp.cmp(path, target, shallow=False):
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.copyfile(path, target)
+                copied += 1
+    return copied
+
+
+if __name__ == '__main__':
+    with open(NOTES_PATH) as f:
+        notes = json.load(f)
+    stats = tierlist_stats(pd.read_csv(HP_TIERLIST), pd.read_csv(SYNTH_TIERLIST))
+    sections = weapon_entries(stats, notes)
+
+    old_entries = {}
+    if os.path.exists(WEAPON_DATA_JS):
+        with open(WEAPON_DATA_JS) as f:
+            old_text = f.read()
+        old_entries = {m.group('name'): m.group(0) for m in ENTRY_PATTERN.finditer(old_text)}
+    else:
+        old_text = None
+
+    # Entries whose data is unchanged keep their exact text; the file is only
+    # rewritten when at least one entry (or the set of weapons) changed
+    new_entries = {js_string(gun)[1:-1]: entry for entries in sections.values() for gun, entry in entries.items()}
+    changed = sorted(name for name, entry in new_entries.items() if old_entries.get(name) != entry)
+    removed = sorted(set(old_entries) - set(new_entries))
+    text = render_file(sections)
+    if text != old_text:
+        with open(WEAPON_DATA_JS + '.tmp', 'w') as f:
+            f.write(text)
+        os.replace(WEAPON_DATA_JS + '.tmp', WEAPON_DATA_JS)
+
+    print(f"{len(new_entries)} weapons: {len(changed)} updated ({', '.join(changed) or '-'}), "
+          f"{len(removed)} removed ({', '.join(removed) or '-'}), {len(new_entries) - len(changed)} unchanged")
+    print(f"{'Saved' if text != old_text else 'Up to date'}: {WEAPON_DATA_JS}")
+    print(f"Copied {sync_images(sections)} changed image(s) into docs/")
@@ -0,0 +1,133 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, features
+
+SITE_DIR = 'docs'
+WEAPON_DATA_JS = 'docs/weapon-data.js'
+PICS_DIR = 'docs/pics'
+MANIFEST_PATH = 'docs/image-variants.json'
+WIDTHS = [480, 1200, 2400]  # px; the page shows figures at up to 1200 CSS px
+# Encoder settings; AVIF speed 8 is ~5x faster than the default for ~25% larger files (still below WebP)
+ENCODE_OPTIONS = {'webp': {'quality': 80}, 'avif': {'quality': 60, 'speed': 8}}
+
+
+def available_formats():
+    """Modern formats this Pillow build can encode (AVIF needs Pillow built with libavif)"""
+    return [fmt for fmt in ENCODE_OPTIONS if features.check(fmt)]
+
+
+def variant_widths(width):
+    """Widths to emit for an image `width` px wide: each of WIDTHS, never upscaled"""
+    return sorted({min(w, width) for w in WIDTHS})
+
+
+def variant_path(path, width, fmt):
+    """srcset-ready name next to the source: 'KV9.png' -> 'KV9-480w.webp'"""
+    return f'{os.path.splitext(path)[0]}-{width}w.{fmt}'
+
+
+def source_key(path):
+    """Hash of the PNG's bytes and the encoder settings (what the variants were made from)"""
+    digest = hashlib.sha256(json.dumps([WIDTHS, ENCODE_OPTIONS], sort_keys=True).encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def read_manifest():
+    """Previous manifest, or an empty one on the first run"""
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def encode_variants(path, formats, key, previous_key=None, force=False):
+    """Write every width/format variant of one PNG; returns (widths, number of files written)
+
+    Variants are kept while the source key recorded in the manifest still
+    matches, so re-runs only encode images whose content or encoder
+    settings changed (file times don't matter, a fresh checkout encodes
+    nothing). Runs in a worker thread (Pillow's resize and encoders release
+    the GIL).
+    """
+    with Image.open(path) as image:
+        widths = variant_widths(image.width)
+        targets = [(w, fmt) for w in widths for fmt in formats]
+        todo = [(w, fmt) for w, fmt in targets
+                if force or key != previous_key or not os.path.exists(variant_path(path, w, fmt))]
+        if not todo:
+            return widths, 0
+        image.load()
+        # Largest first, each smaller width resized from the previous one
+        resized = image
+        for w in reversed(widths):
+            if w != resized.width:
+                resized = resized.resize((w, round(image.height * w / image.width)), Image.LANCZOS)
+            for fmt in formats:
+                if (w, fmt) in todo:
+                    out_path = variant_path(path, w, fmt)
+                    resized.save(out_path + '.tmp', format=fmt.upper(), **ENCODE_OPTIONS[fmt])
+                    os.replace(out_path + '.tmp', out_path)
+    return widths, len(todo)
+
+
+def build_variants(paths, workers=None, force=False):
+    """Encode variants for every path on a thread pool and write the manifest the page reads
+
+    Besides the formats and widths the page uses, the manifest records each
+    source's key (see source_key) for the next run's staleness check.
+    """
+    formats = available_formats()
+    names = [os.path.relpath(path, SITE_DIR).replace(os.sep, '/') for path in paths]
+    previous = read_manifest().get('sources', {})
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        keys = list(pool.map(source_key, paths))
+        results = list(pool.map(lambda args: encode_variants(args[0], formats, args[1], previous.get(args[2]), force),
+                                zip(paths, keys, names)))
+
+    manifest = {'formats': formats, 'images': {}, 'sources': {}}
+    for name, key, (widths, _) in zip(names, keys, results):
+        manifest['images'][name] = widths
+        manifest['sources'][name] = key
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'), sort_keys=True)
+    return manifest, sum(written for _, written in results)
+
+
+def site_images():
+    """PNGs the docs page shows: the figures weapon-data.js references and the weapon pictures"""
+    with open(WEAPON_DATA_JS) as f:
+        figures = re.findall(r"'(visualizations/[^']+\.png)'", f.read())
+    paths = {os.path.join(SITE_DIR, path) for path in figures} | set(glob.glob(os.path.join(PICS_DIR, '*.png')))
+    return sorted(path for path in paths if os.path.exists(path))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write resized WebP/AVIF variants of the docs images and their srcset manifest')
+    parser.add_argument('--workers', type=int, default=None, help='Encoder threads (default: one per CPU)')
+    parser.add_argument('--force', action='store_true', help='Re-encode every variant')
+    args = parser.parse_args()
+
+    paths = site_images()
+    start = time.perf_counter()
+    manifest, written = build_variants(paths, args.workers, args.force)
+    elapsed = time.perf_counter() - start
+
+    source_bytes = sum(os.path.getsize(p) for p in paths)
+    print(f"{len(paths)} images, formats: {', '.join(manifest['formats']) or 'none'}, "
+          f"{written} variant(s) written in {elapsed:.1f}s")
+    for fmt in manifest['formats']:
+        thumbs = [variant_path(p, manifest['images'][os.path.relpath(p, SITE_DIR).replace(os.sep, '/')][0], fmt)
+                  for p in paths]
+        print(f"Smallest {fmt} variants: {sum(map(os.path.getsize, thumbs)) / 1e6:.2f} MB "
+              f"(source PNGs {source_bytes / 1e6:.1f} MB)")
+    print(f"Saved: {MANIFEST_PATH}")
@@ -0,0 +1,173 @@
+import filecmp
+import hashlib
+import inspect
+import os
+import shutil
+import sys
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+from stage_trace import span
+
+CACHE_DIR = '.cache/renders'
+MAX_CACHE_MB = 1024  # Least recently used figures are evicted beyond this
+RENDER_CACHE_VERSION = 1  # Bump to invalidate every cached figure
+
+# Modules that don't affect what a figure looks like (instrumentation, this cache)
+UNHASHED_MODULES = {__name__, 'stage_trace'}
+
+_code_versions = {}
+_cache_bytes = None  # Running estimate of the cache size in this process (None until the first scan)
+
+
+def _update(digest, value):
+    """Feed a value into the hash in a stable, type-aware way"""
+    if isinstance(value, dict):
+        digest.update(b'dict')
+        for key in sorted(value, key=str):
+            _update(digest, key)
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(type(value).__name__.encode())
+        for item in value:
+            _update(digest, item)
+    elif isinstance(value, np.ndarray):
+        digest.update(f'ndarray{value.dtype.str}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(type(value).__name__.encode())
+        columns = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        _update(digest, [str(c) for c in columns])
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    else:
+        digest.update(f'{type(value).__name__}:{value!r}'.encode())
+    digest.update(b'|')
+
+
+def local_modules(module, found=None):
+    """Repo modules `module` uses, followed recursively: {name: source path}
+
+    Covers `import x` and `from x import y` (y's defining module), limited
+    to modules in the same directory as `module`, i.e. the repo's own code.
+    """
+    found = {} if found is None else found
+    repo_dir = os.path.dirname(os.path.abspath(module.__file__))
+    for value in list(vars(module).values()):
+        dep = value if inspect.ismodule(value) else sys.modules.get(getattr(value, '__module__', None) or '')
+        path = getattr(dep, '__file__', None)
+        if (path and dep.__name__ not in found and dep.__name__ not in UNHASHED_MODULES
+                and os.path.dirname(os.path.abspath(path)) == repo_dir):
+            found[dep.__name__] = path
+            local_modules(dep, found)
+    return found
+
+
+def code_version(render):
+    """Hash of the source of `render`'s module and every repo module it uses, plus the plotting library versions
+
+    Editing a helper the figure depends on (e.g. ttk_engine or a styling
+    function in another module) therefore invalidates its cached figures.
+    """
+    module = inspect.getmodule(render)
+    if module.__name__ not in _code_versions:
+        digest = hashlib.sha256(f'v{RENDER_CACHE_VERSION}'.encode())
+        sources = local_modules(module, {module.__name__: inspect.getsourcefile(render)})
+        for path in sorted(sources.values()):
+            digest.update(os.path.basename(path).encode())
+            with open(path, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        versions = [matplotlib.__version__, np.__version__]
+        try:
+            import seaborn
+            versions.append(seaborn.__version__)
+        except ImportError:
+            pass
+        digest.update(' '.join(versions).encode())
+        _code_versions[module.__name__] = digest.hexdigest()
+    return _code_versions[module.__name__]
+
+
+def render_key(render, *args, **kwargs):
+    """Cache key for render(*args, **kwargs): its inputs, styling arguments and code version"""
+    digest = hashlib.sha256(code_version(render).encode())
+    _update(digest, render.__qualname__)
+    _update(digest, list(args))
+    _update(digest, kwargs)
+    return digest.hexdigest()[:32]
+
+
+def evict(max_bytes=MAX_CACHE_MB * 1024 * 1024):
+    """Delete least recently used cached figures until the cache fits in max_bytes; returns the size left"""
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith('.tmp'):
+            continue  # Still being written by a worker
+        try:
+            stat = os.stat(os.path.join(CACHE_DIR, name))
+        except FileNotFoundError:
+            continue  # Evicted by another worker
+        entries.append((stat.st_mtime, stat.st_size, name))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(CACHE_DIR, name))
+        except FileNotFoundError:
+            pass
+        total -= size
+    return total
+
+
+def _track_size(added_bytes, max_bytes=MAX_CACHE_MB * 1024 * 1024):
+    """Count a new cache entry; scan the cache directory only once per process or when past the limit"""
+    global _cache_bytes
+    if _cache_bytes is not None:
+        _cache_bytes += added_bytes
+    if _cache_bytes is None or _cache_bytes > max_bytes:
+        _cache_bytes = evict(max_bytes)
+
+
+def cached_render(render, output_path, *args, use_cache=True, **kwargs):
+    """Call render(*args, **kwargs) (which writes output_path) only on a cache miss
+
+    Figures are stored under .cache/renders/ by a hash of the render
+    function's arguments and code version. On a hit the cached file is
+    copied to output_path (or left alone if it is already identical).
+    Returns True if the figure was rendered, False if it came from the cache.
+    """
+    with span('cached_render', 'figure', path=output_path) as trace_args:
+        trace_args['rendered'] = _cached_render(render, output_path, *args, use_cache=use_cache, **kwargs)
+    return trace_args['rendered']
+
+
+def _cached_render(render, output_path, *args, use_cache=True, **kwargs):
+    if not use_cache:
+        render(*args, **kwargs)
+        return True
+
+    key = render_key(render, *args, **kwargs)
+    cached_path = os.path.join(CACHE_DIR, key + os.path.splitext(output_path)[1])
+
+    if os.path.exists(cached_path):
+        try:
+            os.utime(cached_path)  # Mark as recently used
+            if not (os.path.exists(output_path) and filecmp.cmp(cached_path, output_path, shallow=False)):
+                shutil.copyfile(cached_path, output_path)
+            return False
+        except FileNotFoundError:
+            pass  # Evicted between the check and the copy; render it again
+
+    render(*args, **kwargs)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f'{cached_path}.{os.getpid()}.tmp'
+    shutil.copyfile(output_path, tmp_path)
+    os.replace(tmp_path, cached_path)
+    _track_size(os.path.getsize(cached_path))
+    return True
@@ -0,0 +1,361 @@
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from stage_trace import MEMORY_ENV, PROFILE_DIR, TRACE_ENV, TRACE_PATH, hottest_stage, read_events, summarize, write_trace
+from weapon_data import AMMO_TYPES_PATH, CACHE_DIR, DATA_DIR, STK_CATEGORIES_PATH, source_paths
+
+STATE_PATH = os.path.join(os.path.dirname(CACHE_DIR), 'pipeline', 'state.json')
+
+DATA = source_paths()
+AMMO_TYPES = AMMO_TYPES_PATH
+STK_CATEGORIES = STK_CATEGORIES_PATH
+
+# Hand-maintained inputs live here; every other input must be some stage's output
+SOURCE_DIRS = [DATA_DIR, 'docs/pics']
+
+# Data files read by shared modules (added to every stage that imports them)
+MODULE_INPUTS = {
+    'weapon_registry.py': sorted(DATA.values()),
+}
+
+# Pipeline stages: each reads `inputs` and writes `outputs` (glob patterns allowed).
+# The script itself and the local modules it imports are tracked automatically.
+STAGES = [
+    {'name': 'extract_ammo_types', 'script': 'extract_ammo_types.py',
+     'inputs': [DATA['stat_card']],
+     'outputs': [AMMO_TYPES]},
+    {'name': 'categorize_stk', 'script': 'categorize_stk_with_one_headshot.py',
+     'inputs': [DATA['weapon_type']],
+     'outputs': [STK_CATEGORIES]},
+    {'name': 'verify_ammo_types', 'script': 'verify_ammo_types.py',
+     'inputs': [DATA['stat_card'], AMMO_TYPES, STK_CATEGORIES],
+     'outputs': []},
+    {'name': 'ttk_tierlist', 'script': 'create_ttk_tierlist.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES, 'data/map_profiles.json'],
+     'outputs': ['analysis_results/HP_Tierlist.csv', 'analysis_results/Synth_Tierlist.csv',
+                 'analysis_results/Map_Tierlists.csv', 'analysis_results/TIERLIST_SUMMARY.md']},
+    {'name': 'ttk_analysis', 'script': 'analyze_ttk_all_weapons.py',
+     'inputs': [DATA['falloff'], DATA['weapon_type'], AMMO_TYPES],
+     'outputs': ['visualizations/TTK_ANALYSIS/*/*.png', 'visualizations/TTK_ANALYSIS_80HP/*/*.png']},
+    {'name': 'engagement_sim', 'script': 'engagement_sim.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES],
+     'outputs': ['analysis_results/Engagement_Simulation.csv']},
+    {'name': 'duel_matrix', 'script': 'duel_matrix.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES],
+     'outputs': ['analysis_results/Duel_Matrix.npz', 'analysis_results/Duel_Crossovers.csv']},
+    {'name': 'ttk_index', 'script': 'ttk_index.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES],
+     'outputs': ['analysis_results/TTK_Index.npz']},
+    {'name': 'web_data', 'script': 'export_web_data.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES,
+                STK_CATEGORIES],
+     'outputs': ['docs/weapon-bundle.json']},
+    {'name': 'ttk_improvements', 'script': 'analyze_ttk_improvements.py',
+     'inputs': [DATA['falloff'], DATA['weapon_type'], AMMO_TYPES],
+     'outputs': ['visualizations/TTK_Analysis_DRS-IAR.png', 'analysis_results/TTK_Analysis_DRS-IAR.csv']},
+    {'name': 'range_circles_by_btk', 'script': 'visualize_shot_combos.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES, STK_CATEGORIES],
+     'outputs': ['visualizations/BY_BTK/*_Range_Circles_100m.png',
+                 'analysis_results/*Shot_*_Range_Analysis_100m.csv']},
+    {'name': 'range_circles_by_class', 'script': 'visualize_by_weapon_class.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES, STK_CATEGORIES],
+     'outputs': ['visualizations/BY_CLASS/*_Range_Circles_100m.png',
+                 'analysis_results/[ACLS]*_*HS_Range_Analysis_100m.csv']},
+    {'name': 'range_circles_80hp', 'script': 'visualize_range_circles_80hp.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES, STK_CATEGORIES],
+     'outputs': ['visualizations/BY_BTK/*_Range_Circles_100m_80HP.png',
+                 'analysis_results/*Shot_*_Range_Analysis_100m_80HP.csv']},
+    {'name': 'weapon_data_js', 'script': 'generate_weapon_data_js.py',
+     'inputs': ['analysis_results/HP_Tierlist.csv', 'analysis_results/Synth_Tierlist.csv', 'data/weapon_notes.json',
+                'visualizations/TTK_ANALYSIS/*/*.png', 'visualizations/TTK_ANALYSIS_80HP/*/*.png',
+                'visualizations/INDIVIDUAL_WEAPONS/*_*HS.png'],
+     'outputs': ['docs/weapon-data.js', 'docs/visualizations/*/*.png', 'docs/visualizations/*/*/*.png']},
+    {'name': 'image_variants', 'script': 'image_variants.py',
+     'inputs': ['docs/weapon-data.js', 'docs/pics/*.png', 'docs/visualizations/*/*.png',
+                'docs/visualizations/*/*/*.png'],
+     'outputs': ['docs/image-variants.json']},
+    {'name': 'damage_falloff', 'script': 'visualize_damage_falloff.py',
+     'inputs': [DATA['falloff']],
+     'outputs': ['visualizations/Damage_Falloff_*.png']},
+    {'name': 'weapon_circles', 'script': 'visualize_individual_weapon_circles.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES],
+     # <gun>.png only: the *_<n>HS.png figures beside them belong to weapon_circles_by_hs
+     'outputs': ['visualizations/INDIVIDUAL_WEAPONS/*[!S].png']},
+    {'name': 'weapon_circles_by_hs', 'script': 'visualize_individual_weapon_circles_fixed.py',
+     'inputs': [DATA['falloff'], AMMO_TYPES,
+                STK_CATEGORIES],
+     'outputs': ['visualizations/INDIVIDUAL_WEAPONS/*_*HS.png']},
+]
+
+_file_hashes = {}
+
+
+def file_hash(path):
+    """sha256 of a file's content (memoized per run)"""
+    if path not in _file_hashes:
+        with open(path, 'rb') as f:
+            _file_hashes[path] = hashlib.sha256(f.read()).hexdigest()
+    return _file_hashes[path]
+
+
+def local_imports(script, seen=None):
+    """Local .py modules a script imports, followed recursively"""
+    seen = set() if seen is None else seen
+    with open(script) as f:
+        names = re.findall(r'^\s*(?:from|import)\s+(\w+)', f.read(), re.M)
+    for name in names:
+        module = f'{name}.py'
+        if module not in seen and os.path.exists(module):
+            seen.add(module)
+            local_imports(module, seen)
+    return seen
+
+
+def stage_inputs(stage):
+    """Every file a stage depends on: declared inputs, its script and local modules"""
+    code = sorted({stage['script']} | local_imports(stage['script']))
+    inputs = set(stage['inputs'])
+    for module in code:
+        inputs.update(MODULE_INPUTS.get(module, []))
+    return code + sorted(inputs)
+
+
+def fingerprint(stage):
+    """Hash of the content of every input (None if an input is missing)
+
+    Glob inputs (e.g. another stage's rendered figures) cover every
+    matching file and count as missing when nothing matches.
+    """
+    digest = hashlib.sha256()
+    for pattern in stage_inputs(stage):
+        paths = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not paths or not os.path.exists(paths[0]):
+            return None
+        for path in paths:
+            digest.update(path.encode())
+            digest.update(file_hash(path).encode())
+    return digest.hexdigest()[:16]
+
+
+def outputs_exist(stage):
+    """True if every declared output pattern matches at least one file"""
+    return all(glob.glob(pattern) for pattern in stage['outputs'])
+
+
+def producers(stages):
+    """Output pattern -> name of the stage that writes it"""
+    return {pattern: stage['name'] for stage in stages for pattern in stage['outputs']}
+
+
+def producer_of(path, by_output):
+    """Stage writing an input: same pattern, or an output pattern matching a plain path (None for sources)"""
+    if path in by_output:
+        return by_output[path]
+    if not glob.has_magic(path):
+        for pattern, name in by_output.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return name
+    return None
+
+
+def check_inputs(stages):
+    """Fail on inputs no stage produces that aren't source files (e.g. a misspelled output path)"""
+    by_output = producers(stages)
+    orphans = [f"{stage['name']}: {path}" for stage in stages for path in stage['inputs']
+               if producer_of(path, by_output) is None
+               and not any(path.startswith(source_dir + '/') for source_dir in SOURCE_DIRS)]
+    if orphans:
+        raise SystemExit("Inputs that no stage produces and that aren't under "
+                         f"{', '.join(SOURCE_DIRS)}:\n  " + '\n  '.join(orphans))
+
+
+def stage_order(stages):
+    """Stages sorted so each runs after the stages that write its inputs"""
+    by_output = producers(stages)
+    by_name = {stage['name']: stage for stage in stages}
+
+    ordered, visiting = [], set()
+
+    def visit(name):
+        if name in visiting or any(s['name'] == name for s in ordered):
+            return
+        visiting.add(name)
+        for path in by_name[name]['inputs']:
+            producer = producer_of(path, by_output)
+            if producer and producer != name:
+                visit(producer)
+        ordered.append(by_name[name])
+
+    for stage in stages:
+        visit(stage['name'])
+    return ordered
+
+
+def with_upstream(stages, names):
+    """The named stages plus every stage they (transitively) read outputs from"""
+    by_output = producers(stages)
+    by_name = {stage['name']: stage for stage in stages}
+    selected, todo = set(), list(names)
+    while todo:
+        name = todo.pop()
+        if name in selected:
+            continue
+        if name not in by_name:
+            raise SystemExit(f"Unknown stage '{name}' (see --list)")
+        selected.add(name)
+        todo.extend(producer for producer in (producer_of(path, by_output) for path in by_name[name]['inputs'])
+                    if producer and producer != name)
+    return [stage for stage in stages if stage['name'] in selected]
+
+
+def load_state():
+    if os.path.exists(STATE_PATH):
+        with open(STATE_PATH) as f:
+            return json.load(f)
+    return {}
+
+
+def save_state(state):
+    os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
+    with open(STATE_PATH + '.tmp', 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(STATE_PATH + '.tmp', STATE_PATH)
+
+
+def run_stage(stage, trace_dir=None, profile_path=None):
+    """Run a stage's script from the repo root (non-interactive matplotlib backend)
+
+    With trace_dir the script runs under stage_trace.py, which writes its
+    timing events there (and a cProfile dump to profile_path if given).
+    """
+    for pattern in stage['outputs']:
+        out_dir = os.path.dirname(pattern)
+        if out_dir and not glob.has_magic(out_dir):
+            os.makedirs(out_dir, exist_ok=True)
+    env = dict(os.environ)
+    env.setdefault('MPLBACKEND', 'Agg')
+    command = [sys.executable, stage['script']]
+    if trace_dir:
+        env[TRACE_ENV] = trace_dir
+        command = [sys.executable, 'stage_trace.py', '--stage', stage['name']]
+        if profile_path:
+            command += ['--profile', profile_path]
+        command.append(stage['script'])
+    return subprocess.run(command, env=env).returncode
+
+
+def run_pipeline(names=None, force=False, dry_run=False, trace=False, profile=None):
+    """Run stages whose inputs changed since their last successful run
+
+    A stage re-runs when the content fingerprint of its inputs differs from
+    the one recorded after its last successful run, or when one of its
+    outputs is missing. Stages run in dependency order, so a stage that
+    rewrites a file (e.g. Weapon_Ammo_Types.csv) is fingerprinted before
+    the stages reading it are checked; if the rewrite is byte-identical
+    they stay up to date.
+
+    trace=True records per-stage and per-figure timings into TRACE_PATH
+    (Chrome trace-event JSON); profile names a stage ('hottest' = the
+    slowest stage of the previous trace) to also run under cProfile.
+    """
+    check_inputs(STAGES)
+    stages = stage_order(STAGES)
+    if names:
+        stages = with_upstream(stages, names)
+    state = load_state()
+
+    if profile not in (None, 'hottest') and profile not in {stage['name'] for stage in STAGES}:
+        raise SystemExit(f"Unknown stage '{profile}' (see --list)")
+    if profile == 'hottest':
+        profile = hottest_stage()
+        if profile is None:
+            print(f"No previous trace at {TRACE_PATH}; run with --trace first to find the hottest stage")
+        else:
+            print(f"Profiling the hottest stage of the last trace: {profile}")
+    trace_dir = tempfile.mkdtemp(prefix='bf6-trace-') if (trace or profile) and not dry_run else None
+
+    ran, skipped = [], []
+    for stage in stages:
+        name = stage['name']
+        current = fingerprint(stage)
+        stale = force or current is None or state.get(name) != current or not outputs_exist(stage)
+        if not stale:
+            skipped.append(name)
+            print(f"[up to date] {name}")
+            continue
+
+        print(f"[run] {name} ({stage['script']})")
+        if dry_run:
+            ran.append(name)
+            continue
+
+        start = time.perf_counter()
+        profile_path = os.path.join(PROFILE_DIR, f'{name}.prof') if name == profile else None
+        returncode = run_stage(stage, trace_dir, profile_path)
+        if returncode != 0:
+            state.pop(name, None)
+            save_state(state)
+            save_trace(trace_dir)
+            raise SystemExit(f"Stage '{name}' failed with exit code {returncode}")
+
+        # Outputs of this stage may be inputs of the next ones
+        for pattern in stage['outputs']:
+            for path in glob.glob(pattern):
+                _file_hashes.pop(path, None)
+        state[name] = fingerprint(stage)
+        save_state(state)
+        ran.append(name)
+        print(f"[done] {name} in {time.perf_counter() - start:.1f}s")
+
+    print(f"\n{len(ran)} stage(s) {'would run' if dry_run else 'ran'}, {len(skipped)} up to date")
+    save_trace(trace_dir)
+    return ran
+
+
+def save_trace(trace_dir):
+    """Merge the stages' event files into TRACE_PATH and print where the time went"""
+    if not trace_dir:
+        return
+    events = read_events(trace_dir)
+    shutil.rmtree(trace_dir, ignore_errors=True)
+    if not events:
+        print("Nothing ran, so no trace was written (use --force to trace up-to-date stages)")
+        return
+    write_trace(events)
+    summarize(events)
+    print(f"\nSaved trace: {TRACE_PATH} (open in ui.perfetto.dev or chrome://tracing)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the analysis scripts, re-running only stages whose inputs changed')
+    parser.add_argument('stages', nargs='*', help='Stages to bring up to date (default: all)')
+    parser.add_argument('--force', action='store_true', help='Re-run the selected stages even if up to date')
+    parser.add_argument('--dry-run', action='store_true', help='Only print what would run')
+    parser.add_argument('--list', action='store_true', help='List stages with their inputs and outputs')
+    parser.add_argument('--trace', action='store_true',
+                        help=f'Record wall/CPU time and peak memory per stage and figure to {TRACE_PATH}')
+    parser.add_argument('--memory', action='store_true',
+                        help='With --trace, also track peak Python/NumPy allocations per span (tracemalloc; slower)')
+    parser.add_argument('--profile', nargs='?', const='hottest', metavar='STAGE',
+                        help=f'Run STAGE (default: the slowest stage of the last trace) under cProfile, dump to {PROFILE_DIR}/')
+    args = parser.parse_args()
+    if args.memory:
+        os.environ[MEMORY_ENV] = '1'
+
+    if args.list:
+        for stage in stage_order(STAGES):
+            print(f"{stage['name']} ({stage['script']})")
+            print(f"  inputs:  {', '.join(stage_inputs(stage))}")
+            print(f"  outputs: {', '.join(stage['outputs']) or '-'}")
+    else:
+        run_pipeline(args.stages, force=args.force, dry_run=args.dry_run, trace=args.trace, profile=args.profile)
@@ -0,0 +1,273 @@
+import argparse
+import contextlib
+import functools
+import glob
+import json
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+TRACE_ENV = 'BF6_TRACE_DIR'  # Set (to a directory for per-process event files) to turn tracing on
+MEMORY_ENV = 'BF6_TRACE_MEMORY'  # Set to also track per-span peak Python/NumPy allocations (tracemalloc)
+TRACE_PATH = 'analysis_results/Pipeline_Trace.json'
+PROFILE_DIR = 'analysis_results/profiles'
+
+ENABLED = bool(os.environ.get(TRACE_ENV))
+_events_file = None
+_events_pid = None
+_lock = threading.Lock()
+_peaks = []  # [allocated at start, running peak] of every open span, innermost last
+
+
+def _max_rss_mb():
+    """Peak resident memory of this process, or None where the resource module is missing (Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB on Linux
+
+
+def _emit(event):
+    """Append one event to this process's file (opened per pid, so forked workers get their own)"""
+    global _events_file, _events_pid
+    with _lock:
+        if _events_pid != os.getpid():
+            _events_file = open(os.path.join(os.environ[TRACE_ENV], f'{os.getpid()}.jsonl'), 'a')
+            _events_pid = os.getpid()
+        # Written through at once: pool workers exit without running atexit handlers
+        _events_file.write(json.dumps(event) + '\n')
+        _events_file.flush()
+
+
+def record(name, cat, start, wall_s, cpu_s, rss_before_mb, peak_alloc_mb=None, **args):
+    """Emit a Chrome trace 'complete' event; start is a time.time() timestamp"""
+    rss_mb = _max_rss_mb()
+    args.update({'cpu_ms': round(cpu_s * 1000, 2), 'max_rss_mb': None if rss_mb is None else round(rss_mb, 1),
+                 'rss_growth_mb': None if rss_mb is None else round(rss_mb - rss_before_mb, 1)})
+    if peak_alloc_mb is not None:
+        args['peak_alloc_mb'] = round(peak_alloc_mb, 1)  # Above what was allocated when the span began
+    _emit({'name': name, 'cat': cat, 'ph': 'X', 'ts': round(start * 1e6), 'dur': round(wall_s * 1e6),
+           'pid': os.getpid(), 'tid': threading.get_native_id(), 'args': args})
+
+
+@contextlib.contextmanager
+def span(name, cat='stage', **args):
+    """Time the block as one trace event: wall, CPU, max RSS growth (and peak allocations if enabled)
+
+    Does nothing unless tracing is on. `args` are stored with the event;
+    yields that dict so the block can add results (e.g. cache hit/miss).
+    """
+    if not ENABLED:
+        yield args
+        return
+    tracing_memory = _memory_tracing()
+    if tracing_memory:
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        if _peaks:
+            _peaks[-1][1] = max(_peaks[-1][1], peak)
+        tracemalloc.reset_peak()
+        _peaks.append([current, current])
+    start, wall, cpu, rss = time.time(), time.perf_counter(), time.process_time(), _max_rss_mb()
+    try:
+        yield args
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        peak_mb = None
+        if tracing_memory:
+            start_allocated, peak = _peaks.pop()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            if _peaks:
+                _peaks[-1][1] = max(_peaks[-1][1], peak)
+            peak_mb = (peak - start_allocated) / 2**20
+        record(name, cat, start, wall, cpu, rss, peak_mb, **args)
+
+
+def traced(cat):
+    """Decorator: run the function inside a span named after it (returns it untouched when tracing is off)"""
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(func.__name__, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _memory_tracing():
+    if not os.environ.get(MEMORY_ENV):
+        return False
+    import tracemalloc
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    return True
+
+
+def install_figure_hooks(seaborn=True):
+    """Trace every figure: its lifetime up to savefig, seaborn heatmaps and savefig itself
+
+    Scripts that call plt.savefig directly get per-figure events without
+    any change: the figure's creation time is stamped on it and a
+    'figure' event covering creation..save is emitted after each save.
+    """
+    import matplotlib.figure
+
+    figure_init = matplotlib.figure.Figure.__init__
+    figure_savefig = matplotlib.figure.Figure.savefig
+
+    @functools.wraps(figure_init)
+    def init(self, *args, **kwargs):
+        self._trace_start = (time.time(), time.perf_counter(), time.process_time(), _max_rss_mb())
+        figure_init(self, *args, **kwargs)
+
+    @functools.wraps(figure_savefig)
+    def savefig(self, fname, *args, **kwargs):
+        path = os.fspath(fname) if isinstance(fname, (str, os.PathLike)) else type(fname).__name__
+        with span('savefig', 'matplotlib', path=path, dpi=kwargs.get('dpi', 'figure')):
+            result = figure_savefig(self, fname, *args, **kwargs)
+        if hasattr(self, '_trace_start'):
+            start, wall, cpu, rss = self._trace_start
+            record('figure', 'figure', start, time.perf_counter() - wall, time.process_time() - cpu, rss, path=path)
+        return result
+
+    matplotlib.figure.Figure.__init__ = init
+    matplotlib.figure.Figure.savefig = savefig
+
+    if seaborn:
+        import seaborn as sns
+        sns_heatmap = sns.heatmap
+
+        @functools.wraps(sns_heatmap)
+        def heatmap(data, *args, **kwargs):
+            with span('sns.heatmap', 'seaborn', annot=bool(kwargs.get('annot'))):
+                return sns_heatmap(data, *args, **kwargs)
+
+        sns.heatmap = heatmap
+
+
+def read_events(trace_dir):
+    events = []
+    for path in sorted(glob.glob(os.path.join(trace_dir, '*.jsonl'))):
+        with open(path) as f:
+            events.extend(json.loads(line) for line in f if line.strip())
+    return events
+
+
+def write_trace(events, path=TRACE_PATH):
+    """Chrome trace-event JSON (open in chrome://tracing or ui.perfetto.dev), events in time order"""
+    names = {}
+    for event in events:
+        if event['cat'] == 'stage':
+            names.setdefault(event['pid'], event['name'])
+    main_pids = set(names)
+    for event in events:
+        if event['pid'] not in names:
+            # Pool workers: name them after the stage that was running when they started
+            parents = [e for e in events if e['cat'] == 'stage' and e['ts'] <= event['ts'] <= e['ts'] + e['dur']]
+            names[event['pid']] = f"{parents[0]['name']} worker" if parents else 'worker'
+    metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': name}}
+                for pid, name in names.items()]
+    metadata += [{'name': 'process_sort_index', 'ph': 'M', 'pid': pid, 'args': {'sort_index': int(pid not in main_pids)}}
+                 for pid in names]
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'traceEvents': metadata + sorted(events, key=lambda e: e['ts']), 'displayTimeUnit': 'ms'}, f)
+    os.replace(path + '.tmp', path)
+
+
+def summarize(events, top=15):
+    """Print wall/CPU totals per stage and per event name (figure parts summed across workers)"""
+    stages = sorted((e for e in events if e['cat'] == 'stage'), key=lambda e: -e['dur'])
+    if stages:
+        print(f"\n{'Stage':32} {'Wall (s)':>9} {'CPU (s)':>9} {'Max RSS (MB)':>13}")
+        for e in stages:
+            rss = e['args']['max_rss_mb']
+            print(f"{e['name']:32} {e['dur'] / 1e6:9.2f} {e['args']['cpu_ms'] / 1000:9.2f} "
+                  f"{'-' if rss is None else f'{rss:.0f}':>13}")
+
+    totals = {}
+    for e in events:
+        if e['cat'] != 'stage':
+            total = totals.setdefault((e['cat'], e['name']), [0, 0.0, 0.0])
+            total[0] += 1
+            total[1] += e['dur'] / 1e3
+            total[2] += e['args']['cpu_ms']
+    if totals:
+        print(f"\n{'Event':40} {'Count':>7} {'Wall (ms)':>11} {'CPU (ms)':>11}")
+        for (cat, name), (count, wall_ms, cpu_ms) in sorted(totals.items(), key=lambda item: -item[1][1])[:top]:
+            print(f"{cat + ':' + name:40} {count:7d} {wall_ms:11.1f} {cpu_ms:11.1f}")
+
+
+def hottest_stage(path=TRACE_PATH):
+    """Name of the slowest stage in a previous trace (None if there is none)"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        stages = [e for e in json.load(f)['traceEvents'] if e.get('cat') == 'stage']
+    return max(stages, key=lambda e: e['dur'])['name'] if stages else None
+
+
+def run_script(script, script_args, stage_name=None, profile_path=None):
+    """Run a script as __main__ inside a 'stage' span (with figure hooks, optionally under cProfile)"""
+    with open(script) as f:
+        source = f.read()
+    sys.argv = [script] + list(script_args)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    with span(stage_name or os.path.splitext(os.path.basename(script))[0], 'stage', script=script):
+        if 'matplotlib' in source or 'seaborn' in source or 'render_cache' in source:
+            install_figure_hooks(seaborn='seaborn' in source)
+        if profile_path is None:
+            runpy.run_path(script, run_name='__main__')
+            return
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(runpy.run_path, script, run_name='__main__')
+        finally:
+            os.makedirs(os.path.dirname(profile_path) or '.', exist_ok=True)
+            profiler.dump_stats(profile_path)
+            print(f"\nSaved profile: {profile_path} (top functions by cumulative time)")
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Run an analysis/visualization script with timing instrumentation and write a Chrome trace')
+    parser.add_argument('script', help='Script to run, followed by its own arguments')
+    parser.add_argument('script_args', nargs=argparse.REMAINDER)
+    parser.add_argument('--stage', help='Stage name for the trace (default: the script name)')
+    parser.add_argument('--profile', metavar='PATH', help='Also run under cProfile and dump the stats here')
+    parser.add_argument('--memory', action='store_true',
+                        help='Track peak Python/NumPy allocations per span (tracemalloc; slows the run)')
+    parser.add_argument('--output', default=TRACE_PATH, help=f'Trace file (default: {TRACE_PATH})')
+    args = parser.parse_args()
+
+    if args.memory:
+        os.environ[MEMORY_ENV] = '1'
+    # Inside `run_pipeline.py --trace` the pipeline collects and writes the trace
+    standalone = not os.environ.get(TRACE_ENV)
+    if standalone:
+        os.environ[TRACE_ENV] = tempfile.mkdtemp(prefix='bf6-trace-')
+    ENABLED = True
+    # One module instance: `import stage_trace` in the traced code gets this one
+    sys.modules['stage_trace'] = sys.modules[__name__]
+
+    try:
+        run_script(args.script, args.script_args, args.stage, args.profile)
+    finally:
+        if standalone:
+            trace_dir = os.environ[TRACE_ENV]
+            events = read_events(trace_dir)
+            write_trace(events, args.output)
+            shutil.rmtree(trace_dir, ignore_errors=True)
+            summarize(events)
+            print(f"\nSaved trace: {args.output}")
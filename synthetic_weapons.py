@@ -0,0 +1,270 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from ttk_engine import BASE_HS_MULT, HP_MULT, STAT_CARD_RANGES, SYNTH_MULT, TARGET_HP, extrapolate_damage
+from weapon_data import AMMO_TYPES_PATH, SOURCES, STK_CATEGORIES_PATH, source_paths
+
+CONFIG_PATH = 'data/synthetic_weapons.json'
+WORKSPACE_DIR = '.cache/synthetic'
+SEED = 0
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_config(path=CONFIG_PATH):
+    """Generator settings: class mix, damage tiers (with ROF ranges), falloff shapes and ammo split
+
+    Shares are relative weights (they need not sum to 1). Raises ValueError
+    if a class refers to a falloff shape that isn't defined.
+    """
+    with open(path) as f:
+        config = json.load(f)
+    for name, weapon_class in config['classes'].items():
+        for shape in weapon_class['falloff_shapes']:
+            if shape not in config['falloff_shapes']:
+                raise ValueError(f"Class '{name}': unknown falloff shape '{shape}'")
+    return config
+
+
+def _choose(rng, weights, size):
+    """Keys of `weights` drawn `size` times with probability proportional to their weight"""
+    keys = list(weights)
+    p = np.array([weights[key] for key in keys], dtype=float)
+    return np.array(keys, dtype=object)[rng.choice(len(keys), size=size, p=p / p.sum())]
+
+
+def generate_weapons(num_weapons, config=None, seed=SEED):
+    """num_weapons random guns, one row each, in the ttk_weapons() column layout
+
+    Columns: Gun, Type, DMG_Close, DMG_10M, DMG_75M, ROF, Velocity,
+    Ammo Type, plus the DPS chart's Sheet Type and Precision. Damage is
+    whole numbers like the sheets; the same seed gives the same table.
+    """
+    config = config or load_config()
+    rng = np.random.default_rng(seed)
+
+    classes = _choose(rng, {name: c['share'] for name, c in config['classes'].items()}, num_weapons)
+    tiers = _choose(rng, {tier: t['share'] for tier, t in config['damage_tiers'].items()}, num_weapons)
+    shapes = np.empty(num_weapons, dtype=object)
+    velocity = np.empty(num_weapons, dtype=int)
+    rof = np.empty(num_weapons, dtype=int)
+    for name, weapon_class in config['classes'].items():
+        rows = np.flatnonzero(classes == name)
+        shapes[rows] = _choose(rng, weapon_class['falloff_shapes'], len(rows))
+        velocity[rows] = rng.integers(weapon_class['velocity'][0], weapon_class['velocity'][1] + 1, size=len(rows))
+    for tier, damage_tier in config['damage_tiers'].items():
+        rows = np.flatnonzero(tiers == tier)
+        rof[rows] = rng.integers(damage_tier['rof'][0], damage_tier['rof'][1] + 1, size=len(rows))
+
+    close = tiers.astype(int)
+    fractions = np.array([config['falloff_shapes'][shape] for shape in shapes], dtype=float).reshape(-1, 2)
+    width = len(str(num_weapons - 1))
+    return pd.DataFrame({
+        'Gun': [f'SYN-{i:0{width}d}' for i in range(num_weapons)],
+        'Type': classes,
+        'DMG_Close': close,
+        'DMG_10M': np.round(close * fractions[:, 0]).astype(int),
+        'DMG_75M': np.round(close * fractions[:, 1]).astype(int),
+        'ROF': rof,
+        'Velocity': velocity,
+        'Ammo Type': _choose(rng, config['ammo'], num_weapons),
+        'Sheet Type': np.array([config['classes'][name]['sheet_type'] for name in classes], dtype=object),
+        'Precision': rng.integers(config['precision'][0], config['precision'][1] + 1, size=num_weapons),
+    })
+
+
+def _shots(damage, mult=1.0):
+    """Shots to kill TARGET_HP at `damage` per body shot times `mult`"""
+    return np.ceil(TARGET_HP / (damage * mult))
+
+
+def _ttk_s(stk, rof):
+    return np.round((stk - 1) * 60 / rof, 3)
+
+
+def _percent(part, whole):
+    return [f'{p:.0f}%' for p in np.round(100 * part / whole)]
+
+
+def falloff_values(weapons):
+    """Falloff sheet cells by column header, filled the way the sheet derives them"""
+    close, d10, d75 = weapons['DMG_Close'].values, weapons['DMG_10M'].values, weapons['DMG_75M'].values
+    rof, velocity = weapons['ROF'].values, weapons['Velocity'].values
+    avg = np.round((close + d10 + d75) / 3).astype(int)
+    ttk_ms = lambda damage: np.round((_shots(damage) - 1) * 60000 / rof).astype(int)
+    return {
+        'Gun (!!! -> Missing)': weapons['Gun'].values,
+        'Type': weapons['Type'].values,
+        'Velocity': velocity,
+        'ROF': rof,
+        'Dmg': close,
+        '10m': d10,
+        '75m': d75,
+        'Avg Dmg': avg,
+        'TTK (ms)': ttk_ms(close),
+        'TTK 10m (ms)': ttk_ms(d10),
+        'TTK 75m (ms)': ttk_ms(d75),
+        'TTK Avg (ms)': ttk_ms(avg),
+        'TTK + MVel 10m': ttk_ms(d10) + np.round(10 / velocity * 1000).astype(int),
+        'TTK + MVel 75m': ttk_ms(d75) + np.round(75 / velocity * 1000).astype(int),
+        '10m %': _percent(d10, close),
+        '75m %': _percent(d75, close),
+        ' 0-10m % Drop': _percent(close - d10, close),
+        '10-75m % Drop': _percent(d10 - d75, d10),
+        '0-75m % Drop': _percent(close - d75, close),
+    }
+
+
+def dps_chart_values(weapons):
+    """DPS chart cells (Stat Card and the three ranking sheets) by column header"""
+    close, rof = weapons['DMG_Close'].values, weapons['ROF'].values
+    mult = np.where(weapons['Ammo Type'].values == 'Synthetic', SYNTH_MULT, HP_MULT)
+    ammo_stk, base_hs_stk, body_stk = _shots(close, mult), _shots(close, BASE_HS_MULT), _shots(close)
+    values = {
+        'Gun': weapons['Gun'].values,
+        'Type': weapons['Sheet Type'].values,
+        'DMG': close,
+        'ROF': rof,
+        'Precision': weapons['Precision'].values,
+        'Max Precision +-1': weapons['Precision'].values + 2,
+        'Stat Card DMG/0M?': close,
+        # Stat Card Values
+        'Syn/HP': close * mult,
+        'HS STK (with Syn/HP)': ammo_stk,
+        'HS TTK (with Syn/HP)': _ttk_s(ammo_stk, rof),
+        'Base HS STK': base_hs_stk.astype(int),
+        'Base HS TTK': _ttk_s(base_hs_stk, rof),
+        'Body STK': body_stk.astype(int),
+        'Body TTK': _ttk_s(body_stk, rof),
+        'Base HS Same TTK': np.where(base_hs_stk == ammo_stk, 'Yes', 'No (Syn/HP worth using)'),
+    }
+    damage = extrapolate_damage(close, weapons['DMG_10M'].values, weapons['DMG_75M'].values, STAT_CARD_RANGES)
+    for r, range_m in enumerate(STAT_CARD_RANGES):
+        d = np.round(damage[:, r], 1)
+        hs_stk, ammo_hs_stk, range_body_stk = _shots(d, BASE_HS_MULT), _shots(d, mult), _shots(d)
+        values.update({
+            f'DMG at {range_m}M': d,
+            f'HS STK at {range_m}M': hs_stk.astype(int),
+            f'HS STK (HP/SYN) at {range_m}M': ammo_hs_stk.astype(int),
+            f'HS TTK at {range_m}M': _ttk_s(hs_stk, rof),
+            f'Body STK at {range_m}M': range_body_stk.astype(int),
+            f'Body TTK at {range_m}M': _ttk_s(range_body_stk, rof),
+        })
+        if range_m == 20:
+            values['HS TTK (with HP) at 20M'] = _ttk_s(ammo_hs_stk, rof)
+    return values
+
+
+def write_sheet(name, values, data_dir):
+    """Write one source sheet with the real export's exact header lines; unknown columns stay empty"""
+    file_name, read_kwargs = SOURCES[name]
+    source = source_paths()[name]
+    columns = pd.read_csv(source, nrows=0, **read_kwargs).columns
+    with open(source, newline='') as f:
+        header = ''.join(f.readline() for _ in range(read_kwargs.get('skiprows', 0) + 1))
+    num_rows = len(next(iter(values.values())))
+    df = pd.DataFrame({column: values.get(column, [''] * num_rows) for column in columns})
+    path = os.path.join(data_dir, file_name)
+    with open(path, 'w', newline='') as f:
+        f.write(header)
+        df.to_csv(f, header=False, index=False)
+    return path
+
+
+def derived_tables(weapons):
+    """The committed analysis_results/ tables the stages read, as extract/categorize would write them"""
+    mult = np.where(weapons['Ammo Type'].values == 'Synthetic', SYNTH_MULT, HP_MULT)
+    ammo_types = pd.DataFrame({
+        'Gun': weapons['Gun'], 'Type': weapons['Sheet Type'], 'Base DMG': weapons['DMG_Close'],
+        'Ammo Type': weapons['Ammo Type'], 'Actual Multiplier': mult,
+    }).sort_values(['Type', 'Gun'])
+
+    damage = np.round(extrapolate_damage(weapons['DMG_Close'].values, weapons['DMG_10M'].values,
+                                         weapons['DMG_75M'].values, STAT_CARD_RANGES), 1)
+    # One headshot, then body shots (a headshot alone never kills at these damages)
+    one_hs_stk = 1 + np.maximum(np.ceil((TARGET_HP - damage * BASE_HS_MULT) / damage), 0)
+    stk = pd.DataFrame({'Gun': weapons['Gun'], 'Type': weapons['Sheet Type'], 'Base Damage': weapons['DMG_Close']})
+    for r, range_m in enumerate(STAT_CARD_RANGES):
+        stk[f'STK at {range_m}M'] = one_hs_stk[:, r].astype(int)
+    for r, range_m in enumerate(STAT_CARD_RANGES):
+        stk[f'Damage at {range_m}M'] = damage[:, r]
+    stk = stk.sort_values(['STK at 20M', 'Type', 'Gun'])
+    return {AMMO_TYPES_PATH: ammo_types, STK_CATEGORIES_PATH: stk}
+
+
+def write_workspace(weapons, workspace):
+    """Lay out a stand-in repo tree: data/ with all five source sheets plus analysis_results/ inputs"""
+    data_dir = os.path.join(workspace, 'data')
+    results_dir = os.path.join(workspace, 'analysis_results')
+    os.makedirs(data_dir, exist_ok=True)
+    os.makedirs(results_dir, exist_ok=True)
+
+    falloff, dps_chart = falloff_values(weapons), dps_chart_values(weapons)
+    paths = [write_sheet(name, falloff if name == 'falloff' else dps_chart, data_dir) for name in SOURCES]
+    for path, df in derived_tables(weapons).items():
+        df.to_csv(os.path.join(workspace, path), index=False)
+        paths.append(os.path.join(workspace, path))
+    # Other data files the stages read (map profiles, verdicts) are copied as-is
+    for file_name in sorted(os.listdir(os.path.join(REPO_DIR, 'data'))):
+        if file_name.endswith('.json'):
+            with open(os.path.join(REPO_DIR, 'data', file_name), 'rb') as src, \
+                    open(os.path.join(data_dir, file_name), 'wb') as dst:
+                dst.write(src.read())
+    return paths
+
+
+def run_stages(names, workspace):
+    """Run pipeline stages (and their upstream stages) inside the workspace; returns {stage: seconds}
+
+    Scripts run from the repo with the workspace as working directory, so
+    every relative path they read or write (data/, analysis_results/,
+    visualizations/, .cache/) resolves to the synthetic tree.
+    """
+    from run_pipeline import STAGES, stage_order, with_upstream
+    env = dict(os.environ)
+    env.setdefault('MPLBACKEND', 'Agg')
+    timings = {}
+    for stage in with_upstream(stage_order(STAGES), names):
+        for pattern in stage['outputs']:
+            out_dir = os.path.dirname(pattern)
+            if out_dir and '*' not in out_dir:
+                os.makedirs(os.path.join(workspace, out_dir), exist_ok=True)
+        start = time.perf_counter()
+        returncode = subprocess.run([sys.executable, os.path.join(REPO_DIR, stage['script'])], cwd=workspace,
+                                    env=env, stdout=subprocess.DEVNULL).returncode
+        timings[stage['name']] = time.perf_counter() - start
+        status = 'ok' if returncode == 0 else f'FAILED (exit code {returncode})'
+        print(f"  {stage['name']:28} {timings[stage['name']]:9.2f}s  {status}")
+        if returncode != 0:
+            break
+    return timings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate seeded synthetic weapon sheets for scale and stress testing')
+    parser.add_argument('num_weapons', type=int, help='Rows to generate (e.g. 10000 or 1000000)')
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--config', default=CONFIG_PATH, help='Class mix, damage tiers, ROF ranges and falloff shapes')
+    parser.add_argument('--workspace', help=f'Output tree (default: {WORKSPACE_DIR}/<num_weapons>-<seed>)')
+    parser.add_argument('--run', nargs='+', metavar='STAGE',
+                        help='Pipeline stages to run on the synthetic data (upstream stages run first)')
+    args = parser.parse_args()
+
+    workspace = args.workspace or os.path.join(WORKSPACE_DIR, f'{args.num_weapons}-{args.seed}')
+    start = time.perf_counter()
+    weapons = generate_weapons(args.num_weapons, load_config(args.config), args.seed)
+    paths = write_workspace(weapons, workspace)
+    print(f"{len(weapons):,} weapons (seed {args.seed}) written in {time.perf_counter() - start:.1f}s:")
+    for path in paths:
+        print(f"  {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    print(weapons['Type'].value_counts().to_string())
+
+    if args.run:
+        print(f"\nRunning {', '.join(args.run)} in {workspace}")
+        run_stages(args.run, workspace)
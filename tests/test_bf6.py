@@ -0,0 +1,17 @@
+import pytest
+
+import bf6
+from ttk_engine import MAX_HS
+
+
+@pytest.mark.parametrize('headshots', [-1, MAX_HS + 1])
+def test_ttk_rejects_headshots_outside_max_hs(headshots):
+    with pytest.raises(SystemExit) as exc:
+        bf6.main(['ttk', 'M4A1', '--headshots', str(headshots)])
+    assert exc.value.code == 2
+
+
+def test_ttk_prints_requested_headshots(capsys):
+    bf6.main(['ttk', 'M4A1', '--headshots', str(MAX_HS)])
+    rows = capsys.readouterr().out.splitlines()
+    assert any(line.split()[:1] == [str(MAX_HS)] for line in rows)
@@ -0,0 +1,19 @@
+import numpy as np
+
+from engagement_sim import simulate_engagements
+from ttk_engine import expected_ttk, kill_shot_distribution
+
+DAMAGE = np.array([18.0, 25.0, 33.0])
+ROF = np.array([900.0, 700.0, 500.0])
+
+
+def test_simulation_matches_exact_distribution():
+    p_head, p_miss = 0.25, 0.2
+    histograms = simulate_engagements(DAMAGE, p_head, p_miss, num_engagements=200_000, seed=1)
+    exact = kill_shot_distribution(DAMAGE[:, None], p_head, p_miss)[0, :, 0]
+    simulated = histograms / histograms.sum(axis=-1, keepdims=True)
+    assert np.abs(simulated - exact).max() < 0.01
+
+    mean = expected_ttk(histograms[None, :, None], ROF)[0, :, 0]
+    exact_mean = expected_ttk(exact[None, :, None], ROF)[0, :, 0]
+    np.testing.assert_allclose(mean, exact_mean, rtol=0.01)
@@ -0,0 +1,19 @@
+import pandas as pd
+
+from generate_weapon_data_js import HP_TIERLIST, RATINGS, SYNTH_TIERLIST, summary_line, tierlist_stats
+
+
+def test_site_rank_is_tierlist_position():
+    hp_df, synth_df = pd.read_csv(HP_TIERLIST), pd.read_csv(SYNTH_TIERLIST)
+    stats = tierlist_stats(hp_df, synth_df)
+    labels = [label for _, label in RATINGS]
+    for prefix, df in [('hp', hp_df), ('synth', synth_df)]:
+        order = []
+        for position, gun in enumerate(df['Gun'], start=1):
+            assert stats[gun][f'{prefix}_rank'] == position
+            if prefix == 'synth' or 'synth_rank' not in stats[gun]:
+                line = summary_line(stats[gun])
+                assert f'Ranks #{position} of {len(df)}' in line
+                order.append(labels.index(line.split(' is ')[1].split('<')[0]))
+        # Ratings never improve further down the tierlist
+        assert order == sorted(order)
@@ -0,0 +1,37 @@
+import json
+import os
+
+import pytest
+from PIL import Image
+
+import image_variants
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_variants, 'SITE_DIR', str(tmp_path))
+    monkeypatch.setattr(image_variants, 'MANIFEST_PATH', str(tmp_path / 'image-variants.json'))
+    path = str(tmp_path / 'KV9.png')
+    Image.new('RGB', (64, 32), 'red').save(path)
+    return path
+
+
+def build(path):
+    return image_variants.build_variants([path], workers=1)
+
+
+def test_variants_follow_content_not_mtime(site, monkeypatch):
+    manifest, written = build(site)
+    assert written == len(manifest['formats']) and manifest['images'] == {'KV9.png': [64]}
+
+    os.utime(site, (2e9, 2e9))  # A checkout touches the PNG without changing it
+    assert build(site)[1] == 0
+
+    Image.new('RGB', (64, 32), 'blue').save(site)
+    assert build(site)[1] == written
+
+    monkeypatch.setitem(image_variants.ENCODE_OPTIONS, 'webp', {'quality': 50})
+    assert build(site)[1] == written
+
+    with open(image_variants.MANIFEST_PATH) as f:
+        assert json.load(f)['sources']['KV9.png'] == image_variants.source_key(site)
@@ -0,0 +1,41 @@
+import importlib
+import sys
+
+import render_cache
+
+
+def write_modules(tmp_path, helper_source):
+    (tmp_path / 'fig_helper.py').write_text(helper_source)
+    (tmp_path / 'fig_module.py').write_text('from fig_helper import style\n\n\ndef render(path):\n    return style()\n')
+
+
+def load_render(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ['fig_module', 'fig_helper']:
+        sys.modules.pop(name, None)
+    return importlib.import_module('fig_module').render
+
+
+def test_code_version_covers_imported_helpers(tmp_path, monkeypatch):
+    monkeypatch.setattr(render_cache, '_code_versions', {})
+    write_modules(tmp_path, 'def style():\n    return 1\n')
+    before = render_cache.code_version(load_render(tmp_path, monkeypatch))
+
+    monkeypatch.setattr(render_cache, '_code_versions', {})
+    write_modules(tmp_path, 'def style():\n    return 2\n')
+    after = render_cache.code_version(load_render(tmp_path, monkeypatch))
+    assert before != after
+
+
+def test_cache_directory_scanned_once_per_process(tmp_path, monkeypatch):
+    scans = []
+    monkeypatch.setattr(render_cache, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(render_cache, '_cache_bytes', None)
+    monkeypatch.setattr(render_cache, 'evict', lambda max_bytes: scans.append(max_bytes) or 0)
+
+    for _ in range(50):
+        render_cache._track_size(1000, max_bytes=10**6)
+    assert len(scans) == 1
+
+    render_cache._track_size(10**6, max_bytes=10**6)  # Past the limit: scan and evict again
+    assert len(scans) == 2
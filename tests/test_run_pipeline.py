@@ -0,0 +1,53 @@
+import copy
+import fnmatch
+import glob
+
+import pytest
+
+import run_pipeline
+from weapon_data import AMMO_TYPES_PATH, STK_CATEGORIES_PATH
+from weapon_registry import ttk_weapons
+
+
+def test_every_input_is_produced_or_a_source():
+    run_pipeline.check_inputs(run_pipeline.STAGES)
+
+
+def test_misplaced_input_fails():
+    stages = copy.deepcopy(run_pipeline.STAGES)
+    stages[0]['inputs'].append('Weapon_Ammo_Types.csv')  # Root path nothing writes
+    with pytest.raises(SystemExit, match='Weapon_Ammo_Types.csv'):
+        run_pipeline.check_inputs(stages)
+
+
+@pytest.mark.parametrize('path, producer', [(AMMO_TYPES_PATH, 'extract_ammo_types'),
+                                            (STK_CATEGORIES_PATH, 'categorize_stk')])
+def test_derived_tables_invalidate_their_readers(path, producer):
+    stages = run_pipeline.stage_order(run_pipeline.STAGES)
+    names = [stage['name'] for stage in stages]
+    readers = [stage['name'] for stage in stages if path in stage['inputs']]
+    assert len(readers) > 3
+    for reader in readers:
+        assert names.index(producer) < names.index(reader)
+        upstream = run_pipeline.with_upstream(stages, [reader])
+        assert producer in [stage['name'] for stage in upstream]
+
+
+def test_stage_outputs_do_not_overlap():
+    # A pattern that also matches another stage's files keeps outputs_exist() true after its own are deleted
+    owners = {}
+    for stage in run_pipeline.STAGES:
+        for pattern in stage['outputs']:
+            for path in glob.glob(pattern):
+                owners.setdefault(path, set()).add(stage['name'])
+    assert {path: names for path, names in owners.items() if len(names) > 1} == {}
+
+
+def test_weapon_circle_patterns_split_by_file_name():
+    outputs = {stage['name']: stage['outputs'][0] for stage in run_pipeline.STAGES if stage['outputs']}
+    for gun in ttk_weapons()['Gun']:
+        own, by_hs = f'visualizations/INDIVIDUAL_WEAPONS/{gun}.png', f'visualizations/INDIVIDUAL_WEAPONS/{gun}_1HS.png'
+        assert fnmatch.fnmatchcase(own, outputs['weapon_circles'])
+        assert not fnmatch.fnmatchcase(own, outputs['weapon_circles_by_hs'])
+        assert fnmatch.fnmatchcase(by_hs, outputs['weapon_circles_by_hs'])
+        assert not fnmatch.fnmatchcase(by_hs, outputs['weapon_circles'])
@@ -0,0 +1,15 @@
+import subprocess
+import sys
+
+import stage_trace
+
+
+def test_max_rss_is_optional(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'resource', None)  # As on Windows
+    assert stage_trace._max_rss_mb() is None
+
+
+def test_engine_imports_without_resource():
+    code = "import sys; sys.modules['resource'] = None; import ttk_engine, stage_trace; print(stage_trace._max_rss_mb())"
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'None'
@@ -0,0 +1,89 @@
+import itertools
+
+import numpy as np
+
+from synthetic_weapons import generate_weapons
+from ttk_engine import (AMMO_MULTS, MAX_BODY_SHOTS, MAX_HS, MAX_SHOTS, RANGES, body_shots_needed,
+                        calculate_stk_ttk_cube, extrapolate_damage, falloff_breakpoints, kill_shot_distribution,
+                        shot_combos, solve_kill_ranges)
+from weapon_registry import ttk_weapons
+
+
+def loop_stk_ttk(base_dmg, rof, hs_mult, num_hs, target_hp):
+    """The per-cell loop the cube replaced (analyze_ttk_all_weapons.calculate_stk_ttk)"""
+    if base_dmg <= 0 or rof <= 0:
+        return np.inf, np.inf
+    for body_shots in range(20):
+        if base_dmg * hs_mult * num_hs + base_dmg * body_shots >= target_hp:
+            stk = num_hs + body_shots
+            return stk, (stk - 1) * (60 / rof) * 1000
+    return np.inf, np.inf
+
+
+def test_cube_matches_per_cell_loop():
+    df = generate_weapons(40, seed=3)
+    rof = df['ROF'].astype(float).values
+    damage = extrapolate_damage(df['DMG_Close'], df['DMG_10M'], df['DMG_75M'], RANGES)
+    target_hps = [100, 80]
+    stk, ttk = calculate_stk_ttk_cube(damage, rof, target_hps=target_hps)
+
+    for w, r, h, a, t in itertools.product(range(len(df)), range(len(RANGES)), range(MAX_HS + 1),
+                                           range(len(AMMO_MULTS)), range(len(target_hps))):
+        expected_stk, expected_ttk = loop_stk_ttk(damage[w, r], rof[w], AMMO_MULTS[a], h, target_hps[t])
+        assert stk[w, r, h, a, t] == expected_stk
+        np.testing.assert_allclose(ttk[w, r, h, a, t], expected_ttk, rtol=1e-12)
+
+
+def test_solve_kill_ranges_matches_fine_grid_scan():
+    df = ttk_weapons()
+    num_hs, num_body = shot_combos(6)
+    breakpoints, breakpoint_damage = falloff_breakpoints(df['DMG_Close'], df['DMG_10M'], df['DMG_75M'], max_range=100)
+    solved = solve_kill_ranges(breakpoints, breakpoint_damage, num_hs, num_body)
+
+    step = 0.01
+    ranges = np.arange(0, 100 + step / 2, step)
+    damage = extrapolate_damage(df['DMG_Close'], df['DMG_10M'], df['DMG_75M'], ranges)[:, None, None, :]
+    shots = (np.asarray(num_hs)[:, None] * np.asarray(AMMO_MULTS)[None, :] + np.asarray(num_body)[:, None])
+    kills = damage * shots[None, :, :, None] >= 100
+    # Furthest range of the killing stretch that starts at 0 m (0 if the combo never kills)
+    first_miss = np.where(kills.all(axis=-1), len(ranges), np.argmin(kills, axis=-1))
+    scanned = np.where(first_miss > 0, ranges[np.maximum(first_miss - 1, 0)], 0)
+    assert np.all(np.abs(solved - scanned) <= step + 1e-9)
+
+
+def brute_force_kill_shots(damage, hs_mult, p_head, p_miss, max_shots, target_hp=100):
+    """P(kill on shot k) by summing over every head/body/miss sequence of max_shots shots"""
+    probabilities = np.zeros(max_shots + 1)
+    outcomes = [(p_head, damage * hs_mult), (1 - p_head - p_miss, damage), (p_miss, 0.0)]
+    for sequence in itertools.product(outcomes, repeat=max_shots):
+        total, kill_shot = 0.0, max_shots
+        for k, (_, hit) in enumerate(sequence):
+            total += hit
+            if total >= target_hp:
+                kill_shot = k
+                break
+        probabilities[kill_shot] += np.prod([p for p, _ in sequence])
+    return probabilities
+
+
+def test_kill_shot_distribution_matches_brute_force():
+    damage = np.array([[18.3, 25.7], [33.1, 41.0]])
+    max_shots = 7
+    for p_head, p_miss in [(0.25, 0.0), (0.3, 0.2)]:
+        exact = kill_shot_distribution(damage, [p_head], p_miss, max_shots=max_shots)[0]
+        for w, r, a in itertools.product(range(2), range(2), range(len(AMMO_MULTS))):
+            expected = brute_force_kill_shots(damage[w, r], AMMO_MULTS[a], p_head, p_miss, max_shots)
+            np.testing.assert_allclose(exact[w, r, a], expected, atol=1e-12)
+
+
+def test_probabilistic_paths_allow_max_shots_body_shots():
+    # 25 body shots: past the fixed-headshot cube's MAX_BODY_SHOTS, within MAX_SHOTS
+    damage = np.array([[4.0, 3.0]])
+    assert MAX_BODY_SHOTS < 25 <= MAX_SHOTS
+    assert np.isinf(calculate_stk_ttk_cube(damage[:, :1], [600])[0][0, 0, 0, 0, 0])
+    body = body_shots_needed(damage)
+    assert body[0, 0, 0, 0] == 25
+    assert body[0, 1, 0, 0] == MAX_SHOTS + 1  # 34 body shots: no kill
+    kill_shots = kill_shot_distribution(damage, [0.0])[0]
+    assert kill_shots[0, 0, 0, 24] == 1
+    assert kill_shots[0, 1, 0, MAX_SHOTS] == 1
@@ -0,0 +1,37 @@
+import numpy as np
+
+from synthetic_weapons import generate_weapons
+from ttk_engine import calculate_stk_ttk_cube, falloff_columns, falloff_table, table_lookup
+from ttk_index import build_index, count_within, top_k
+from weapon_registry import AMMO_LABELS
+
+
+def test_top_k_beyond_int16_loadouts():
+    # 15000 guns -> ~36k loadouts: more positions than an int16 can hold
+    df = generate_weapons(15000)
+    index = build_index(df, max_range=10, target_hps=[100])
+    num_loadouts = len(index['Loadout'])
+    assert num_loadouts > np.iinfo(np.int16).max
+    assert index['order'].min() >= 0 and index['order'].max() == num_loadouts - 1
+
+    result = top_k(index, 10, k=num_loadouts)
+    ttk = result['TTK (ms)'].to_numpy()
+    assert np.all(np.diff(ttk) >= 0)
+
+    # Each label must belong to the TTK reported next to it
+    damage = table_lookup(falloff_table(*falloff_columns(df)), 10)
+    _, cube = calculate_stk_ttk_cube(damage, df['ROF'].astype(float).values)
+    rows = df.reset_index().set_index('Gun')['index']
+    for _, loadout in result.iloc[::997].iterrows():
+        expected = cube[rows[loadout['Gun']], 0, 0, AMMO_LABELS.index(loadout['Ammo']), 0]
+        assert loadout['TTK (ms)'] == np.float32(expected)
+    assert count_within(index, 10, np.inf) == len(result)
+
+
+def test_top_k_matches_sorted_ttk():
+    df = generate_weapons(200, seed=1)
+    index = build_index(df, max_range=20, target_hps=[100, 80])
+    result = top_k(index, 20, num_hs=1, target_hp=80, k=10, ammo='HP')
+    assert list(result['Rank']) == list(range(1, len(result) + 1))
+    assert (result['Ammo'] == 'HP').all()
+    assert np.all(np.diff(result['TTK (ms)'].to_numpy()) >= 0)
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from ttk_server import ResponseCache, load_tables, respond
+
+
+@pytest.fixture(scope='module')
+def tables():
+    return load_tables()
+
+
+def get(tables, path, query=''):
+    status, body, _ = respond(tables, ResponseCache(), path, query)
+    return status, json.loads(body)
+
+
+@pytest.mark.parametrize('k', ['0', '-3', 'x'])
+def test_top_rejects_bad_k(tables, k):
+    assert get(tables, '/top', f'k={k}')[0] == 400
+
+
+def test_top_is_sorted(tables):
+    status, payload = get(tables, '/top', 'range=20&k=5')
+    assert status == 200
+    ttk = [row['ttk_ms'] for row in payload['results']]
+    assert len(ttk) == 5 and ttk == sorted(ttk)
+
+
+def test_ttk_accepts_sheet_spellings(tables):
+    status, payload = get(tables, '/ttk', 'weapon=sor%20556%20mk2&headshots=0&ammo=Base')
+    assert status == 200 and len(payload['results']) == 1
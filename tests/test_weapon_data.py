@@ -0,0 +1,26 @@
+import pandas as pd
+
+import weapon_data
+
+
+def test_snapshot_round_trip(tmp_path):
+    tables = {name: weapon_data.parse_csv(name) for name in weapon_data.SOURCES}
+    snapshot_dir = str(tmp_path / 'snapshot')
+    weapon_data._write_snapshot(tables, snapshot_dir)
+    loaded = weapon_data._read_snapshot(snapshot_dir)
+    assert list(loaded) == list(tables)
+    for name, df in tables.items():
+        pd.testing.assert_frame_equal(loaded[name], df, check_exact=True)
+
+
+def test_load_tables_reads_snapshot_on_second_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(weapon_data, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(weapon_data, '_tables', None)
+    parsed = weapon_data.load_tables()
+    assert (tmp_path / weapon_data.source_hash() / weapon_data.SNAPSHOT_FILE).exists()
+
+    monkeypatch.setattr(weapon_data, '_tables', None)
+    monkeypatch.setattr(weapon_data, 'parse_csv', None)  # A second parse would fail
+    cached = weapon_data.load_tables()
+    for name, df in parsed.items():
+        pd.testing.assert_frame_equal(cached[name], df, check_exact=True)
@@ -0,0 +1,21 @@
+import pandas as pd
+
+from weapon_registry import canonical_names, lookup, ttk_weapons, unmatched, weapon_ids
+
+
+def test_aliases_resolve_to_one_weapon():
+    assert canonical_names(['QBZ', 'qbz-192', 'TR7', 'M/60', 'AK205']) == ['QBZ-192', 'QBZ-192', 'TR-7', 'M60', 'AK-205']
+    assert len(set(weapon_ids(['QBZ', 'QBZ-192', 'qbz 192']))) == 1
+    assert weapon_ids(['NOT-A-GUN'])[0] == -1 and unmatched(['NOT-A-GUN', 'AVG']) == ['NOT-A-GUN']
+
+
+def test_lookup_joins_across_spellings():
+    table = pd.DataFrame({'Gun': ['QBZ-192', 'TR-7'], 'Ammo Type': ['Synthetic', 'Hollow Point']})
+    assert list(lookup(table, ['QBZ', 'TR7', 'KV9'], 'Ammo Type')[:2]) == ['Synthetic', 'Hollow Point']
+    assert pd.isna(lookup(table, ['KV9'], 'Ammo Type')[0])
+
+
+def test_ttk_weapons_uses_canonical_names():
+    guns = set(ttk_weapons()['Gun'])
+    assert {'QBZ-192', 'TR-7', 'M60', 'AK-205'} <= guns
+    assert not guns & {'QBZ', 'TR7', 'M/60', 'AK205'}
@@ -0,0 +1,353 @@
+import numpy as np
+
+from stage_trace import traced
+
+# Constants
+BASE_HS_MULT = 1.34
+HP_MULT = 1.5
+SYNTH_MULT = 1.75
+TARGET_HP = 100
+RANGES = [0, 10, 20, 30, 40, 50, 60, 75, 100]
+MAX_HS = 5
+MAX_BODY_SHOTS = 20  # Same cap as the old per-cell loop (body shots 0..19)
+STAT_CARD_RANGES = [10, 20, 35]  # DPS chart 'DMG at 10M/20M/35M' columns
+MAX_SHOTS = 30  # Shots per engagement in the probabilistic models; later kills count as no kill
+TRAVEL_MODES = ['hitscan', 'first_shot']  # See travel_time_ms
+TABLE_STEP = 0.1  # m between falloff table entries
+TABLE_MAX_RANGE = 150  # m; damage stays at the extrapolated 100m value beyond 100m
+
+# Ammo multipliers in cube order: index 0 = Base, 1 = HP, 2 = Synthetic
+AMMO_MULTS = [BASE_HS_MULT, HP_MULT, SYNTH_MULT]
+
+# Falloff sheet columns, in extrapolate_damage/falloff_table argument order
+FALLOFF_FIELDS = ['DMG_Close', 'DMG_10M', 'DMG_75M']
+
+
+def weapon_columns(weapons, names):
+    """Float arrays of the named columns of a weapon table
+
+    weapons is anything indexed by column name: a NumPy structured array,
+    a dict of arrays or a DataFrame. Everything below works on plain arrays,
+    so this module never needs pandas; DataFrames stay at the I/O edges.
+    """
+    return [np.asarray(weapons[name], dtype=float) for name in names]
+
+
+def falloff_columns(weapons):
+    """DMG_Close, DMG_10M and DMG_75M arrays, e.g. falloff_table(*falloff_columns(df))"""
+    return weapon_columns(weapons, FALLOFF_FIELDS)
+
+
+def extrapolate_damage(dmg_close, dmg_10m, dmg_75m, target_range):
+    """Linear interpolation/extrapolation, vectorized over weapons and ranges
+
+    dmg_* may be scalars or 1-D arrays (one entry per weapon) and target_range
+    a scalar or 1-D array. Returns an array shaped (weapons, ranges), or a
+    scalar when everything passed in is scalar.
+    """
+    scalar = np.ndim(dmg_close) == 0 and np.ndim(target_range) == 0
+    dmg_close = np.atleast_1d(np.asarray(dmg_close, dtype=float))[:, None]
+    dmg_10m = np.atleast_1d(np.asarray(dmg_10m, dtype=float))[:, None]
+    dmg_75m = np.atleast_1d(np.asarray(dmg_75m, dtype=float))[:, None]
+    r = np.atleast_1d(np.asarray(target_range, dtype=float))[None, :]
+
+    # Extrapolate beyond 75m using the 10m-75m slope, floored at 10 damage at 100m
+    slope = (dmg_75m - dmg_10m) / (75 - 10)
+    dmg_100m = np.maximum(dmg_75m + slope * (100 - 75), 10)
+
+    near = dmg_close + (dmg_10m - dmg_close) * np.clip(r / 10, 0, 1)
+    mid = dmg_10m + (dmg_75m - dmg_10m) * np.clip((r - 10) / 65, 0, 1)
+    far = dmg_75m + (dmg_100m - dmg_75m) * np.clip((r - 75) / 25, 0, 1)
+
+    damage = np.where(r <= 10, near, np.where(r <= 75, mid, far))
+    return damage[0, 0] if scalar else damage
+
+
+
+def range_grid(step=TABLE_STEP, max_range=TABLE_MAX_RANGE):
+    """Ranges (m) of the falloff table columns: 0, step, 2*step, ..., max_range"""
+    num_points = int(round(max_range / step)) + 1
+    # Rounded so whole-meter entries are exact (e.g. 20.0, not 20.000000000000004)
+    return np.round(np.arange(num_points) * step, 6)
+
+
+@traced('ttk')
+def falloff_table(dmg_close, dmg_10m, dmg_75m, step=TABLE_STEP, max_range=TABLE_MAX_RANGE):
+    """Body damage of every weapon at every range_grid() point
+
+    Built with one batched extrapolate_damage call and returned as a
+    C-contiguous (weapons, ranges) float array, so damage at any distance
+    is a column lookup (see table_lookup) instead of a per-point call.
+    Entries at the sampled RANGES equal extrapolate_damage exactly.
+    """
+    damage = extrapolate_damage(np.atleast_1d(dmg_close), np.atleast_1d(dmg_10m),
+                                np.atleast_1d(dmg_75m), range_grid(step, max_range))
+    return np.ascontiguousarray(damage, dtype=float)
+
+
+def table_lookup(table, target_range, step=TABLE_STEP):
+    """Damage at target_range (scalar or 1-D, in m) from a falloff_table
+
+    Returns (weapons, ranges). Ranges snap to the nearest table entry and are
+    clamped to the table's span.
+    """
+    index = np.rint(np.atleast_1d(np.asarray(target_range, dtype=float)) / step).astype(np.intp)
+    return table[:, np.clip(index, 0, table.shape[1] - 1)]
+
+
+def travel_time_ms(ranges, velocity, mode='first_shot'):
+    """Bullet flight time (ms) to add to TTK, shaped (weapons, ranges)
+
+    'first_shot': distance / muzzle velocity. Every shot flies equally
+    long, so the kill lands this much later than the shot-to-shot TTK,
+    i.e. TTK counted from the first trigger pull (the falloff sheet's
+    'TTK + MVel' columns).
+    'hitscan': zero, the instant-hit TTK used by the analysis scripts.
+    """
+    if mode not in TRAVEL_MODES:
+        raise ValueError(f"Unknown travel mode '{mode}' (expected one of {TRAVEL_MODES})")
+    ranges = np.atleast_1d(np.asarray(ranges, dtype=float))[None, :]
+    velocity = np.atleast_1d(np.asarray(velocity, dtype=float))[:, None]
+    if mode == 'hitscan':
+        return np.zeros((velocity.shape[0], ranges.shape[1]))
+    with np.errstate(divide='ignore'):
+        return ranges / velocity * 1000
+
+
+@traced('ttk')
+def calculate_stk_ttk_cube(damage, rof, num_hs=None, hs_mults=None, target_hps=None, travel_ms=None,
+                           max_body=MAX_BODY_SHOTS):
+    """Closed-form STK and TTK for every weapon/range/headshot/ammo/HP cell
+
+    damage: (weapons, ranges) body damage, e.g. from extrapolate_damage or table_lookup
+    rof:    (weapons,) rounds per minute
+    num_hs, hs_mults, target_hps: 1-D sequences (defaults: 0..MAX_HS,
+    AMMO_MULTS, [TARGET_HP])
+    travel_ms: optional (weapons, ranges) bullet flight time from
+    travel_time_ms, added to every TTK cell (default: hitscan)
+    max_body: cells needing max_body or more body shots count as no kill
+
+    Returns (stk, ttk) float arrays shaped
+    (weapons, ranges, headshots, multipliers, target_hps). Cells that cannot
+    kill within max_body - 1 body shots are np.inf, as before.
+    """
+    if num_hs is None:
+        num_hs = range(MAX_HS + 1)
+    if hs_mults is None:
+        hs_mults = AMMO_MULTS
+    if target_hps is None:
+        target_hps = [TARGET_HP]
+
+    d = np.asarray(damage, dtype=float)[:, :, None, None, None]
+    rof = np.asarray(rof, dtype=float)[:, None, None, None, None]
+    h = np.asarray(num_hs, dtype=float)[None, None, :, None, None]
+    m = np.asarray(hs_mults, dtype=float)[None, None, None, :, None]
+    hp = np.asarray(target_hps, dtype=float)[None, None, None, None, :]
+
+    valid = (d > 0) & (rof > 0)
+    safe_d = np.where(valid, d, 1.0)
+    hs_dmg = safe_d * m * h
+
+    # Body shots needed after the headshots land
+    body = np.maximum(np.ceil((hp - hs_dmg) / safe_d), 0)
+    # Nudge off-by-one float results so the cell matches the
+    # `hs_dmg + d * body >= hp` test the per-cell loop used
+    body = np.where((body > 0) & (hs_dmg + safe_d * (body - 1) >= hp), body - 1, body)
+    body = np.where(hs_dmg + safe_d * body < hp, body + 1, body)
+
+    ok = valid & (body < max_body)
+    stk = np.where(ok, h + body, np.inf)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ttk = (stk - 1) * (60 / np.where(valid, rof, 1.0)) * 1000  # in ms
+        if travel_ms is not None:
+            ttk += np.asarray(travel_ms, dtype=float)[:, :, None, None, None]  # in place: no extra cube-sized copy
+        ttk[~ok] = np.inf
+    return stk, ttk
+
+
+@traced('ttk')
+def stk_with_one_headshot(damage, hs_mult=BASE_HS_MULT, target_hp=TARGET_HP):
+    """Shots to kill with one headshot plus body shots, for body damage of any shape
+
+    NaN where the damage is missing or not positive. Unlike
+    calculate_stk_ttk_cube there is no body-shot cap (the DPS chart's STK
+    categories).
+    """
+    d = np.asarray(damage, dtype=float)
+    valid = d > 0  # False for NaN
+    safe_d = np.where(valid, d, 1.0)
+    remaining = target_hp - safe_d * hs_mult
+    stk = np.where(remaining <= 0, 1, 1 + np.ceil(remaining / safe_d))
+    return np.where(valid, stk, np.nan)
+
+
+@traced('ttk')
+def body_shots_needed(damage, max_shots=MAX_SHOTS, hs_mults=None, target_hp=TARGET_HP):
+    """Body shots still needed after h headshots, for h = 0..max_shots
+
+    damage: (weapons, ranges) body damage. Returns ints shaped (weapons,
+    ranges, multipliers, max_shots + 1), taken from calculate_stk_ttk_cube
+    so the probabilistic models kill on the same shot as the fixed-headshot
+    cube, but with up to max_shots body shots rather than the cube's
+    MAX_BODY_SHOTS cap; max_shots + 1 marks "cannot kill".
+    """
+    damage = np.asarray(damage, dtype=float)
+    num_hs = np.arange(max_shots + 1)
+    stk, _ = calculate_stk_ttk_cube(damage, np.ones(len(damage)), num_hs=num_hs,
+                                    hs_mults=hs_mults, target_hps=[target_hp], max_body=max_shots + 1)
+    body = stk[..., 0].transpose(0, 1, 3, 2) - num_hs
+    body = np.where(np.isfinite(body), body, max_shots + 1)
+    return np.minimum(body, max_shots + 1).astype(np.intp)
+
+
+@traced('ttk')
+def kill_shot_distribution(damage, p_head, p_miss=0.0, hs_mults=None, target_hp=TARGET_HP,
+                           max_shots=MAX_SHOTS):
+    """Exact distribution of the killing shot when each shot is a headshot with probability p_head
+
+    Each shot is independently a headshot (p_head), a miss (p_miss) or a
+    body shot, so after n shots the (headshots, body shots) counts are
+    multinomial (binomial when p_miss = 0). The target is dead after n
+    shots when the body shots cover body_shots_needed for the headshots
+    landed, which gives P(killed within n shots) exactly.
+
+    damage: (weapons, ranges); p_head: scalar or 1-D grid of probabilities
+    (p_miss: scalar or the same shape). Returns (probabilities, weapons,
+    ranges, multipliers, max_shots + 1): P(the kill lands on shot k) for
+    k = 0..max_shots - 1 (0-based, so TTK = k * 60000 / ROF), and in the
+    last entry P(no kill within max_shots).
+    """
+    p = np.atleast_1d(np.asarray(p_head, dtype=float))
+    q = np.broadcast_to(np.asarray(p_miss, dtype=float), p.shape)
+    r = 1 - p - q
+
+    # Multinomial pmf of (headshots h, body shots b) after n shots: (probabilities, n, h, b)
+    n = np.arange(1, max_shots + 1)[:, None, None]
+    h = np.arange(max_shots + 1)[None, :, None]
+    b = np.arange(max_shots + 1)[None, None, :]
+    misses = n - h - b
+    m = np.maximum(misses, 0)
+    log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, max_shots + 1)))])
+    coef = np.where(misses >= 0, np.exp(log_fact[n] - log_fact[h] - log_fact[b] - log_fact[m]), 0.0)
+    pmf = coef * p[:, None, None, None] ** h * r[:, None, None, None] ** b * q[:, None, None, None] ** m
+
+    # P(at least c body shots) for c = 0..max_shots + 1 (the last is "cannot kill")
+    tail = np.cumsum(pmf[..., ::-1], axis=-1)[..., ::-1]
+    tail = np.concatenate([tail, np.zeros(tail.shape[:-1] + (1,))], axis=-1)
+
+    # Cells with the same body-shot requirements share one evaluation
+    needed = body_shots_needed(damage, max_shots, hs_mults, target_hp)
+    unique_needed, inverse = np.unique(needed.reshape(-1, max_shots + 1), axis=0, return_inverse=True)
+    killed_by = tail[:, :, np.arange(max_shots + 1), unique_needed].sum(axis=-1)  # (probabilities, n, unique)
+    killed_by = np.minimum(killed_by[:, :, inverse.ravel()], 1.0)
+    killed_by = np.moveaxis(killed_by, 1, -1).reshape(p.shape + needed.shape[:3] + (max_shots,))
+
+    kill_shot = np.diff(killed_by, axis=-1, prepend=0.0)
+    return np.concatenate([kill_shot, 1 - killed_by[..., -1:]], axis=-1)
+
+
+@traced('ttk')
+def expected_ttk(distribution, rof, travel_ms=None):
+    """Mean TTK (ms) over the engagements that end in a kill
+
+    distribution: (probabilities, weapons, ranges, multipliers, shots + 1)
+    from kill_shot_distribution; rof: (weapons,); travel_ms: optional
+    (weapons, ranges) flight time from travel_time_ms. Returns
+    (probabilities, weapons, ranges, multipliers), np.nan where no kill is
+    possible.
+    """
+    shots = np.arange(distribution.shape[-1] - 1)
+    kills = distribution[..., :-1]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_shot = (kills * shots).sum(axis=-1) / kills.sum(axis=-1)
+    interval = 60000 / np.asarray(rof, dtype=float)
+    ttk = mean_shot * interval[:, None, None]
+    if travel_ms is not None:
+        ttk = ttk + np.asarray(travel_ms, dtype=float)[None, :, :, None]
+    return ttk
+
+
+@traced('ttk')
+def weighted_scores(values, range_weights, hs_weights):
+    """Weighted mean of a (weapons, ranges, headshots, ...) cube for many profiles at once
+
+    range_weights: (profiles, ranges) and hs_weights: (profiles, headshots)
+    engagement-distance and headshot-count distributions (each row is
+    normalized to sum to 1). Every profile is scored in a single tensor
+    contraction. Returns (profiles, weapons, ...).
+    """
+    range_weights = np.asarray(range_weights, dtype=float)
+    hs_weights = np.asarray(hs_weights, dtype=float)
+    range_weights = range_weights / range_weights.sum(axis=1, keepdims=True)
+    hs_weights = hs_weights / hs_weights.sum(axis=1, keepdims=True)
+    return np.einsum('wrh...,pr,ph->pw...', values, range_weights, hs_weights, optimize=True)
+
+
+def falloff_breakpoints(dmg_close, dmg_10m, dmg_75m, max_range=75):
+    """Falloff sheet breakpoints (m) and body damage at each one
+
+    Returns (breakpoints, damage) with damage shaped (weapons, breakpoints).
+    max_range=100 adds the extrapolated 100m point (floored at 10 damage).
+    """
+    dmg_close = np.atleast_1d(np.asarray(dmg_close, dtype=float))
+    dmg_10m = np.atleast_1d(np.asarray(dmg_10m, dtype=float))
+    dmg_75m = np.atleast_1d(np.asarray(dmg_75m, dtype=float))
+
+    breakpoints = [0, 10, 75]
+    points = [dmg_close, dmg_10m, dmg_75m]
+    if max_range > 75:
+        damage_loss_per_meter = (dmg_10m - dmg_75m) / (75 - 10)
+        breakpoints.append(100)
+        points.append(np.maximum(dmg_75m - damage_loss_per_meter * (100 - 75), 10))
+    return np.array(breakpoints, dtype=float), np.stack(points, axis=1)
+
+
+def shot_combos(max_shots=10, min_shots=1):
+    """Every (num_hs, num_body) pair with min_shots..max_shots shots in total"""
+    combos = [(hs, shots - hs) for shots in range(min_shots, max_shots + 1)
+              for hs in range(shots + 1)]
+    num_hs, num_body = zip(*combos)
+    return np.array(num_hs), np.array(num_body)
+
+
+@traced('ttk')
+def solve_kill_ranges(breakpoints, damage, num_hs, num_body, hs_mults=None, target_hp=TARGET_HP):
+    """Furthest range where num_hs headshots + num_body body shots still kill
+
+    breakpoints: (K,) ranges in m with damage values, e.g. from falloff_breakpoints
+    damage:      (weapons, K) body damage at each breakpoint (linear in between)
+    num_hs, num_body: 1-D sequences of the same length, one entry per combination
+    hs_mults:    1-D sequence of headshot multipliers (default AMMO_MULTS)
+
+    Returns ranges shaped (weapons, combinations, multipliers), solved in one
+    pass over the falloff segments: the first breakpoint that no longer kills
+    is found per cell, and the break distance is interpolated inside the
+    segment before it. Matches the old per-row bracket walk: 0 if the combo
+    doesn't kill at the first breakpoint (or the weapon has missing damage),
+    the last breakpoint if it kills everywhere.
+    """
+    if hs_mults is None:
+        hs_mults = AMMO_MULTS
+
+    bp = np.asarray(breakpoints, dtype=float)
+    d = np.asarray(damage, dtype=float)[:, None, None, :]
+    h = np.asarray(num_hs, dtype=float)[None, :, None, None]
+    b = np.asarray(num_body, dtype=float)[None, :, None, None]
+    m = np.asarray(hs_mults, dtype=float)[None, None, :, None]
+
+    total = (d * m) * h + d * b  # (weapons, combos, mults, breakpoints)
+    kills = total >= target_hp
+    num_points = len(bp)
+    first_miss = np.where(kills.all(axis=-1), num_points, np.argmin(kills, axis=-1))
+
+    # Segment [end - 1, end] that contains the break distance
+    end = np.clip(first_miss, 1, num_points - 1)
+    start_total = np.take_along_axis(total, (end - 1)[..., None], axis=-1)[..., 0]
+    end_total = np.take_along_axis(total, end[..., None], axis=-1)[..., 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = (start_total - target_hp) / (start_total - end_total)
+    crossing = bp[end - 1] + (bp[end] - bp[end - 1]) * fraction
+
+    ranges = np.where(first_miss == num_points, bp[-1], np.where(first_miss == 0, 0.0, crossing))
+    missing = np.isnan(d).any(axis=-1)
+    return np.where(missing, 0.0, ranges)
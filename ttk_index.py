@@ -0,0 +1,127 @@
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from ttk_engine import MAX_HS, TARGET_HP, calculate_stk_ttk_cube, falloff_columns, falloff_table, range_grid
+from weapon_registry import AMMO_LABELS, loadouts, ttk_weapons
+
+INDEX_PATH = 'analysis_results/TTK_Index.npz'
+INDEX_STEP = 1  # m between range buckets
+INDEX_MAX_RANGE = 100
+INDEX_TARGET_HPS = [TARGET_HP, 80]
+LOADOUT_COLUMNS = ['Loadout', 'Gun', 'Type', 'Ammo']
+
+
+def build_index(df, step=INDEX_STEP, max_range=INDEX_MAX_RANGE, target_hps=INDEX_TARGET_HPS):
+    """Loadouts sorted by TTK for every range bucket, headshot count and target HP
+
+    df is a ttk_weapons() table with a fresh index (same inputs as the tier
+    list, hitscan TTK). Returns a dict of arrays: 'order' (ranges,
+    headshots, target HPs, loadouts) holds loadout positions from fastest
+    to slowest kill and 'ttk' the matching TTK (ms, np.inf if no kill), so
+    a top-k query is a slice and a TTK threshold a binary search.
+    """
+    loadout_df = loadouts(df)
+    ranges = range_grid(step, max_range)
+    damage = falloff_table(*falloff_columns(df), step=step, max_range=max_range)
+    _, ttk = calculate_stk_ttk_cube(damage, df['ROF'].astype(float).values, target_hps=target_hps)
+    ttk = ttk[loadout_df['Weapon'].to_numpy(), :, :, loadout_df['Mult'].to_numpy()]  # (loadouts, R, H, T)
+    ttk = np.moveaxis(ttk, 0, -1)
+
+    # Stable sort: equal TTKs keep sheet order, so results are reproducible.
+    # Smallest unsigned type that holds every loadout position (a fixed int16 overflows past 32767)
+    order = np.argsort(ttk, axis=-1, kind='stable').astype(np.min_scalar_type(len(loadout_df)))
+    index = {'ranges': ranges, 'num_hs': np.arange(MAX_HS + 1), 'target_hps': np.asarray(target_hps),
+             'order': order, 'ttk': np.take_along_axis(ttk, order, axis=-1).astype(np.float32)}
+    for column in LOADOUT_COLUMNS:
+        index[column] = loadout_df[column].to_numpy().astype(str)
+    return index
+
+
+def save_index(index, path=INDEX_PATH):
+    np.savez_compressed(path, **index)
+
+
+def load_index(path=INDEX_PATH):
+    """Index saved by save_index, loaded fully into memory"""
+    with np.load(path) as data:
+        return {key: data[key] for key in data.files}
+
+
+def scenario(index, range_m, num_hs=0, target_hp=TARGET_HP):
+    """(range bucket, headshots, target HP) position of a query: nearest range bucket"""
+    ranges = index['ranges']
+    step = ranges[1] - ranges[0]
+    r = int(np.clip(np.rint(range_m / step), 0, len(ranges) - 1))
+    if num_hs not in index['num_hs']:
+        raise ValueError(f"Headshot count {num_hs} not indexed (0..{index['num_hs'][-1]})")
+    hp = np.flatnonzero(index['target_hps'] == target_hp)
+    if len(hp) == 0:
+        raise ValueError(f"Target HP {target_hp} not indexed ({', '.join(map(str, index['target_hps']))})")
+    return r, int(num_hs), int(hp[0])
+
+
+def top_k(index, range_m, num_hs=0, target_hp=TARGET_HP, k=5, weapon_type=None, ammo=None):
+    """The k fastest-killing loadouts at range_m, as a DataFrame
+
+    Without filters this is a slice of the precomputed order (O(k)); a
+    weapon type or ammo filter masks every loadout first, so a filtered
+    query costs O(n) in the number of loadouts (one vectorized pass).
+    Loadouts that can't kill are left out.
+    """
+    cell = scenario(index, range_m, num_hs, target_hp)
+    order, ttk = index['order'][cell], index['ttk'][cell]
+    if weapon_type is not None or ammo is not None:
+        keep = np.ones(len(index['Loadout']), dtype=bool)
+        if weapon_type is not None:
+            keep &= index['Type'] == weapon_type
+        if ammo is not None:
+            keep &= index['Ammo'] == ammo
+        matches = keep[order]
+        order, ttk = order[matches], ttk[matches]
+    order, ttk = order[:k], ttk[:k]
+    order, ttk = order[np.isfinite(ttk)], ttk[np.isfinite(ttk)]
+    result = pd.DataFrame({column: index[column][order] for column in LOADOUT_COLUMNS})
+    result.insert(0, 'Rank', np.arange(1, len(result) + 1))
+    result['TTK (ms)'] = ttk
+    return result
+
+
+def count_within(index, range_m, max_ttk, num_hs=0, target_hp=TARGET_HP):
+    """Number of loadouts that kill within max_ttk ms at range_m (binary search)"""
+    cell = scenario(index, range_m, num_hs, target_hp)
+    return int(np.searchsorted(index['ttk'][cell], max_ttk, side='right'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the TTK ranking index, or query the fastest loadouts at a range')
+    parser.add_argument('--range', type=float, help='Query distance (m); omit to (re)build the index')
+    parser.add_argument('--hs', type=int, default=0, help='Headshots in the kill')
+    parser.add_argument('--hp', type=int, default=TARGET_HP, help='Target HP')
+    parser.add_argument('-k', type=int, default=5, help='Loadouts to return')
+    parser.add_argument('--type', help='Only this weapon class (e.g. SMG)')
+    parser.add_argument('--ammo', choices=AMMO_LABELS, help='Only this ammo type')
+    args = parser.parse_args()
+
+    if args.range is None or not os.path.exists(INDEX_PATH):
+        start = time.perf_counter()
+        index = build_index(ttk_weapons().reset_index(drop=True))
+        save_index(index)
+        print(f"Indexed {len(index['Loadout'])} loadouts x {len(index['ranges'])} ranges x "
+              f"{len(index['num_hs'])} headshot counts x {len(index['target_hps'])} target HPs "
+              f"in {time.perf_counter() - start:.2f}s")
+        print(f"Saved: {INDEX_PATH}")
+
+    if args.range is not None:
+        start = time.perf_counter()
+        index = load_index()
+        loaded = time.perf_counter()
+        result = top_k(index, args.range, args.hs, args.hp, args.k, args.type, args.ammo)
+        done = time.perf_counter()
+        r, _, _ = scenario(index, args.range, args.hs, args.hp)
+        print(f"\nFastest loadouts at {index['ranges'][r]:g}m, {args.hs} headshot(s), {args.hp} HP:\n")
+        print(result.to_string(index=False, float_format=lambda v: f'{v:.0f}'))
+        print(f"\nLoaded index in {(loaded - start) * 1000:.1f} ms, query in {(done - loaded) * 1000:.2f} ms")
@@ -0,0 +1,254 @@
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from ttk_engine import (MAX_HS, TABLE_MAX_RANGE, TABLE_STEP, TARGET_HP, calculate_stk_ttk_cube,
+                        falloff_breakpoints, falloff_columns, falloff_table, range_grid, shot_combos, solve_kill_ranges)
+from ttk_index import build_index, top_k
+from weapon_data import AMMO_TYPES_PATH, source_hash
+from weapon_registry import AMMO_LABELS, ttk_weapons, weapon_ids
+
+SERVER_TARGET_HPS = [TARGET_HP, 80]
+MAX_COMBO_SHOTS = 10  # Kill-range table covers every headshot/body split up to this many shots
+MAX_CACHED_RESPONSES = 4096  # Least recently used responses are dropped beyond this
+MAX_AGE = 60  # s clients may reuse a response without revalidating (ETag after that)
+
+
+def load_tables(target_hps=SERVER_TARGET_HPS):
+    """Everything the service answers from, computed once at startup
+
+    TTK/STK cubes on the dense 0.1 m range grid for every weapon, headshot
+    count (0..MAX_HS), ammo type and target HP, the kill-range table for
+    every shot combination, and the TTK ranking index.
+    """
+    df = ttk_weapons().reset_index(drop=True)
+    damage = falloff_table(*falloff_columns(df))
+    stk, ttk = calculate_stk_ttk_cube(damage, df['ROF'].astype(float).values, target_hps=target_hps)
+    num_hs, num_body = shot_combos(MAX_COMBO_SHOTS)
+    breakpoints, breakpoint_damage = falloff_breakpoints(df['DMG_Close'], df['DMG_10M'], df['DMG_75M'], max_range=100)
+
+    with open(AMMO_TYPES_PATH, 'rb') as f:
+        version = hashlib.sha256(f'{source_hash()}{target_hps}'.encode() + f.read()).hexdigest()[:12]
+
+    return {
+        'df': df,
+        'row_by_id': {weapon_id: w for w, weapon_id in enumerate(weapon_ids(df['Gun']))},
+        'ranges': range_grid(),
+        'target_hps': list(target_hps),
+        'stk': stk,
+        'ttk': ttk,
+        'combos': {(int(h), int(b)): c for c, (h, b) in enumerate(zip(num_hs, num_body))},
+        'kill_ranges': solve_kill_ranges(breakpoints, breakpoint_damage, num_hs, num_body),
+        'index': build_index(df, target_hps=target_hps),
+        'version': version,
+    }
+
+
+class QueryError(ValueError):
+    """Bad query parameters (answered with HTTP 400)"""
+
+
+def _weapon_row(tables, params):
+    if 'weapon' not in params:
+        raise QueryError("Missing 'weapon'")
+    w = tables['row_by_id'].get(weapon_ids([params['weapon']])[0])
+    if w is None:
+        raise QueryError(f"Unknown weapon '{params['weapon']}' (see /weapons)")
+    return w
+
+
+def _number(params, name, default, kind=float):
+    try:
+        return kind(params.get(name, default))
+    except ValueError:
+        raise QueryError(f"'{name}' must be a number")
+
+
+def _ammo(tables, params, w):
+    """Ammo types to answer for: the requested one, or every type the weapon can use"""
+    usable = AMMO_LABELS if tables['df']['Ammo Type'][w] == 'Synthetic' else AMMO_LABELS[:2]
+    if 'ammo' not in params:
+        return usable
+    if params['ammo'] not in usable:
+        raise QueryError(f"'ammo' must be one of {', '.join(usable)} for {tables['df']['Gun'][w]}")
+    return [params['ammo']]
+
+
+def _hp(tables, params):
+    hp = _number(params, 'hp', TARGET_HP, int)
+    if hp not in tables['target_hps']:
+        raise QueryError(f"'hp' must be one of {', '.join(map(str, tables['target_hps']))}")
+    return hp
+
+
+def weapons_query(tables, params):
+    df = tables['df']
+    return {'weapons': [{'weapon': row['Gun'], 'type': row['Type'], 'ammo_type': row['Ammo Type']}
+                        for _, row in df.iterrows()]}
+
+
+def ttk_query(tables, params):
+    """STK/TTK of one weapon at a range (nearest 0.1 m), per headshot count and ammo type"""
+    w = _weapon_row(tables, params)
+    range_m = _number(params, 'range', 0)
+    if not 0 <= range_m <= TABLE_MAX_RANGE:
+        raise QueryError(f"'range' must be within 0..{TABLE_MAX_RANGE} m")
+    r = int(round(range_m / TABLE_STEP))
+    headshots = range(MAX_HS + 1)
+    if 'headshots' in params:
+        headshots = [_number(params, 'headshots', 0, int)]
+        if not 0 <= headshots[0] <= MAX_HS:
+            raise QueryError(f"'headshots' must be within 0..{MAX_HS}")
+    hp = _hp(tables, params)
+    t = tables['target_hps'].index(hp)
+
+    results = []
+    for ammo in _ammo(tables, params, w):
+        a = AMMO_LABELS.index(ammo)
+        for h in headshots:
+            stk, ttk = tables['stk'][w, r, h, a, t], tables['ttk'][w, r, h, a, t]
+            results.append({'ammo': ammo, 'headshots': h,
+                            'stk': int(stk) if np.isfinite(stk) else None,
+                            'ttk_ms': round(float(ttk), 1) if np.isfinite(ttk) else None})
+    return {'weapon': tables['df']['Gun'][w], 'range': float(tables['ranges'][r]), 'hp': hp, 'results': results}
+
+
+def kill_range_query(tables, params):
+    """Furthest range (m, up to 100) where a headshot/body shot combination still kills"""
+    w = _weapon_row(tables, params)
+    headshots = _number(params, 'headshots', 0, int)
+    body = _number(params, 'body', 0, int)
+    c = tables['combos'].get((headshots, body))
+    if c is None:
+        raise QueryError(f"'headshots' + 'body' must be 1..{MAX_COMBO_SHOTS} shots")
+    results = [{'ammo': ammo, 'kill_range': round(float(tables['kill_ranges'][w, c, AMMO_LABELS.index(ammo)]), 2)}
+               for ammo in _ammo(tables, params, w)]
+    return {'weapon': tables['df']['Gun'][w], 'headshots': headshots, 'body': body, 'results': results}
+
+
+def top_query(tables, params):
+    """Fastest-killing loadouts at a range (nearest 1 m bucket), from the ranking index"""
+    k = _number(params, 'k', 5, int)
+    if k < 1:
+        raise QueryError("'k' must be at least 1")
+    try:
+        result = top_k(tables['index'], _number(params, 'range', 0), _number(params, 'headshots', 0, int),
+                       _hp(tables, params), k, params.get('type'), params.get('ammo'))
+    except ValueError as e:
+        raise QueryError(str(e))
+    return {'results': [{'rank': int(row['Rank']), 'weapon': row['Gun'], 'type': row['Type'],
+                         'ammo': row['Ammo'], 'ttk_ms': round(float(row['TTK (ms)']), 1)}
+                        for _, row in result.iterrows()]}
+
+
+ROUTES = {
+    '/weapons': weapons_query,
+    '/ttk': ttk_query,
+    '/kill-range': kill_range_query,
+    '/top': top_query,
+}
+
+
+class ResponseCache:
+    """LRU of encoded responses keyed by canonical query, safe across request threads"""
+
+    def __init__(self, max_entries=MAX_CACHED_RESPONSES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+def respond(tables, cache, path, query):
+    """(status, body bytes, ETag) for a GET, answered from the response cache when possible"""
+    params = dict(parse_qsl(query))
+    key = (path, tuple(sorted(params.items())))
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    route = ROUTES.get(path)
+    if route is None:
+        status, payload = 404, {'error': f"Unknown path '{path}'", 'paths': sorted(ROUTES)}
+    else:
+        try:
+            status, payload = 200, route(tables, params)
+        except QueryError as e:
+            status, payload = 400, {'error': str(e)}
+    body = json.dumps(payload, separators=(',', ':')).encode()
+    etag = f'"{tables["version"]}-{hashlib.sha256(body).hexdigest()[:16]}"'
+    response = (status, body, etag)
+    if status == 200:
+        cache.put(key, response)
+    return response
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    tables = None
+    cache = None
+    quiet = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        status, body, etag = respond(self.tables, self.cache, url.path.rstrip('/') or '/', url.query)
+        if status == 200 and etag in [t.strip() for t in self.headers.get('If-None-Match', '').split(',')]:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', f'max-age={MAX_AGE}')
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if status == 200:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', f'max-age={MAX_AGE}')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve TTK, STK and kill-range lookups as JSON over local HTTP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--hp', type=int, nargs='+', default=SERVER_TARGET_HPS, help='Target HPs to precompute')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    QueryHandler.tables = load_tables(args.hp)
+    QueryHandler.cache = ResponseCache()
+    QueryHandler.quiet = not args.verbose
+    print(f"Loaded {len(QueryHandler.tables['df'])} weapons (data version {QueryHandler.tables['version']}) "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    server = ThreadingHTTPServer((args.host, args.port), QueryHandler)
+    print(f"Serving on http://{args.host}:{args.port} ({', '.join(sorted(ROUTES))}); restart after re-running the pipeline")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -1,9 +1,10 @@
 import pandas as pd
+from weapon_data import AMMO_TYPES_PATH, STK_CATEGORIES_PATH, load_stat_cards
 
 # Read the original stat card values
-stat_card_df = pd.read_csv('data/BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - Stat Card Values.csv')
-current_ammo_df = pd.read_csv('Weapon_Ammo_Types.csv')
-stk_df = pd.read_csv('STK_Categorization_One_Headshot.csv')
+stat_card_df = load_stat_cards()
+current_ammo_df = pd.read_csv(AMMO_TYPES_PATH)
+stk_df = pd.read_csv(STK_CATEGORIES_PATH)
 
 # Get all guns we're visualizing (3-shot, 4-shot, 5-shot kills)
 visualized_guns = set()
@@ -27,7 +28,7 @@ for gun in sorted(visualized_guns):
     stat_card_row = stat_card_df[stat_card_df['Gun'] == gun]
     
     if current_row.empty:
-        print(f"[X] {gun:20} - NOT FOUND in Weapon_Ammo_Types.csv")
+        print(f"[X] {gun:20} - NOT FOUND in {AMMO_TYPES_PATH}")
         issues_found.append(f"{gun} - Missing from ammo types file")
         continue
     
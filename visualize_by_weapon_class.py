@@ -2,55 +2,14 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Circle
+from weapon_data import AMMO_TYPES_PATH, STK_CATEGORIES_PATH, load_falloff
+from ttk_engine import falloff_breakpoints, solve_kill_ranges
+from weapon_registry import is_flagged, isin, lookup
 
 # Read data
-falloff_df = pd.read_csv('data/Battlefield 6 Damage Fall Off - V2.csv', skiprows=1)
-ammo_df = pd.read_csv('Weapon_Ammo_Types.csv')
-stk_df = pd.read_csv('STK_Categorization_One_Headshot.csv')
-
-# Clean up column names
-falloff_df = falloff_df.rename(columns={
-    'Gun (!!! -> Missing)': 'Gun',
-    'Dmg': 'DMG_Close',
-    '10m': 'DMG_10M',
-    '75m': 'DMG_75M'
-})
-
-# Name mapping
-name_mapping = {
-    'TR7': 'TR-7',
-    'M/60': 'M60',
-    'M240L': 'M240L',
-    'M123K': 'M123K',
-    'M433': 'M433',
-    'SCW-10': 'SCW-10',
-    'DRS-IAR': 'DRS-IAR',
-    'M277': 'M277',
-    'B36A4': 'B36A4',
-    'L110': 'L110',
-    'M250': 'M250 !!!',
-    'M417 A2': 'M417A2',
-    'L85A3': 'L85A3',
-    'SOR-300SC': 'SOR-300SC',
-    'SOR-556 MK2': 'SOR-556 MK2',
-    'RPKM': 'RPKM',
-    'KTS100 MK8': 'KTS100 MK8',
-    'KV9': 'KV9',
-    'M4A1': 'M4A1',
-    'GRT-BC': 'GRT-BC',
-    'SGX': 'SGX',
-    'QBZ': 'QBZ-192',
-    'PW5A3': 'PW5A3',
-    'SG 553R': 'SG 553R',
-    'SL9': 'SL9',
-    'NVO-228E': 'NVO-228E',
-    'UMG-40': 'UMG-40'
-}
-
-BASE_HS_MULT = 1.34
-HP_MULT = 1.5
-SYNTH_MULT = 1.75
-HP_THRESHOLD = 100
+falloff_df = load_falloff()
+ammo_df = pd.read_csv(AMMO_TYPES_PATH)
+stk_df = pd.read_csv(STK_CATEGORIES_PATH)
 
 # Color scheme
 type_colors = {
@@ -60,58 +19,6 @@ type_colors = {
     'SMG': '#FFD93D'
 }
 
-def extrapolate_damage_100m(dmg_10m, dmg_75m):
-    """Linearly extrapolate damage to 100m"""
-    damage_loss_per_meter = (dmg_10m - dmg_75m) / (75 - 10)
-    range_beyond_75 = 100 - 75
-    extrapolated_dmg = dmg_75m - (damage_loss_per_meter * range_beyond_75)
-    return max(extrapolated_dmg, 10)
-
-def interpolate_max_range_100m(row, multiplier, num_hs, num_body):
-    """Interpolate to find exact range where N HS + M Body = 100 damage"""
-    
-    dmg_close = row['DMG_Close']
-    dmg_10m = row['DMG_10M']
-    dmg_75m = row['DMG_75M']
-    dmg_100m = row['DMG_100M']
-    
-    if pd.isna(dmg_close) or pd.isna(dmg_10m) or pd.isna(dmg_75m) or pd.isna(dmg_100m):
-        return 0
-    
-    def calc_damage(hs_dmg, body_dmg):
-        return (hs_dmg * num_hs) + (body_dmg * num_body)
-    
-    ranges = [
-        (0, 10, dmg_close, dmg_10m),
-        (10, 75, dmg_10m, dmg_75m),
-        (75, 100, dmg_75m, dmg_100m)
-    ]
-    
-    max_range = 0
-    
-    for start_range, end_range, start_dmg, end_dmg in ranges:
-        hs_dmg_end = end_dmg * multiplier
-        total_dmg_end = calc_damage(hs_dmg_end, end_dmg)
-        
-        if total_dmg_end >= HP_THRESHOLD:
-            max_range = end_range
-        else:
-            hs_dmg_start = start_dmg * multiplier
-            total_dmg_start = calc_damage(hs_dmg_start, start_dmg)
-            
-            if total_dmg_start >= HP_THRESHOLD:
-                range_diff = end_range - start_range
-                damage_diff = total_dmg_start - total_dmg_end
-                
-                if damage_diff > 0:
-                    damage_to_lose = total_dmg_start - HP_THRESHOLD
-                    fraction = damage_to_lose / damage_diff
-                    interpolated_range = start_range + (range_diff * fraction)
-                    return interpolated_range
-            break
-    
-    return max_range
-
 def create_class_visualization(weapon_class, num_hs, suffix):
     """Create visualization for a weapon class with N headshots"""
     
@@ -124,44 +31,33 @@ def create_class_visualization(weapon_class, num_hs, suffix):
     }
     
     stk_type = class_map[weapon_class]
-    weapons_orig = stk_df[stk_df['Type'] == stk_type]['Gun'].tolist()
-    weapons_mapped = [name_mapping.get(gun, gun) for gun in weapons_orig]
+    weapons = stk_df[stk_df['Type'] == stk_type]['Gun']
     
     # Merge data
-    df = falloff_df[falloff_df['Gun'].isin(weapons_mapped)].copy()
-    df = df[df['Gun'] != 'M250 !!!'].copy()  # Remove M250
+    df = falloff_df[isin(falloff_df['Gun'], weapons)].reset_index(drop=True)
+    df = df[~is_flagged(df['Gun'])].reset_index(drop=True)  # Remove M250 (missing data)
     
     if len(df) == 0:
         print(f"No weapons found for {weapon_class}")
         return
     
-    # Add extrapolated 100m damage
-    df['DMG_Close'] = pd.to_numeric(df['DMG_Close'], errors='coerce')
-    df['DMG_10M'] = pd.to_numeric(df['DMG_10M'], errors='coerce')
-    df['DMG_75M'] = pd.to_numeric(df['DMG_75M'], errors='coerce')
-    df['DMG_100M'] = df.apply(lambda row: extrapolate_damage_100m(row['DMG_10M'], row['DMG_75M']), axis=1)
-    
-    # Map gun names back for ammo lookup
-    reverse_mapping = {v: k for k, v in name_mapping.items()}
-    df['Gun_Original'] = df['Gun'].map(lambda x: reverse_mapping.get(x, x))
-    
-    # Merge with ammo and STK data
-    ammo_temp = ammo_df[['Gun', 'Ammo Type', 'Actual Multiplier']].copy()
-    df = df.merge(ammo_temp, left_on='Gun_Original', right_on='Gun', how='left', suffixes=('_falloff', '_ammo'))
-    df['Gun'] = df['Gun_falloff']
-    df = df.drop(columns=['Gun_ammo', 'Gun_falloff'])
-    
-    # Get STK for each weapon
-    stk_temp = stk_df[['Gun', 'STK at 20M']].copy()
-    df = df.merge(stk_temp, left_on='Gun_Original', right_on='Gun', how='left', suffixes=('', '_stk'))
-    df = df.drop(columns=['Gun_stk'])
+    # Look up ammo and STK data by weapon ID (falloff and DPS sheets spell some guns differently)
+    df['Ammo Type'] = lookup(ammo_df, df['Gun'], 'Ammo Type')
+    df['Actual Multiplier'] = lookup(ammo_df, df['Gun'], 'Actual Multiplier')
+    df['STK at 20M'] = lookup(stk_df, df['Gun'], 'STK at 20M')
     
     print(f"\n{weapon_class} ({num_hs} Headshot{'s' if num_hs > 1 else ''}): {len(df)} weapons")
     print("="*80)
     
+    # Kill range of num_hs HS + every body shot count with each ammo multiplier,
+    # solved for all weapons at once
+    breakpoints, damage = falloff_breakpoints(df['DMG_Close'], df['DMG_10M'], df['DMG_75M'], max_range=100)
+    body_counts = np.arange(max(int(df['STK at 20M'].max()) - num_hs, 0) + 1)
+    kill_ranges = solve_kill_ranges(breakpoints, damage, np.full(len(body_counts), num_hs), body_counts)
+    
     results = []
     
-    for idx, row in df.iterrows():
+    for i, (idx, row) in enumerate(df.iterrows()):
         gun = row['Gun']
         weapon_type_full = row['Type']
         ammo_type = row['Ammo Type']
@@ -174,9 +70,7 @@ def create_class_visualization(weapon_class, num_hs, suffix):
             # Not enough shots for this many headshots
             continue
         
-        base_range = interpolate_max_range_100m(row, BASE_HS_MULT, num_hs, num_body)
-        hp_range = interpolate_max_range_100m(row, HP_MULT, num_hs, num_body)
-        synth_range = interpolate_max_range_100m(row, SYNTH_MULT, num_hs, num_body)
+        base_range, hp_range, synth_range = kill_ranges[i, num_body]
         
         results.append({
             'Gun': gun,
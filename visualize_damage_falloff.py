@@ -1,30 +1,22 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import numpy as np
+from ttk_engine import extrapolate_damage, falloff_columns
+from weapon_data import load_falloff
 
 # Read falloff data
-falloff_df = pd.read_csv('data/Battlefield 6 Damage Fall Off - V2.csv', skiprows=1)
-
-# Clean up column names
-falloff_df = falloff_df.rename(columns={
-    'Gun (!!! -> Missing)': 'Gun',
-    'Dmg': 'DMG_Close',
-    '10m': 'DMG_10M',
-    '75m': 'DMG_75M'
-})
+falloff_df = load_falloff()
 
 # Filter out summary rows and guns we don't want
 exclude_guns = ['MIN', 'MAX', 'AVG']
 exclude_types = ['DMR', 'Shotgun', 'Handgun']
 df = falloff_df[~falloff_df['Gun'].isin(exclude_guns) & ~falloff_df['Type'].isin(exclude_types)].copy()
 
-# Parse damage values
-df['DMG_Close'] = pd.to_numeric(df['DMG_Close'], errors='coerce')
-df['DMG_10M'] = pd.to_numeric(df['DMG_10M'], errors='coerce')
-df['DMG_75M'] = pd.to_numeric(df['DMG_75M'], errors='coerce')
-
 # Remove any rows with missing data
-df = df.dropna(subset=['DMG_Close', 'DMG_10M', 'DMG_75M'])
+df = df.dropna(subset=['DMG_Close', 'DMG_10M', 'DMG_75M']).reset_index(drop=True)
+
+# Dashed extrapolation beyond the last measured point, for every weapon at once (weapons x ranges)
+RANGES_ACTUAL = [0, 10, 75]
+RANGES_EXTRAPOLATED = [75, 85, 100]
+damages_extrapolated = extrapolate_damage(*falloff_columns(df), RANGES_EXTRAPOLATED)
 
 print(f"Visualizing damage falloff for {len(df)} weapons")
 print("="*80)
@@ -37,18 +29,6 @@ type_colors = {
     'SMG': '#FFD93D'
 }
 
-def extrapolate_damage(dmg_10m, dmg_75m, target_range):
-    """Linearly extrapolate damage to a target range based on 10m-75m falloff rate"""
-    # Calculate damage loss per meter from 10m to 75m
-    damage_loss_per_meter = (dmg_10m - dmg_75m) / (75 - 10)
-    
-    # Extrapolate from 75m to target range
-    range_beyond_75 = target_range - 75
-    extrapolated_dmg = dmg_75m - (damage_loss_per_meter * range_beyond_75)
-    
-    # Don't let damage go below 10 (reasonable minimum)
-    return max(extrapolated_dmg, 10)
-
 # === CREATE VISUALIZATION BY WEAPON TYPE ===
 fig, axes = plt.subplots(2, 2, figsize=(20, 16))
 axes = axes.flatten()
@@ -61,35 +41,21 @@ for idx, weapon_type in enumerate(weapon_types):
     
     print(f"\n{weapon_type}s: {len(df_type)} weapons")
     
-    for _, row in df_type.iterrows():
-        gun = row['Gun']
-        dmg_close = row['DMG_Close']
-        dmg_10m = row['DMG_10M']
-        dmg_75m = row['DMG_75M']
-        
-        # Actual data points
-        ranges_actual = [0, 10, 75]
-        damages_actual = [dmg_close, dmg_10m, dmg_75m]
-        
-        # Extrapolated data points
-        ranges_extrapolated = [75, 85, 100]
-        dmg_85m = extrapolate_damage(dmg_10m, dmg_75m, 85)
-        dmg_100m = extrapolate_damage(dmg_10m, dmg_75m, 100)
-        damages_extrapolated = [dmg_75m, dmg_85m, dmg_100m]
-        
+    for w, gun, dmg_close, dmg_10m, dmg_75m in zip(df_type.index, df_type['Gun'], df_type['DMG_Close'],
+                                                   df_type['DMG_10M'], df_type['DMG_75M']):
         color = type_colors.get(weapon_type, 'gray')
         
         # Plot actual data (solid line)
-        ax.plot(ranges_actual, damages_actual, 
+        ax.plot(RANGES_ACTUAL, [dmg_close, dmg_10m, dmg_75m], 
                 marker='o', linewidth=2, markersize=6, 
                 label=gun, color=color, alpha=0.7)
         
         # Plot extrapolated data (dashed line)
-        ax.plot(ranges_extrapolated, damages_extrapolated,
+        ax.plot(RANGES_EXTRAPOLATED, damages_extrapolated[w],
                 linestyle='--', linewidth=2, color=color, alpha=0.4)
         
         print(f"  {gun:20} | Close: {dmg_close:.0f} | 10m: {dmg_10m:.0f} | "
-              f"75m: {dmg_75m:.0f} | 100m (est): {dmg_100m:.1f}")
+              f"75m: {dmg_75m:.0f} | 100m (est): {damages_extrapolated[w, -1]:.1f}")
     
     # Add vertical line at 75m to show where extrapolation begins
     ax.axvline(x=75, color='red', linestyle=':', linewidth=2, alpha=0.5, label='Extrapolation starts')
@@ -137,32 +103,18 @@ for dmg_group in sorted(damage_groups):
     
     fig, ax = plt.subplots(figsize=(14, 8))
     
-    for _, row in df_group.iterrows():
-        gun = row['Gun']
-        weapon_type = row['Type']
-        dmg_close = row['DMG_Close']
-        dmg_10m = row['DMG_10M']
-        dmg_75m = row['DMG_75M']
-        
-        # Actual data points
-        ranges_actual = [0, 10, 75]
-        damages_actual = [dmg_close, dmg_10m, dmg_75m]
-        
-        # Extrapolated data points
-        ranges_extrapolated = [75, 85, 100]
-        dmg_85m = extrapolate_damage(dmg_10m, dmg_75m, 85)
-        dmg_100m = extrapolate_damage(dmg_10m, dmg_75m, 100)
-        damages_extrapolated = [dmg_75m, dmg_85m, dmg_100m]
-        
+    for w, gun, weapon_type, dmg_close, dmg_10m, dmg_75m in zip(df_group.index, df_group['Gun'], df_group['Type'],
+                                                                df_group['DMG_Close'], df_group['DMG_10M'],
+                                                                df_group['DMG_75M']):
         color = type_colors.get(weapon_type, 'gray')
         
         # Plot actual data (solid line with markers)
-        ax.plot(ranges_actual, damages_actual, 
+        ax.plot(RANGES_ACTUAL, [dmg_close, dmg_10m, dmg_75m], 
                 marker='o', linewidth=2.5, markersize=8, 
                 label=f"{gun} ({weapon_type})", color=color, alpha=0.8)
         
         # Plot extrapolated data (dashed line, no markers)
-        ax.plot(ranges_extrapolated, damages_extrapolated,
+        ax.plot(RANGES_EXTRAPOLATED, damages_extrapolated[w],
                 linestyle='--', linewidth=2.5, color=color, alpha=0.5)
     
     # Add vertical line at 75m
@@ -1,65 +1,19 @@
-import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import os
+from ttk_engine import falloff_breakpoints, solve_kill_ranges
+from weapon_registry import ttk_weapons
 
-# Read data
-falloff_df = pd.read_csv('data/Battlefield 6 Damage Fall Off - V2.csv', skiprows=1)
-ammo_df = pd.read_csv('analysis_results/Weapon_Ammo_Types.csv')
+NUM_BODY = 10  # Body shots allowed on top of the headshots (more than any gun needs)
+MIN_1HS_RANGE = 20  # m; guns whose 1 headshot combo reaches this far are shown with 1 headshot
 
-# Clean up falloff data
-falloff_df = falloff_df.rename(columns={
-    'Gun (!!! -> Missing)': 'Gun',
-    'Dmg': 'DMG_Close',
-    '10m': 'DMG_10M',
-    '75m': 'DMG_75M',
-    'ROF': 'ROF'
-})
+# Falloff data merged with ammo types (complete, unflagged weapons only)
+df = ttk_weapons().reset_index(drop=True)
 
-# Name mapping for consistency
-name_mapping = {
-    'TR7': 'TR-7',
-    'M/60': 'M60',
-    'M240L': 'M240L',
-    'QBZ': 'QBZ-192',
-    'AK205': 'AK-205'
-}
-falloff_df['Gun'] = falloff_df['Gun'].replace(name_mapping)
-
-# Merge dataframes
-df = falloff_df[['Gun', 'Type', 'DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF']].copy()
-df = df.merge(ammo_df[['Gun', 'Ammo Type']], on='Gun', how='left')
-df = df.dropna(subset=['DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF', 'Ammo Type', 'Type'])
-
-# Constants
-BASE_HS_MULT = 1.34
-HP_MULT = 1.5
-SYNTH_MULT = 1.75
-TARGET_HP = 100
-
-# Extrapolate damage
-def extrapolate_damage(dmg_close, dmg_10m, dmg_75m, target_range):
-    if target_range <= 0:
-        return dmg_close
-    elif target_range <= 10:
-        return np.interp(target_range, [0, 10], [dmg_close, dmg_10m])
-    elif target_range <= 75:
-        return np.interp(target_range, [10, 75], [dmg_10m, dmg_75m])
-    else:
-        slope = (dmg_75m - dmg_10m) / (75 - 10)
-        dmg_100m = dmg_75m + slope * (100 - 75)
-        dmg_100m = max(dmg_100m, 10)
-        return np.interp(target_range, [75, 100], [dmg_75m, dmg_100m])
-
-def find_max_range(dmg_close, dmg_10m, dmg_75m, num_hs, num_body, hs_mult):
-    """Find maximum range for a kill combination"""
-    for test_range in np.arange(0, 101, 0.1):
-        dmg = extrapolate_damage(dmg_close, dmg_10m, dmg_75m, test_range)
-        total_dmg = (dmg * hs_mult * num_hs) + (dmg * num_body)
-        if total_dmg < TARGET_HP:
-            return max(0, test_range - 0.1)
-    return 100
+# Kill range of 1 and 2 headshots + NUM_BODY body shots for every weapon and
+# ammo multiplier, solved in one pass (weapons x combos x base/HP/synth)
+breakpoints, damage = falloff_breakpoints(df['DMG_Close'], df['DMG_10M'], df['DMG_75M'], max_range=100)
+kill_ranges = solve_kill_ranges(breakpoints, damage, [1, 2], [NUM_BODY, NUM_BODY])
 
 # Create output directory
 os.makedirs('visualizations/INDIVIDUAL_WEAPONS', exist_ok=True)
@@ -69,35 +23,21 @@ print(f"GENERATING INDIVIDUAL WEAPON RANGE CIRCLES")
 print(f"{'='*80}\n")
 
 # Process each weapon
-for idx, weapon_row in df.iterrows():
-    gun_name = weapon_row['Gun']
-    weapon_class = weapon_row['Type']
-    dmg_close = float(weapon_row['DMG_Close'])
-    dmg_10m = float(weapon_row['DMG_10M'])
-    dmg_75m = float(weapon_row['DMG_75M'])
-    ammo_type = weapon_row['Ammo Type']
-    
+for w, (gun_name, weapon_class, ammo_type) in enumerate(zip(df['Gun'], df['Type'], df['Ammo Type'])):
     print(f"Processing: {gun_name}")
     
-    # Determine best headshot combo (prioritize 1HS, then 2HS)
-    # Test 1HS + body shots
-    test_range_1hs = find_max_range(dmg_close, dmg_10m, dmg_75m, 1, 10, BASE_HS_MULT)
-    
-    # Test 2HS + body shots
-    test_range_2hs = find_max_range(dmg_close, dmg_10m, dmg_75m, 2, 10, BASE_HS_MULT)
-    
-    # Determine which scenario to use (prefer 1HS if viable)
-    if test_range_1hs >= 20:  # If 1HS can reach at least 20m, use it
+    # Use 1 headshot if it reaches MIN_1HS_RANGE with base ammo, otherwise 2
+    if kill_ranges[w, 0, 0] >= MIN_1HS_RANGE:
         num_hs = 1
         title_suffix = "1 Incidental Headshot"
     else:
         num_hs = 2
         title_suffix = "2 Headshots"
     
-    # Calculate ranges for each ammo type
-    base_range = find_max_range(dmg_close, dmg_10m, dmg_75m, num_hs, 10, BASE_HS_MULT)
-    hp_range = find_max_range(dmg_close, dmg_10m, dmg_75m, num_hs, 10, HP_MULT)
-    synth_range = find_max_range(dmg_close, dmg_10m, dmg_75m, num_hs, 10, SYNTH_MULT) if ammo_type == 'Synthetic' else 0
+    # Ranges for each ammo type
+    base_range, hp_range, synth_range = (float(r) for r in kill_ranges[w, num_hs - 1])
+    if ammo_type != 'Synthetic':
+        synth_range = 0
     
     # Calculate percentage increases
     hp_increase = ((hp_range - base_range) / base_range * 100) if base_range > 0 else 0
@@ -1,112 +1,37 @@
 import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle
 import os
+from weapon_data import AMMO_TYPES_PATH, STK_CATEGORIES_PATH, load_falloff
+from render_cache import cached_render
+from ttk_engine import falloff_breakpoints, shot_combos, solve_kill_ranges
+from weapon_registry import canonical_names, is_flagged, lookup
 
 # Read data
-falloff_df = pd.read_csv('data/Battlefield 6 Damage Fall Off - V2.csv', skiprows=1)
-ammo_df = pd.read_csv('analysis_results/Weapon_Ammo_Types.csv')
-stk_df = pd.read_csv('analysis_results/STK_Categorization_One_Headshot.csv')
+falloff_df = load_falloff()
+ammo_df = pd.read_csv(AMMO_TYPES_PATH)
+stk_df = pd.read_csv(STK_CATEGORIES_PATH)
 
-# Clean up falloff data
-falloff_df = falloff_df.rename(columns={
-    'Gun (!!! -> Missing)': 'Gun',
-    'Dmg': 'DMG_Close',
-    '10m': 'DMG_10M',
-    '75m': 'DMG_75M',
-    'ROF': 'ROF'
-})
-
-# Name mapping for consistency
-name_mapping = {
-    'TR7': 'TR-7',
-    'M/60': 'M60',
-    'M240L': 'M240L',
-    'QBZ': 'QBZ-192',
-    'AK205': 'AK-205'
-}
-falloff_df['Gun'] = falloff_df['Gun'].replace(name_mapping)
+# Canonical gun names (resolves sheet aliases like 'TR7' -> 'TR-7')
+falloff_df['Gun'] = canonical_names(falloff_df['Gun'])
 
 # Merge dataframes
 df = falloff_df[['Gun', 'Type', 'DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF']].copy()
 
-# Convert to numeric and add extrapolated 100m damage
-df['DMG_Close'] = pd.to_numeric(df['DMG_Close'], errors='coerce')
-df['DMG_10M'] = pd.to_numeric(df['DMG_10M'], errors='coerce')
-df['DMG_75M'] = pd.to_numeric(df['DMG_75M'], errors='coerce')
-
-def extrapolate_damage_100m(dmg_10m, dmg_75m):
-    """Linearly extrapolate damage to 100m"""
-    damage_loss_per_meter = (dmg_10m - dmg_75m) / (75 - 10)
-    range_beyond_75 = 100 - 75
-    extrapolated_dmg = dmg_75m - (damage_loss_per_meter * range_beyond_75)
-    return max(extrapolated_dmg, 10)
-
-df['DMG_100M'] = df.apply(lambda row: extrapolate_damage_100m(row['DMG_10M'], row['DMG_75M']), axis=1)
-
-df = df.merge(ammo_df[['Gun', 'Ammo Type']], on='Gun', how='left')
+df['Ammo Type'] = lookup(ammo_df, df['Gun'], 'Ammo Type')
 
 # Merge with STK data
-stk_temp = stk_df[['Gun', 'STK at 20M']].copy()
-df = df.merge(stk_temp, on='Gun', how='left')
+df['STK at 20M'] = lookup(stk_df, df['Gun'], 'STK at 20M')
 
 df = df.dropna(subset=['DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF', 'Ammo Type', 'Type', 'STK at 20M'])
+df = df[~is_flagged(df['Gun'])].reset_index(drop=True)  # '!!!' rows in the falloff sheet have missing data
 
-# Constants
-BASE_HS_MULT = 1.34
-HP_MULT = 1.5
-SYNTH_MULT = 1.75
-TARGET_HP = 100
-
-def interpolate_max_range_100m(row, multiplier, num_hs, num_body):
-    """Interpolate to find exact range where N HS + M Body = 100 damage - EXACT COPY from working code"""
-    
-    dmg_close = row['DMG_Close']
-    dmg_10m = row['DMG_10M']
-    dmg_75m = row['DMG_75M']
-    dmg_100m = row['DMG_100M']
-    
-    if pd.isna(dmg_close) or pd.isna(dmg_10m) or pd.isna(dmg_75m) or pd.isna(dmg_100m):
-        return 0
-    
-    def calc_damage(hs_dmg, body_dmg):
-        return (hs_dmg * num_hs) + (body_dmg * num_body)
-    
-    ranges = [
-        (0, 10, dmg_close, dmg_10m),
-        (10, 75, dmg_10m, dmg_75m),
-        (75, 100, dmg_75m, dmg_100m)
-    ]
-    
-    max_range = 0
-    
-    for start_range, end_range, start_dmg, end_dmg in ranges:
-        hs_dmg_end = end_dmg * multiplier
-        total_dmg_end = calc_damage(hs_dmg_end, end_dmg)
-        
-        if total_dmg_end >= TARGET_HP:
-            max_range = end_range
-        else:
-            hs_dmg_start = start_dmg * multiplier
-            total_dmg_start = calc_damage(hs_dmg_start, start_dmg)
-            
-            if total_dmg_start >= TARGET_HP:
-                # Target is somewhere in this range, interpolate
-                for test_range in np.arange(start_range, end_range + 0.1, 0.1):
-                    ratio = (test_range - start_range) / (end_range - start_range)
-                    interpolated_dmg = start_dmg + (end_dmg - start_dmg) * ratio
-                    hs_dmg = interpolated_dmg * multiplier
-                    total_dmg = calc_damage(hs_dmg, interpolated_dmg)
-                    
-                    if total_dmg < TARGET_HP:
-                        max_range = max(0, test_range - 0.1)
-                        break
-                else:
-                    max_range = end_range
-                break
-    
-    return max_range
+# Kill range of every HS/body combination up to the largest STK with each ammo
+# multiplier, solved for all weapons at once (weapons x combos x base/HP/synth)
+combo_hs, combo_body = shot_combos(int(df['STK at 20M'].max()), min_shots=0)
+combo_index = {(hs, body): c for c, (hs, body) in enumerate(zip(combo_hs, combo_body))}
+breakpoints, damage = falloff_breakpoints(df['DMG_Close'], df['DMG_10M'], df['DMG_75M'], max_range=100)
+kill_ranges = solve_kill_ranges(breakpoints, damage, combo_hs, combo_body)
 
 def create_circle_plot(gun_name, weapon_class, row, ammo_type, num_hs, output_path):
     """Create a single circle plot for a weapon"""
@@ -119,10 +44,8 @@ def create_circle_plot(gun_name, weapon_class, row, ammo_type, num_hs, output_pa
         # Not enough shots for this many headshots
         return False
     
-    # Calculate ranges
-    base_range = interpolate_max_range_100m(row, BASE_HS_MULT, num_hs, num_body)
-    hp_range = interpolate_max_range_100m(row, HP_MULT, num_hs, num_body)
-    synth_range = interpolate_max_range_100m(row, SYNTH_MULT, num_hs, num_body)
+    # Look up ranges (row.name is the weapon's position in df)
+    base_range, hp_range, synth_range = kill_ranges[row.name, combo_index[(num_hs, num_body)]]
     
     # Calculate extensions
     hp_extension = hp_range - base_range
@@ -130,6 +53,17 @@ def create_circle_plot(gun_name, weapon_class, row, ammo_type, num_hs, output_pa
     hp_pct = (hp_extension / base_range * 100) if base_range > 0 else 0
     synth_pct = (synth_extension / base_range * 100) if base_range > 0 else 0
     
+    # Re-rendered only when the ranges, labels or plotting code changed
+    cached_render(draw_circle_plot, output_path, gun_name, weapon_class, ammo_type, num_hs,
+                  float(base_range), float(hp_range), float(synth_range),
+                  float(hp_pct), float(synth_pct), output_path)
+    
+    return True
+
+def draw_circle_plot(gun_name, weapon_class, ammo_type, num_hs, base_range, hp_range, synth_range,
+                     hp_pct, synth_pct, output_path):
+    """Draw the base/HP/synthetic range circles for one weapon to output_path"""
+    
     # Create plot
     fig, ax = plt.subplots(1, 1, figsize=(10, 10))
     
@@ -187,8 +121,6 @@ def create_circle_plot(gun_name, weapon_class, row, ammo_type, num_hs, output_pa
     plt.tight_layout()
     plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
     plt.close()
-    
-    return True
 
 # Create output directory
 os.makedirs('visualizations/INDIVIDUAL_WEAPONS', exist_ok=True)
@@ -0,0 +1,231 @@
+import argparse
+import os
+
+import pandas as pd
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.patches import Circle
+from weapon_data import AMMO_TYPES_PATH, STK_CATEGORIES_PATH, load_falloff
+from render_cache import cached_render
+from ttk_engine import TARGET_HP, falloff_breakpoints, solve_kill_ranges
+from weapon_registry import is_flagged, lookup
+
+# (shots to kill, headshots) combinations rendered by default
+DEFAULT_COMBOS = [(3, 1), (3, 2), (4, 1), (4, 2), (5, 1), (5, 2)]
+
+# Color scheme
+type_colors = {
+    'Assault Rifle': '#FF6B6B',
+    'Carbine': '#4ECDC4', 
+    'LMG': '#95E1D3',
+    'SMG': '#FFD93D'
+}
+
+def draw_range_circles(df_results, stk, num_hs, title_text, max_range, output_path):
+    """Draw the range circle grid for one STK/headshot combination to output_path"""
+    
+    num_weapons = len(df_results)
+    cols = 4 if stk >= 4 else 2
+    rows = (num_weapons + cols - 1) // cols
+    
+    fig, axes = plt.subplots(rows, cols, figsize=(20, 5*rows) if stk >= 4 else (16, 8*rows))
+    if rows == 1 and cols == 1:
+        axes = [axes]
+    elif rows == 1 or cols == 1:
+        axes = axes.flatten() if hasattr(axes, 'flatten') else [axes]
+    else:
+        axes = axes.flatten()
+    
+    for idx, (ax, row_tuple) in enumerate(zip(axes, df_results.iterrows())):
+        if idx >= num_weapons:
+            ax.axis('off')
+            continue
+        
+        _, data = row_tuple
+        gun = data['Gun']
+        weapon_type = data['Type']
+        ammo_type = data['Ammo Type']
+        base_range = data['Base Range (1.34x)']
+        hp_range = data['HP Range (1.5x)']
+        synth_range = data['Synthetic Range (1.75x)']
+        
+        # Draw circles from bottom to top: Synthetic (bottom), HP, Base, then center dot (top)
+        # Larger circles more transparent, smaller circles less transparent
+        # Using desaturated colors for better visual clarity
+        # Only show Synthetic if the weapon has access to it
+        if synth_range > 0 and ammo_type == 'Synthetic':
+            circle_synth = Circle((0, 0), synth_range,
+                                 facecolor='#B8A0D0',  # Desaturated purple
+                                 alpha=0.3, linewidth=1.5, edgecolor='#9B7FB8',
+                                 linestyle='-',
+                                 label=f'Synthetic (1.75x): {synth_range:.1f}m',
+                                 zorder=1)
+            ax.add_patch(circle_synth)
+        
+        # Always show HP (all guns have access to HP)
+        if hp_range > 0:
+            circle_hp = Circle((0, 0), hp_range,
+                              facecolor='#E0A870',  # Desaturated orange
+                              alpha=0.5, linewidth=1.5, edgecolor='#C89050',
+                              label=f'Hollow Point (1.5x): {hp_range:.1f}m',
+                              zorder=2)
+            ax.add_patch(circle_hp)
+        
+        if base_range > 0:
+            circle_base = Circle((0, 0), base_range,
+                                facecolor='#A0A0A0',  # Slightly lighter gray
+                                alpha=0.7, linewidth=1.5, edgecolor='#606060',
+                                label=f'Base (1.34x): {base_range:.1f}m',
+                                zorder=3)
+            ax.add_patch(circle_base)
+        
+        # Center dot on top with smaller size (50% smaller: 10 -> 5)
+        ax.plot(0, 0, 'ko', markersize=5, zorder=100)
+        
+        ax.set_xlim(-max_range*1.2, max_range*1.2)
+        ax.set_ylim(-max_range*1.2, max_range*1.2)
+        ax.set_aspect('equal')
+        
+        ax.grid(True, alpha=0.3, linestyle='--')
+        ax.set_xlabel('Distance (m)', fontsize=10)
+        ax.set_ylabel('Distance (m)', fontsize=10)
+        
+        # Calculate percentage increases
+        hp_pct = (data['HP Extension'] / base_range * 100) if base_range > 0 else 0
+        synth_pct = (data['Synth Extension'] / base_range * 100) if base_range > 0 else 0
+        
+        title = f"{gun} ({weapon_type})\n{ammo_type}\n"
+        title += f"HP: +{data['HP Extension']:.1f}m ({hp_pct:.1f}%)"
+        if ammo_type == 'Synthetic':
+            title += f"\nSynth: +{data['Synth Extension']:.1f}m ({synth_pct:.1f}%)"
+        
+        ax.set_title(title, fontsize=11, fontweight='bold',
+                    color=type_colors.get(weapon_type, 'black'), pad=10)
+        
+        if base_range > 0 or hp_range > 0 or synth_range > 0:
+            ax.legend(loc='upper right', fontsize=8, framealpha=0.95)
+    
+    for idx in range(num_weapons, len(axes)):
+        axes[idx].axis('off')
+    
+    # Update title text for 1HS scenarios
+    if num_hs == 1:
+        title_text = title_text.replace('1 Headshot', '1 Incidental Headshot')
+    
+    plt.suptitle(f'{title_text}\n' +
+                 'Circle radius = Maximum effective range',
+                 fontsize=16, fontweight='bold', y=0.995)
+    
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+def combo_title(stk, num_hs):
+    """e.g. '4-Shot Kill: 2 Headshots + 2 Body Shots'"""
+    num_body = stk - num_hs
+    return (f"{stk}-Shot Kill: {num_hs} Headshot{'s' if num_hs > 1 else ''} + "
+            f"{num_body} Body Shot{'s' if num_body > 1 else ''}")
+
+def load_weapons():
+    """Falloff data joined with ammo type and STK (loaded once for every combo)"""
+    falloff_df = load_falloff()
+    ammo_df = pd.read_csv(AMMO_TYPES_PATH)
+    stk_df = pd.read_csv(STK_CATEGORIES_PATH)
+    
+    # Join on weapon ID (falloff and DPS sheets spell some guns differently)
+    df = falloff_df.copy()
+    df['STK at 20M'] = lookup(stk_df, df['Gun'], 'STK at 20M')
+    df = df[df['STK at 20M'].notna() & ~is_flagged(df['Gun'])].reset_index(drop=True)  # Remove M250 (missing data)
+    df['Ammo Type'] = lookup(ammo_df, df['Gun'], 'Ammo Type')
+    return df
+
+def solve_combos(df, combos, max_range=100, target_hp=TARGET_HP):
+    """Kill ranges of every weapon for every combo in one pass: (weapons, combos, base/HP/synth)"""
+    num_hs = [hs for _, hs in combos]
+    num_body = [stk - hs for stk, hs in combos]
+    breakpoints, damage = falloff_breakpoints(df['DMG_Close'], df['DMG_10M'], df['DMG_75M'], max_range=max_range)
+    return solve_kill_ranges(breakpoints, damage, num_hs, num_body, target_hp=target_hp)
+
+def combo_results(df, kill_ranges, stk):
+    """Per-weapon range table for the weapons that kill in `stk` shots"""
+    rows = np.flatnonzero(df['STK at 20M'].to_numpy() == stk)
+    ranges = kill_ranges[rows]
+    base_range, hp_range, synth_range = ranges[:, 0], ranges[:, 1], ranges[:, 2]
+    return pd.DataFrame({
+        'Gun': df['Gun'].to_numpy()[rows],
+        'Type': df['Type'].to_numpy()[rows],
+        'Ammo Type': df['Ammo Type'].to_numpy()[rows],
+        'Base Range (1.34x)': base_range,
+        'HP Range (1.5x)': hp_range,
+        'Synthetic Range (1.75x)': synth_range,
+        'HP Extension': hp_range - base_range,
+        'Synth Extension': synth_range - base_range
+    })
+
+def create_visualizations(combos=DEFAULT_COMBOS, max_range=100, target_hp=TARGET_HP):
+    """Load the data once, solve every combo in one batch, then write each combo's CSV and figure
+
+    Weapons are grouped by their 100 HP STK at 20m; target_hp only changes
+    the kill ranges (other targets get an '_<hp>HP' file suffix).
+    """
+    df = load_weapons()
+    kill_ranges = solve_combos(df, combos, max_range, target_hp)
+    hp_suffix = '' if target_hp == TARGET_HP else f'_{target_hp}HP'
+    
+    os.makedirs('visualizations/BY_BTK', exist_ok=True)
+    for c, (stk, num_hs) in enumerate(combos):
+        num_body = stk - num_hs
+        suffix = f'{num_hs}HS'
+        df_results = combo_results(df, kill_ranges[:, c], stk)
+        
+        if len(df_results) == 0:
+            print(f"No weapons found for {stk}-shot kill")
+            continue
+        
+        print(f"\n{stk}-Shot Kill Weapons ({num_hs} HS + {num_body} Body): {len(df_results)}")
+        print("="*80)
+        for _, row in df_results.iterrows():
+            base_range, hp_range, synth_range = row['Base Range (1.34x)'], row['HP Range (1.5x)'], row['Synthetic Range (1.75x)']
+            print(f"{row['Gun']:15} ({row['Type']:13}) | {row['Ammo Type']:13} | "
+                  f"Base: {base_range:.1f}m | HP: {hp_range:.1f}m (+{hp_range-base_range:.1f}m) | "
+                  f"Synth: {synth_range:.1f}m (+{synth_range-base_range:.1f}m)")
+        
+        csv_path = f'analysis_results/{stk}Shot_{suffix}_Range_Analysis_{max_range}m{hp_suffix}.csv'
+        df_results.to_csv(csv_path, index=False)
+        
+        # Re-rendered only when the results, titles or plotting code changed
+        output_path = f'visualizations/BY_BTK/{stk}Shot_{suffix}_Range_Circles_{max_range}m{hp_suffix}.png'
+        title = combo_title(stk, num_hs) + ('' if target_hp == TARGET_HP else f' ({target_hp} HP Target)')
+        rendered = cached_render(draw_range_circles, output_path, df_results, stk, num_hs,
+                                 title, max_range, output_path)
+        print(f"\n{'='*80}")
+        print(f"{'Saved' if rendered else 'Unchanged'}: {output_path}")
+        print(f"Saved: {csv_path}")
+        print("="*80)
+
+def parse_combo(text):
+    """'4:2' -> (4, 2): shots to kill and how many of them are headshots"""
+    stk, num_hs = (int(part) for part in text.split(':'))
+    if stk < 1:
+        raise argparse.ArgumentTypeError(f"{text}: a kill takes at least 1 shot")
+    if not 0 <= num_hs <= stk:
+        raise argparse.ArgumentTypeError(f"{text}: headshots must be between 0 and {stk}")
+    return stk, num_hs
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Range circle grids for shot combinations (e.g. 4:2 = 4-shot kill with 2 headshots)')
+    parser.add_argument('combos', nargs='*', type=parse_combo, default=DEFAULT_COMBOS,
+                        help='STK:HEADSHOTS combinations (default: 3-5 shot kills with 1 and 2 headshots)')
+    parser.add_argument('--max-range', type=int, default=100, choices=[75, 100],
+                        help='Extrapolate falloff to 100m (default) or stop at the last measured 75m point')
+    parser.add_argument('--hp', type=int, default=TARGET_HP,
+                        help=f'Target HP (default: {TARGET_HP}; other values add an _<hp>HP file suffix)')
+    args = parser.parse_args()
+    if args.hp < 1:
+        parser.error('--hp must be at least 1')
+    
+    create_visualizations(args.combos, args.max_range, args.hp)
+    
+    print("\n" + "="*80)
+    print("ALL SHOT COMBINATION VISUALIZATIONS COMPLETE!")
+    print("="*80)
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import pickle
+import shutil
+
+import pandas as pd
+
+from stage_trace import span
+
+DATA_DIR = 'data'
+RESULTS_DIR = 'analysis_results'
+CACHE_DIR = '.cache/weapon_data'
+SNAPSHOT_VERSION = 2  # Bump when the parsing/cleanup below or the snapshot format changes
+SNAPSHOT_FILE = 'tables.pkl'
+
+# Source sheets: table name -> (file name, read_csv kwargs)
+SOURCES = {
+    'falloff': ('Battlefield 6 Damage Fall Off - V2.csv', {'skiprows': 1}),
+    'weapon_type': ('BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - All Guns by Weapon Type.csv', {}),
+    'stat_card': ('BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - Stat Card Values.csv', {}),
+    'headshot_10m': ('BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - All Guns by 10M Headshot Only TTK.csv', {}),
+    'body_20m': ('BF6 DPS Chart v2.1 _SEASON 1 UPDATES_.xlsx - All Guns by 20M Body TTK.csv', {}),
+}
+
+# Column cleanup shared by every script that reads the falloff sheet
+FALLOFF_COLUMNS = {
+    'Gun (!!! -> Missing)': 'Gun',
+    'Dmg': 'DMG_Close',
+    '10m': 'DMG_10M',
+    '75m': 'DMG_75M'
+}
+
+# Columns the scripts treat as numbers (coerced once here, bad cells -> NaN)
+NUMERIC_COLUMNS = ['DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF', 'Velocity',
+                   'DMG', 'DMG at 10M', 'DMG at 20M', 'DMG at 35M', 'Syn/HP']
+
+# Derived tables written by extract_ammo_types.py / categorize_stk_with_one_headshot.py
+AMMO_TYPES_PATH = os.path.join(RESULTS_DIR, 'Weapon_Ammo_Types.csv')
+STK_CATEGORIES_PATH = os.path.join(RESULTS_DIR, 'STK_Categorization_One_Headshot.csv')
+
+_tables = None
+
+
+def source_paths():
+    """Paths of the raw CSV exports, keyed by table name"""
+    return {name: os.path.join(DATA_DIR, file_name) for name, (file_name, _) in SOURCES.items()}
+
+
+def source_hash():
+    """Hash of every source CSV's content (plus the snapshot version)"""
+    digest = hashlib.sha256(f'v{SNAPSHOT_VERSION}'.encode())
+    for name, path in sorted(source_paths().items()):
+        digest.update(name.encode())
+        with open(path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:16]
+
+
+def parse_csv(name):
+    """Parse one source sheet from CSV and apply the shared cleanup"""
+    file_name, read_kwargs = SOURCES[name]
+    df = pd.read_csv(os.path.join(DATA_DIR, file_name), **read_kwargs)
+    if name == 'falloff':
+        df = df.rename(columns=FALLOFF_COLUMNS)
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def _write_snapshot(tables, snapshot_dir):
+    """Pickle every parsed table into one file (written to a temp dir, then swapped in)"""
+    tmp_dir = snapshot_dir + '.tmp'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    with open(os.path.join(tmp_dir, SNAPSHOT_FILE), 'wb') as f:
+        pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+    shutil.rmtree(snapshot_dir, ignore_errors=True)
+    os.replace(tmp_dir, snapshot_dir)
+
+
+def _read_snapshot(snapshot_dir):
+    """Tables written by _write_snapshot, exactly as parse_csv returned them"""
+    with open(os.path.join(snapshot_dir, SNAPSHOT_FILE), 'rb') as f:
+        return pickle.load(f)
+
+
+def load_tables(use_cache=True):
+    """Load all five source sheets, parsing the CSVs only when they changed
+
+    The first run parses every CSV and writes a snapshot to
+    .cache/weapon_data/<source hash>/. Later runs unpickle that snapshot
+    (one file, faster than parsing the CSVs), and repeated calls in the
+    same process reuse the loaded tables.
+    """
+    global _tables
+    if _tables is not None and use_cache:
+        return _tables
+
+    snapshot_dir = os.path.join(CACHE_DIR, source_hash())
+    if use_cache and os.path.exists(os.path.join(snapshot_dir, SNAPSHOT_FILE)):
+        with span('read_snapshot', 'load'):
+            _tables = _read_snapshot(snapshot_dir)
+        return _tables
+
+    with span('parse_csvs', 'load'):
+        tables = {name: parse_csv(name) for name in SOURCES}
+    if use_cache:
+        with span('write_snapshot', 'load'):
+            _write_snapshot(tables, snapshot_dir)
+        # Drop snapshots of older versions of the data
+        for entry in os.listdir(CACHE_DIR):
+            if entry != os.path.basename(snapshot_dir):
+                shutil.rmtree(os.path.join(CACHE_DIR, entry), ignore_errors=True)
+    _tables = tables
+    return tables
+
+
+def load_falloff():
+    """Damage falloff sheet with Gun/DMG_Close/DMG_10M/DMG_75M columns"""
+    return load_tables()['falloff'].copy()
+
+
+def load_weapon_types():
+    """DPS chart 'All Guns by Weapon Type' sheet"""
+    return load_tables()['weapon_type'].copy()
+
+
+def load_stat_cards():
+    """DPS chart 'Stat Card Values' sheet"""
+    return load_tables()['stat_card'].copy()
+
+
+def load_headshot_10m():
+    """DPS chart 'All Guns by 10M Headshot Only TTK' sheet"""
+    return load_tables()['headshot_10m'].copy()
+
+
+def load_body_20m():
+    """DPS chart 'All Guns by 20M Body TTK' sheet"""
+    return load_tables()['body_20m'].copy()
@@ -0,0 +1,148 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from weapon_data import AMMO_TYPES_PATH, load_falloff, load_tables
+
+# Aliases that normalization alone can't resolve (alias -> canonical name)
+EXTRA_ALIASES = {
+    'QBZ': 'QBZ-192',
+}
+
+# Preferred display name when sheets spell a gun differently (falloff sheet spelling)
+CANONICAL_NAMES = ['TR-7', 'M60', 'QBZ-192', 'AK-205', 'M417A2', 'M250']
+
+# Falloff sheet marks guns with missing data with '!!!'
+MISSING_MARKER = '!!!'
+
+# Summary rows at the bottom of the falloff sheet, not weapons
+SUMMARY_ROWS = ['MIN', 'MAX', 'AVG']
+
+# Ammo types in TTK cube multiplier order (see ttk_engine.AMMO_MULTS)
+AMMO_LABELS = ['Base', 'HP', 'Synth']
+
+_registry = None
+
+
+def normalize(name):
+    """Spelling-insensitive key: 'TR7', 'TR-7' and 'tr 7' all become 'TR7'"""
+    name = str(name).replace(MISSING_MARKER, '')
+    return re.sub(r'[^A-Z0-9.]', '', name.upper())
+
+
+def _build():
+    """Assign an integer ID to every gun seen in the source sheets"""
+    canonical_by_key = {normalize(n): n for n in CANONICAL_NAMES}
+    for alias, canonical in EXTRA_ALIASES.items():
+        canonical_by_key[normalize(alias)] = canonical
+    flagged = set()
+
+    for df in load_tables().values():
+        for name in df['Gun'].dropna():
+            if name in SUMMARY_ROWS:
+                continue
+            key = normalize(name)
+            canonical_by_key.setdefault(key, str(name).replace(MISSING_MARKER, '').strip())
+            if MISSING_MARKER in str(name):
+                flagged.add(canonical_by_key[key])
+
+    names = sorted(set(canonical_by_key.values()))
+    ids = {name: i for i, name in enumerate(names)}
+    id_by_key = {key: ids[canonical] for key, canonical in canonical_by_key.items()}
+    return {'names': np.array(names, dtype=object), 'id_by_key': id_by_key, 'flagged': flagged}
+
+
+def registry():
+    """Registry built once per process"""
+    global _registry
+    if _registry is None:
+        _registry = _build()
+    return _registry
+
+
+def weapon_ids(names):
+    """Integer weapon ID for each name or alias (-1 if unknown)"""
+    id_by_key = registry()['id_by_key']
+    return np.array([id_by_key.get(normalize(n), -1) if pd.notna(n) else -1 for n in names],
+                    dtype=np.int64)
+
+
+def canonical_names(names):
+    """Canonical name for each name or alias (unknown names are passed through)"""
+    ids = weapon_ids(names)
+    return [registry()['names'][i] if i >= 0 else n for i, n in zip(ids, names)]
+
+
+def is_flagged(names):
+    """True for guns the falloff sheet marks as missing data ('!!!')"""
+    flagged = registry()['flagged']
+    return np.array([n in flagged for n in canonical_names(names)], dtype=bool)
+
+
+def isin(names, other_names):
+    """Like Series.isin, but matched on weapon ID so alias spellings line up"""
+    other_ids = weapon_ids(other_names)
+    return np.isin(weapon_ids(names), other_ids[other_ids >= 0])
+
+
+def row_index(df, column='Gun'):
+    """Array mapping weapon ID -> row position in df (-1 where the gun is absent)"""
+    index = np.full(len(registry()['names']), -1, dtype=np.int64)
+    # np.unique returns the first row for each ID, like a left merge on 'Gun' would
+    ids, first_rows = np.unique(weapon_ids(df[column]), return_index=True)
+    known = ids >= 0
+    index[ids[known]] = first_rows[known]
+    return index
+
+
+def lookup(df, names, column, key_column='Gun'):
+    """Values of df[column] for each name, joined on weapon ID instead of string merges"""
+    ids = weapon_ids(names)
+    rows = np.where(ids >= 0, row_index(df, key_column)[ids], -1)
+    if len(df) == 0:
+        return np.full(len(rows), np.nan)
+    values = df[column].iloc[np.maximum(rows, 0)].reset_index(drop=True)
+    return values.where(pd.Series(rows >= 0)).to_numpy()
+
+
+def unmatched(names):
+    """Names that don't resolve to any known weapon (new aliases to add above)"""
+    return [n for n, i in zip(names, weapon_ids(names)) if i < 0 and n not in SUMMARY_ROWS]
+
+
+def ttk_weapons(ammo_path=AMMO_TYPES_PATH):
+    """Falloff data joined with each gun's ammo type: the table the TTK analyses rank
+
+    Canonical gun names, only guns with complete falloff and ammo data,
+    and no '!!!' rows (missing data in the falloff sheet).
+    """
+    falloff_df = load_falloff()
+    ammo_df = pd.read_csv(ammo_path)
+
+    # Canonical gun names (resolves sheet aliases like 'TR7' -> 'TR-7')
+    falloff_df['Gun'] = canonical_names(falloff_df['Gun'])
+
+    df = falloff_df[['Gun', 'Type', 'DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF', 'Velocity']].copy()
+    df['Ammo Type'] = lookup(ammo_df, df['Gun'], 'Ammo Type')
+
+    # Filter out weapons without complete data
+    df = df.dropna(subset=['DMG_Close', 'DMG_10M', 'DMG_75M', 'ROF', 'Ammo Type', 'Type'])
+    return df[~is_flagged(df['Gun'])]
+
+
+def loadouts(df):
+    """One row per weapon and ammo type it can use (Synth only for Synthetic guns)
+
+    df is a ttk_weapons() table with a fresh index. 'Weapon' is the row
+    position in df and 'Mult' the ammo multiplier index.
+    """
+    num_ammo = np.where(df['Ammo Type'].to_numpy() == 'Synthetic', 3, 2)
+    weapon = np.repeat(np.arange(len(df)), num_ammo)
+    # Position within each weapon's run of rows: 0, 1(, 2)
+    mult = np.arange(len(weapon)) - np.repeat(np.cumsum(num_ammo) - num_ammo, num_ammo)
+    gun = df['Gun'].to_numpy(dtype=object)[weapon]
+    ammo = np.array(AMMO_LABELS, dtype=object)[mult]
+    return pd.DataFrame({'Loadout': gun + ' (' + ammo + ')', 'Gun': gun,
+                         'Type': df['Type'].to_numpy(dtype=object)[weapon], 'Ammo': ammo,
+                         'Weapon': weapon, 'Mult': mult})